@@ -1,1295 +1,3991 @@
-import streamlit as st
-import google.generativeai as genai
-from google.api_core import exceptions
-import tempfile
-import time
-import os
-import json
-import asyncio
-import edge_tts
-from st_audiorec import st_audiorec  
-from youtube_transcript_api import YouTubeTranscriptApi
-import yt_dlp
-import random
-from PIL import Image
-import requests
-import PyPDF2
-
-# ==========================================
-# 💾 Memory Vault (မှတ်ဉာဏ်တိုက်)
-# ==========================================
-VAULT_FILE = "muse_memory.json"
-
-def load_vault():
-    if os.path.exists(VAULT_FILE):
-        with open(VAULT_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return []
-
-def save_to_vault(title, content, type_tag):
-    data = load_vault()
-    data.append({"title": title, "content": content, "type": type_tag})
-    with open(VAULT_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
-
-# ==========================================
-# 🚀 1. SYSTEM CONFIGURATION
-# ==========================================
-st.set_page_config(page_title="Universal Studio AI", page_icon="🎬", layout="wide")
-
-# ==========================================
-# 🛠️ 2. CORE HELPER FUNCTIONS
-# ==========================================
-
-# 💡 Smart YouTube Data Extractor
-def fetch_youtube_smart_data(url):
-    if "v=" in url: video_id = url.split("v=")[-1].split("&")[0]
-    elif "youtu.be/" in url: video_id = url.split("youtu.be/")[-1].split("?")[0]
-    else: video_id = url.split("/")[-1]
-        
-    data_collected = ""
-    try:
-        ydl_opts = {'quiet': True, 'skip_download': True, 'extract_flat': True}
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            title = info.get('title', 'Unknown Title')
-            desc = info.get('description', '')
-            data_collected += f"🎬 ဗီဒီယို ခေါင်းစဉ်: {title}\n📝 အကြောင်းအရာ: {desc}\n\n"
-    except: pass 
-        
-    try:
-        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-        try: transcript = transcript_list.find_transcript(['my', 'en']).fetch()
-        except:
-            for t in transcript_list:
-                transcript = t.fetch()
-                break
-        subs = ""
-        for i in transcript:
-            start_time = i['start']
-            mins = int(start_time // 60)
-            secs = int(start_time % 60)
-            subs += f"[{mins:02d}:{secs:02d}] {i['text']}\n"
-        data_collected += f"💬 ဗီဒီယိုတွင်း စကားပြောများ:\n{subs}"
-    except:
-        data_collected += "⚠️ (ဤဗီဒီယိုတွင် စာတန်းထိုး မပါဝင်ပါ။)"
-        
-    if len(data_collected) < 10:
-        raise Exception("ဗီဒီယိုကို ဖတ်၍မရပါ။ လင့်ခ်မှန်ကန်မှု စစ်ဆေးပါ။")
-    return data_collected
-
-def generate_content_safe(prompt, media_file=None):
-    models_to_try = ["models/gemini-2.5-flash", "models/gemini-2.5-pro", "models/gemini-2.0-flash", "models/gemini-flash-latest"]
-    errors = []
-    for m in models_to_try:
-        try:
-            model = genai.GenerativeModel(m)
-            cfg = {"temperature": 0.7, "max_output_tokens": 8192}
-            if media_file: return model.generate_content([media_file, prompt], generation_config=cfg).text
-            return model.generate_content(prompt, generation_config=cfg).text
-        except Exception as e:
-            errors.append(f"{m}: {str(e)}")
-            continue 
-    return f"⚠️ Error: All models failed. Check API Key.\nLogs: {errors[0]}"
-
-# 💡 Reddit Auto Fetcher (FIXED User-Agent to bypass 403)
-def fetch_reddit_story(subreddit):
-    try:
-        url = f"https://www.reddit.com/{subreddit}/top.json?limit=1&t=day"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            post = data['data']['children'][0]['data']
-            return f"Title: {post.get('title', 'Unknown')}\n\nContent:\n{post.get('selftext', 'No text content found.')}"
-        else:
-            return f"Error: Reddit လုံခြုံရေးစနစ်မှ ပိတ်ထားပါသည် (Status: {response.status_code})။ Website သို့ တိုက်ရိုက်သွား၍ Copy ကူးပြီး အောက်ပါ Text Box တွင် ထည့်ပါ။"
-    except Exception as e:
-        return f"Error connecting to Reddit: {e}"
-
-# 💡 Wikipedia Auto Fetcher (FIXED API Format & User-Agent)
-def fetch_wikipedia_summary(query):
-    try:
-        url = f"https://en.wikipedia.org/w/api.php?action=query&prop=extracts&exintro&titles={query}&format=json&explaintext=1"
-        headers = {'User-Agent': 'UniversalStudioAI/1.0 (contact@example.com)'}
-        response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            pages = data['query']['pages']
-            for page_id in pages:
-                if page_id == "-1": return "Error: ဤအကြောင်းအရာအတွက် Wikipedia တွင် မတွေ့ရှိပါ။"
-                return pages[page_id].get('extract', 'စာသား ရှာမတွေ့ပါ။')
-        else:
-            return "Error: Wikipedia ဆာဗာမှ ပြန်လည်တုံ့ပြန်မှု မရှိပါ။"
-    except Exception as e:
-        return f"Error fetching Wikipedia: {e}"
-
-# 💡 PDF Extractor
-def extract_text_from_pdf(pdf_file):
-    try:
-        reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
-        return text[:30000] # Limit tokens
-    except Exception as e:
-        return f"Error extracting PDF: {e}"
-
-# ==========================================
-# 🧭 3. SIDEBAR & MENU
-# ==========================================
-with st.sidebar:
-    st.header("🔑 Master Key")
-    api_key = st.text_input("Gemini API Key", type="password")
-    if api_key:
-        genai.configure(api_key=api_key)
-        if st.button("📡 Check System"):
-            try:
-                list(genai.list_models())
-                st.success("✅ Gemini Online!")
-            except: st.error("❌ Invalid Key")
-            
-    st.write("---")
-    st.header("🧭 Menu")
-    selected_menu = st.radio("သွားလိုသော နေရာကို ရွေးပါ:", [
-        "💡 Idea to Script", 
-        "📂 Video to Script", 
-        "🎵 Audio to Script", 
-        "🔴 YouTube Master", 
-        "🦁 Smart Translator", 
-        "🎙️ Audio Studio",
-        "👁️ Vision Studio",  
-        "🎬 Director's Desk", 
-        "📚 Epic Series Maker", 
-        "📖 Magazine Studio",  # 👈 ဒီနေရာလေးမှာ အသစ်ဝင်လာပါပြီ
-        "📚 မှတ်ဉာဏ်တိုက်", 
-        "🕵️‍♂️ Lore Hunter", 
-        "🎨 Visual Director"
-    ])
-
-# ==========================================
-# 🎬 4. MAIN INTERFACES
-# ==========================================
-st.title("🎬 Universal Studio AI")
-st.caption("Scripting • Research • Translation • Audio • Vision • Series Making")
-
-# --- TAB 1: IDEA TO SCRIPT HUB ---
-if selected_menu == "💡 Idea to Script":
-    st.header("💡 Idea to Script Hub")
-    mm_tab, eng_tab = st.tabs(["🇲🇲 MM Social Media", "🇺🇸 English Creative Studio"])
-
-    # ==========================================
-    # 🇲🇲 MYANMAR TAB (Social Media Scriptwriter)
-    # ==========================================
-    with mm_tab:
-        st.subheader("📱 MM Social Media")
-        
-        if 'mm_outline_text' not in st.session_state: st.session_state.mm_outline_text = ""
-        if 'mm_final_script' not in st.session_state: st.session_state.mm_final_script = ""
-
-        # 💡 "Surprise Me" အတွက် Session State မှတ်ဉာဏ်
-        if "current_mm_topic" not in st.session_state:
-            st.session_state.current_mm_topic = ""
-
-        st.subheader("📝 Topic")
-        col_topic, col_dice = st.columns([4, 1])
-
-        with col_topic:
-            # 💡 အသစ်ထပ်တိုး - ဇာတ်လမ်းအရှည်ကြီးတွေပါ ထည့်လို့ရအောင် text_area သို့ ပြောင်းထားသည်
-            mm_topic = st.text_area("Topic Input", value=st.session_state.current_mm_topic, height=100, placeholder="ဥပမာ - အချိန်ခရီးသွားတဲ့ ကော်ဖီဆိုင်လေး (သို့) ဇာတ်လမ်းအကြမ်း အစအဆုံး ကူးထည့်ပါ...", label_visibility="collapsed")
-
-        with col_dice:
-            # 🎲 Surprise Me ခလုတ်
-            if st.button("🎲 Surprise Me!", use_container_width=True):
-                awesome_ideas = [
-                    "လူသားတွေရဲ့ အရိပ်တွေကို ဝယ်ယူတဲ့ လျှို့ဝှက်ဈေးဆိုင်",
-                    "မိုးစက်တွေနဲ့အတူ ပါသွားတဲ့ လွမ်းသူ့စာ",
-                    "၁၀ နှစ်ကျော် ပျောက်ဆုံးနေတဲ့ တောတွင်းက ရွာလေးတစ်ရွာ",
-                    "ကမ္ဘာကြီး ရပ်တန့်သွားတဲ့ ၅ စက္ကန့်အတွင်း ဖြစ်ပျက်ခဲ့တာတွေ",
-                    "ဘဝမှာ အရှုံးပေးချင်စိတ်ပေါက်နေတဲ့သူအတွက် ခွန်အားပေးစာ",
-                    "နဂါးတွေ ရှင်သန်နေဆဲဖြစ်တဲ့ မြေအောက်ကမ္ဘာ",
-                    "ကြောင်လေးတွေ ကမ္ဘာကို အုပ်စိုးသွားတဲ့နေ့",
-                    "မှန်ထဲက ကမ္ဘာနဲ့ အပြင်ကမ္ဘာ လဲလှယ်ခံလိုက်ရတဲ့ ကောင်လေး",
-                    "ညသန်းခေါင် ရေဒီယိုကနေ လာတဲ့ ထူးဆန်းတဲ့ အကူအညီတောင်းသံ",
-                    "လမင်းကို ချစ်မိသွားတဲ့ ပန်းနုရောင် တိမ်တိုက်လေး",
-                    "အချိန်တွေ ရပ်တန့်သွားတဲ့ ဆောင်းရာသီ ညတစ်ည",
-                    "ကိုယ့်ကိုယ်ကိုယ် ပြန်လည်ရှာဖွေတွေ့ရှိခြင်း အကြောင်း",
-                    "လူသားတွေ အကုန်လုံး အိပ်မက်တစ်ခုတည်း မက်တဲ့ ရုပ်ရှင်"
-                ]
-                import random
-                st.session_state.current_mm_topic = random.choice(awesome_ideas)
-                st.rerun() 
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1: 
-            # 💡 Seamless Loop ကို Platform မှာ ထပ်တိုးထားသည်
-            mm_platform = st.selectbox("📱 Platform", ["Facebook Video", "TikTok / Reels", "🔄 Seamless Loop Reel (၃၀ စက္ကန့်)", "YouTube Video", "Voiceover Only"], key="mm_plat")
-        with col2: 
-            mm_tone = st.selectbox("🎭 Tone / အမျိုးအစား", [
-                "💖 Soulful / Inspirational",
-                "🎬 Recap / Summary",
-                "🕵️‍♂️ True Crime / Mystery",
-                "📜 Epic Myth / Lore",
-                "🎧 Late Night ASMR / Calm",
-                "👻 Gothic / Midnight Tale",
-                "🥀 Gothic Poetry",
-                "😏 Sarcastic / Satirical",
-                "😂 Funny / Humorous",
-                "👔 Professional / Educational",
-                "📱 Casual / Vlog"
-            ], key="mm_tone")
-        with col3: 
-            mm_audience = st.selectbox("🎯 Audience", ["General Audience", "Youth / Gen Z", "Middle-aged Adults"], key="mm_aud")
-        with col4: 
-            mm_pov = st.selectbox("🗣️ ရှုထောင့် (POV)", ["Third-Person", "First-Person", "Dialogue"], key="mm_pov")
-
-        st.write("---")
-        
-        # 💡 ခလုတ်နာမည်များနှင့် Keyword များ သတ်မှတ်ခြင်း
-        if "Poetry" in mm_tone:
-            out_btn_text = "✨ ဒီ Outline အတိုင်း ကဗျာပုံစံ ရေးပါ"
-            direct_btn_text = "🚀 ကဗျာ တန်းရေးရန် (Direct Poem)"
-            type_keyword = "GOTHIC POEM (စကားပြေကဗျာ)"
-            success_msg = "✅ ကဗျာ ရေးသားပြီးပါပြီ!"
-        elif "Soulful" in mm_tone:
-            out_btn_text = "✨ ဒီ Outline အတိုင်း ရသစာတို ရေးပါ"
-            direct_btn_text = "🚀 ရသစာတို တန်းရေးရန် (Direct Story)"
-            type_keyword = "INSPIRATIONAL SHORT STORY (နှလုံးသားခွန်အားပေး ရသစာတို)"
-            success_msg = "✅ ရသစာတို ရေးသားပြီးပါပြီ!"
-        elif "Recap" in mm_tone:
-            out_btn_text = "✨ ဒီ Outline အတိုင်း အနှစ်ချုပ် ဇာတ်ညွှန်းရေးပါ"
-            direct_btn_text = "🚀 အနှစ်ချုပ် တန်းရေးရန် (Direct Recap)"
-            type_keyword = "MOVIE/BOOK RECAP SCRIPT (ရုပ်ရှင်/စာအုပ် အနှစ်ချုပ် ဇာတ်ညွှန်း)"
-            success_msg = "✅ အနှစ်ချုပ် ဇာတ်ညွှန်း ရေးသားပြီးပါပြီ!"
-        elif "True Crime" in mm_tone:
-            out_btn_text = "✨ ဒီ Outline အတိုင်း မှုခင်းဇာတ်ကြောင်း ရေးပါ"
-            direct_btn_text = "🚀 မှုခင်းဇာတ်ကြောင်း တန်းရေးရန် (Direct True Crime)"
-            type_keyword = "TRUE CRIME / MYSTERY SCRIPT (မှုခင်း/လျှို့ဝှက်ဆန်းကြယ် ဇာတ်ညွှန်း)"
-            success_msg = "✅ မှုခင်း ဇာတ်ညွှန်း ရေးသားပြီးပါပြီ!"
-        elif "Epic Myth" in mm_tone:
-            out_btn_text = "✨ ဒီ Outline အတိုင်း ဒဏ္ဍာရီဇာတ်ကြောင်း ရေးပါ"
-            direct_btn_text = "🚀 ဒဏ္ဍာရီ တန်းရေးရန် (Direct Lore)"
-            type_keyword = "EPIC MYTH / HISTORICAL LORE (သမိုင်း/ဒဏ္ဍာရီ ဇာတ်ကြောင်း)"
-            success_msg = "✅ ဒဏ္ဍာရီ ဇာတ်ညွှန်း ရေးသားပြီးပါပြီ!"
-        elif "ASMR" in mm_tone:
-            out_btn_text = "✨ ဒီ Outline အတိုင်း ASMR စာသား ရေးပါ"
-            direct_btn_text = "🚀 ASMR စာသား တန်းရေးရန် (Direct ASMR)"
-            type_keyword = "LATE NIGHT ASMR NARRATION (ညဘက်နားထောင်ရန် အေးချမ်းသောစာသား)"
-            success_msg = "✅ ASMR စာသား ရေးသားပြီးပါပြီ!"
-        elif "Tale" in mm_tone:
-            out_btn_text = "✨ ဒီ Outline အတိုင်း စကားပြေ/ဇာတ်လမ်းပုံစံ ရေးပါ"
-            direct_btn_text = "🚀 စကားပြေ တန်းရေးရန် (Direct Tale)"
-            type_keyword = "PROSE TALE (စကားပြေ ဇာတ်လမ်း)"
-            success_msg = "✅ ဇာတ်လမ်း ရေးသားပြီးပါပြီ!"
-        elif "Sarcastic" in mm_tone:
-            out_btn_text = "✨ ဒီ Outline အတိုင်း သရော်စာ ရေးပါ"
-            direct_btn_text = "🚀 သရော်စာ တန်းရေးရန် (Direct Satire)"
-            type_keyword = "SARCASTIC / SATIRICAL MONOLOGUE (ခနဲ့တဲ့တဲ့ သရော်စာ)"
-            success_msg = "✅ အမိုက်စား သရော်စာ ရေးသားပြီးပါပြီ!"
-        else:
-            out_btn_text = "✨ ဒီ Outline အတိုင်း စကားပြောဇာတ်ညွှန်း ရေးပါ"
-            direct_btn_text = "🚀 ဇာတ်ညွှန်း တန်းရေးရန် (Direct Script)"
-            type_keyword = "SPOKEN SCRIPT (စကားပြော ဇာတ်ညွှန်း)"
-            success_msg = "✅ ဇာတ်ညွှန်း ရေးသားပြီးပါပြီ!"
-
-        mm_b1, mm_b2 = st.columns(2)
-        with mm_b1: gen_mm_outline = st.button("📑 အဆင့် ၁: Outline အရင်ထုတ်ရန်", use_container_width=True, key="btn_mm_out")
-        with mm_b2: gen_mm_script = st.button(direct_btn_text, type="primary", use_container_width=True, key="btn_mm_script")
-
-        
-        # 💡 အခြေခံ ညွှန်ကြားချက်များ (VOICEOVER PRO EDITION)
-        mm_rules = f"""
-        CRITICAL INSTRUCTION: Your ENTIRE response MUST be in pure Burmese Language. 
-        VERY IMPORTANT: You MUST write the output as a {type_keyword}. 
-        
-        🔴 UNIVERSAL VOICEOVER & PRONOUN RULES:
-        1. NO ARBITRARY NAMES: NEVER use random placeholder names (like မေ, မေသူ, အောင်အောင်, etc.). ALWAYS use pronouns like "သူ" (He), "သူမ" (She), "သူတို့" (They), or descriptive terms like "ဒီကောင်လေး" (This boy), "ဒီအမျိုးသား" (This man).
-        2. VOICEOVER OPTIMIZED: Write strictly for the EAR. It must sound cinematic, rhythmic, and natural when read aloud by a voice actor or TTS.
-        3. SPOKEN BURMESE: Use natural spoken endings (တယ်, မယ်, တဲ့, တာ). STRICTLY AVOID formal/robotic book language (သည်, ၏, ၍) unless explicitly requested.
-        4. DRAMATIC PAUSES: Use ellipses (...) frequently to guide the voice actor's breathing and build suspense.
-        
-        Topic: {mm_topic}. Tone: {mm_tone}. Audience: {mm_audience}. 
-        """
-        
-        # 💡 နောက်ကွယ်မှ အတိအကျ ပုံသွင်းမည့် လျှို့ဝှက် Prompts များ
-        if "Soulful" in mm_tone:
-            mm_rules += "1. Write like 'Chicken Soup for the Soul'. Focus on deep human emotions.\n2. Use beautiful, poetic Burmese words.\n3. End with a profound life lesson.\n"
-        elif "Recap" in mm_tone:
-            mm_rules += "1. Fast-paced, engaging movie/book summary.\n2. Massive HOOK at the start.\n3. Highlight suspenseful parts like a campfire story.\n"
-        elif "True Crime" in mm_tone:
-            mm_rules += "1. Suspenseful, dark, analytical tone.\n2. Build tension, end with cliffhangers.\n3. Respectful but chilling voice.\n"
-        elif "Epic Myth" in mm_tone:
-            mm_rules += "1. Grand, cinematic, majestic tone.\n2. Characters sound like legends.\n3. Elegant/classic Burmese vocabulary.\n"
-        elif "ASMR" in mm_tone:
-            mm_rules += "1. Calm, soothing, intimate.\n2. Gentle pacing, frequent ellipses (...).\n3. Focus on relaxation/mindfulness.\n"
-        elif "Tale" in mm_tone:
-            mm_rules += "1. ANTI-CLICHÉ GOTHIC. Surreal, psychological.\n2. Deep aesthetic melancholy, plot twists.\n"
-        elif "Poetry" in mm_tone:
-            mm_rules += "1. Prose-poem/Voiceover format.\n2. NO traditional stanzas.\n3. Use dramatic pauses (...).\n4. Length: 4-7 sentences.\n"
-        elif "Sarcastic" in mm_tone:
-            mm_rules += "1. Highly sarcastic, dry, slightly mocking tone.\n2. Pretend to praise while criticizing.\n3. Sharp wit, irony. End with witty punchline.\n"
-
-        if "Third-Person" in mm_pov: mm_rules += "NARRATIVE STYLE: THIRD-PERSON.\n"
-        elif "First-Person" in mm_pov: mm_rules += "NARRATIVE STYLE: FIRST-PERSON.\n"
-
-        # 💡 Seamless Loop အတွက် သီးသန့် Prompt Injection (The Magic Sauce)
-        if "Seamless Loop" in mm_platform:
-            mm_rules += """
-            🔴 CRITICAL FORMAT RULE: SEAMLESS LOOP REEL (STRICTLY 30 SECONDS MAX)
-            1. LENGTH LIMIT: The entire script must be VERY SHORT (around 60 to 80 words max). It must take exactly 20-30 seconds to speak out loud. Do not write long paragraphs!
-            2. The Body section must be ONLY 2 or 3 short, punchy sentences.
-            3. The script MUST end with an incomplete sentence or a cliffhanger phrase (The Outro).
-            4. That exact incomplete sentence MUST flow flawlessly into the very FIRST sentence of the script (The Hook).
-            
-            EXAMPLE OF A PERFECT LOOP:
-            [Outro]: "...အဲ့ဒီတော့ သင်က တကယ်လို့ သိချင်တယ်ဆိုရင်..."
-            [Hook]: "...ဒီအချက် (၃) ချက်က သင့်ဘဝကို ပြောင်းလဲပေးပါလိမ့်မယ်။"
-            (When played together: "...အဲ့ဒီတော့ သင်က တကယ်လို့ သိချင်တယ်ဆိုရင်... ဒီအချက် (၃) ချက်က သင့်ဘဝကို ပြောင်းလဲပေးပါလိမ့်မယ်။")
-            
-            FORMAT TO OUTPUT:
-            🎬 **[ခေါင်းစဉ်]**
-            
-            🔄 **[Loop ချိတ်ဆက်ပုံ ရှင်းလင်းချက်]**
-            (Explain briefly in Burmese how the Outro connects to the Hook).
-            
-            📝 **[ဇာတ်ညွှန်း]**
-            [Hook / ဗီဒီယို အစ] - ... (1 short sentence)
-            [Body / အကြောင်းအရာ] - ... (Max 2-3 short sentences. Extremely concise and engaging).
-            [Outro / ဗီဒီယို အဆုံး] - ... (Must be an incomplete thought that connects back to the hook).
-            """
-
-
-        if gen_mm_outline and api_key and mm_topic:
-            with st.spinner("Brainstorming Outline..."):
-                prompt = f"Create a 5-point OUTLINE for a {type_keyword} about '{mm_topic}'. MUST be 100% in Burmese. {mm_rules}"
-                st.session_state.mm_outline_text = generate_content_safe(prompt)
-                st.session_state.mm_final_script = "" 
-
-        if st.session_state.mm_outline_text:
-            with st.expander("📑 Your Script Outline", expanded=True):
-                st.write(st.session_state.mm_outline_text)
-                if st.button(out_btn_text, use_container_width=True, key="btn_mm_full"):
-                    with st.spinner(f"Writing Full {type_keyword}..."):
-                        prompt = mm_rules + f"\nBased on this OUTLINE, write the full {type_keyword}:\n{st.session_state.mm_outline_text}"
-                        st.session_state.mm_final_script = generate_content_safe(prompt)
-                        st.session_state.mm_outline_text = "" 
-                        st.rerun() 
-
-        if gen_mm_script and api_key and mm_topic:
-            with st.spinner(f"Writing Professional {type_keyword}..."):
-                prompt = f"Write a FULL, highly engaging {type_keyword}. {mm_rules}"
-                st.session_state.mm_final_script = generate_content_safe(prompt)
-
-        if st.session_state.mm_final_script:
-            st.success(success_msg)
-            st.code(st.session_state.mm_final_script, language="markdown")
-            
-            c1, c2 = st.columns(2)
-            with c1:
-                if st.button("📲 AI TTS သို့ ပို့ရန်", key="send_mm_tts", use_container_width=True):
-                    st.session_state.tts_text_area = st.session_state.mm_final_script
-                    st.success("✅ Tab 6 သို့ ရောက်သွားပါပြီ!")
-            with c2:
-                if st.button("💾 မှတ်ဉာဏ်တိုက်သို့ သိမ်းမည်", key="save_to_vault_btn", use_container_width=True):
-                    save_to_vault(mm_topic, st.session_state.mm_final_script, type_keyword)
-                    st.success("✅ မှတ်ဉာဏ်တိုက် (Tab 7) တွင် သိမ်းဆည်းပြီးပါပြီ!")
-
-    # ==========================================
-    # 🇺🇸 ENGLISH TAB (Creative Literature Studio)
-    # ==========================================
-    with eng_tab:
-        st.subheader("✍️ English Creative Studio")
-        st.caption("Perfect for Teenagers, Children, and Heartwarming Adult Stories")
-        
-        if 'eng_final_text' not in st.session_state: st.session_state.eng_final_text = ""
-        if 'eng_target_audience' not in st.session_state: st.session_state.eng_target_audience = "Teenagers / Gen Z"
-
-        eng_topic = st.text_input("📝 What is the story about? (Topic)", placeholder="e.g., A magical forest, A lost letter...", key="eng_topic")
-        
-        col_e1, col_e2, col_e3 = st.columns(3)
-        with col_e1:
-            eng_format = st.selectbox("📜 Format", [
-                "Short Story", 
-                "Flash Fiction", 
-                "Poem", 
-                "Blog Article", 
-                "Children's Story", 
-                "Children's Song",
-                "Chicken Soup for the Soul (Inspirational)",
-                "Short Joke / Anecdote"
-            ], key="eng_format")
-            
-        with col_e2:
-            eng_genre = st.selectbox("🎭 Genre", [
-                "Coming-of-age", 
-                "Comedy / Humor", 
-                "Fantasy / Magic", 
-                "Sci-Fi", 
-                "Mystery / Thriller", 
-                "Horror", 
-                "Romance"
-            ], key="eng_genre")
-        with col_e3:
-            eng_length = st.radio("📏 Length", [
-                "Short (~150 words)", 
-                "Medium (~300 words)", 
-                "Long (~500 words)"
-            ], key="eng_length")
-
-        st.write("---")
-        if st.button("✨ Generate English Content", type="primary", use_container_width=True, key="btn_eng_gen"):
-            if api_key and eng_topic:
-                with st.spinner("Crafting your creative piece..."):
-                    current_audience = "Teenagers / Gen Z" 
-                    if eng_genre == "Romance" or eng_format == "Chicken Soup for the Soul (Inspirational)":
-                        current_audience = "Adults / Middle-aged"
-                    elif "Children" in eng_format:
-                        current_audience = "Children / Kids"
-                        
-                    st.session_state.eng_target_audience = current_audience
-
-                    eng_prompt = f"""
-                    CRITICAL INSTRUCTION: Write entirely in English. Do NOT output any conversational text, ONLY the final creative piece.
-                    Topic: {eng_topic}
-                    Format: {eng_format}
-                    Genre: {eng_genre}
-                    Target Audience: {current_audience}
-                    Length Requirement: {eng_length}. Strictly adhere to this word count limit.
-
-                    STYLE & TONE RULES:
-                    - 'Show, Don't Tell': Use vivid imagery, emotions, and sensory details.
-                    - AVOID overused AI clichés (DO NOT use words like: delve, tapestry, unveil, testament, symphony, dance of).
-                    - Ensure the tone perfectly matches the Target Audience ({current_audience}).
-                    """
-                    
-                    if "Chicken Soup" in eng_format:
-                        eng_prompt += "- TONE: Highly emotional, heartwarming, and relatable. Must conclude with a profound but gentle life lesson or realization.\n"
-                    elif "Song" in eng_format:
-                        eng_prompt += "- STRUCTURE: Write as a song with clear Verses and a catchy Chorus. Must have a rhythmic flow.\n"
-                    elif "Poem" in eng_format:
-                        eng_prompt += "- STRUCTURE: Use powerful poetic devices, rhythm, and metaphors.\n"
-
-                    st.session_state.eng_final_text = generate_content_safe(eng_prompt)
-
-        if st.session_state.eng_final_text:
-            st.success(f"✅ Created perfectly for: **{st.session_state.eng_target_audience}**")
-            st.code(st.session_state.eng_final_text, language="markdown")
-            
-            if st.button("📲 Send to AI TTS (Tab 6)", key="send_eng_tts"):
-                st.session_state.tts_text_area = st.session_state.eng_final_text 
-                st.success("✅ Text sent to Tab 6 Audio Studio!")
-
-# --- MENU 2 & 3: LOCAL VIDEO / AUDIO ---
-elif selected_menu in ["📂 Video to Script", "🎵 Audio to Script"]:
-    st.header(f"{selected_menu} Hub")
-    st.caption("Local ဖိုင်များ တင်၍ ဇာတ်ညွှန်း၊ ဆောင်းပါး နှင့် အိုင်ဒီယာများ ပြောင်းလဲပါ")
-    
-    # Video လား Audio လား ခွဲခြားခြင်း
-    is_video = "Video" in selected_menu
-    file_type = ['mp4', 'mov', 'avi'] if is_video else ['mp3', 'wav', 'm4a']
-    
-    media_file = st.file_uploader(f"Upload File", type=file_type)
-    
-    # 💡 ပြီးပြည့်စုံသော All-in-One အမျိုးအစား (၁၂) မျိုး
-    style_options = [
-        "🎬 ရုပ်ရှင်အနှစ်ချုပ် စတိုင် (Cinematic Recap)", 
-        "💖 နှလုံးသားခွန်အားပေး ရသစာတို (Soulful Story)", 
-        "🕵️‍♂️ မှုခင်း/လျှို့ဝှက်ဆန်းကြယ် (Mystery/True Crime)", 
-        "👻 အမှောင်ရသ (Gothic/Midnight Tale)", 
-        "😂 ခနဲ့တဲ့တဲ့ သရော်စာ (Sarcastic Roast)", 
-        "🎓 ပညာရေး / ဗဟုသုတ ရှင်းလင်းချက် (Educational Explainer)", 
-        "🎙️ ဇာတ်ကြောင်းပြော (Professional Narration)", 
-        "🗣️ ပေါ့တ်ကတ်စ် အမေးအဖြေ (Podcast Q&A)", 
-        "📱 Viral Shorts Script (စက္ကန့် ၆၀ စာ)", 
-        "📝 အဓိကအချက်များ ကောက်နုတ်ချက် (Key Takeaways)", 
-        "🧠 အိုင်ဒီယာ တိုးချဲ့ခြင်း (Idea Brainstorm & Outline)", 
-        "📄 စာသားအပြည့်အစုံ (Transcript / SRT)"
-    ]
-    
-    script_style = st.selectbox("ဖန်တီးလိုသော အမျိုးအစားကို ရွေးပါ:", style_options)
-    
-    # 💡 အထူးတောင်းဆိုချက် (Custom Instructions) ထည့်ရန်နေရာ
-    custom_instructions = st.text_input("💡 အထူးတောင်းဆိုချက် (Optional):", placeholder="ဥပမာ - ဟာသလေးတွေ ပိုထည့်ပေး၊ အဓိက ဇာတ်ကောင်အကြောင်း ပိုဖိရေးပေး...")
-    
-    # 💡 Generate လုပ်ပြီးပါက ရလဒ်များကို မှတ်ထားရန်
-    if 'media_final_script' not in st.session_state: st.session_state.media_final_script = ""
-    if 'current_media_name' not in st.session_state: st.session_state.current_media_name = ""
-    
-    if media_file and st.button("🚀 Start Professional AI Analysis", type="primary", use_container_width=True):
-        if api_key:
-            with st.spinner("AI မှ ဖိုင်ကို အသေးစိတ် လေ့လာနေပါသည်... (ဖိုင်အရွယ်အစားပေါ်မူတည်၍ အချိန်အနည်းငယ် ကြာနိုင်ပါသည်) ⏳"):
-                try:
-                    # ဖိုင်ကို Temp ထဲ ယာယီသိမ်းခြင်း
-                    ext = media_file.name.split('.')[-1]
-                    mime = "video/mp4" if is_video else "audio/mp3"
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{ext}") as tmp:
-                        tmp.write(media_file.getvalue())
-                        tpath = tmp.name
-                        
-                    # Gemini သို့ Upload တင်ခြင်း
-                    myfile = genai.upload_file(tpath, mime_type=mime)
-                    while myfile.state.name == "PROCESSING": 
-                        time.sleep(2)
-                        myfile = genai.get_file(myfile.name)
-                        
-                    # 💡 Video နဲ့ Audio အပေါ်မူတည်ပြီး Prompt ကို အလိုအလျောက် ပြောင်းလဲပေးမည့် စနစ်
-                    media_verb = "Watch the visuals and listen to the audio carefully" if is_video else "Listen to the audio carefully"
-                    visual_cue = " Include visual markers [Visual: ...] for key scene changes." if is_video else ""
-                    
-                    # 💡 Master Task Dictionary
-                    task_instructions = {
-                        "🎬 ရုပ်ရှင်အနှစ်ချုပ် စတိုင် (Cinematic Recap)": f"{media_verb}. Rewrite this as a high-energy movie recap script. Use a storytelling tone like popular YouTube recap channels.",
-                        "💖 နှလုံးသားခွန်အားပေး ရသစာတို (Soulful Story)": f"{media_verb}. Transform the content into a deeply emotional, heartwarming, and poetic short story (Chicken Soup style). Focus on human feelings and life lessons.",
-                        "🕵️‍♂️ မှုခင်း/လျှို့ဝှက်ဆန်းကြယ် (Mystery/True Crime)": f"{media_verb}. Create a suspenseful mystery/true crime style narration. Highlight the most unsettling or intriguing parts.",
-                        "👻 အမှောင်ရသ (Gothic/Midnight Tale)": f"{media_verb}. Re-imagine the content into a dark, mysterious, and Gothic-themed narrative. Add chilling and aesthetic elements.",
-                        "😂 ခနဲ့တဲ့တဲ့ သရော်စာ (Sarcastic Roast)": f"{media_verb}. Create a highly sarcastic, dry, and slightly mocking commentary/roast about the content. Make it funny and witty.",
-                        "🎓 ပညာရေး / ဗဟုသုတ ရှင်းလင်းချက် (Educational Explainer)": f"{media_verb}. Create a clear, highly informative educational explainer script. Break down complex topics so anyone can understand.",
-                        "🎙️ ဇာတ်ကြောင်းပြော (Professional Narration)": f"{media_verb}. Convert the input into a well-structured, professional narration script suitable for a documentary-style video.",
-                        "🗣️ ပေါ့တ်ကတ်စ် အမေးအဖြေ (Podcast Q&A)": f"{media_verb}. Extract the key topics and convert them into a structured Q&A interview format. Make it sound like an engaging podcast conversation.",
-                        "📱 Viral Shorts Script (စက္ကန့် ၆၀ စာ)": f"{media_verb}. Create a fast-paced viral script for TikTok/Reels. Start with a powerful HOOK. Ensure it fits a 60-second time limit. Include a catchy caption and 3 trending hashtags at the end.",
-                        "📝 အဓိကအချက်များ ကောက်နုတ်ချက် (Key Takeaways)": f"{media_verb}. Provide a very detailed, organized summary with bullet points highlighting the key takeaways and main concepts.",
-                        "🧠 အိုင်ဒီယာ တိုးချဲ့ခြင်း (Idea Brainstorm & Outline)": f"{media_verb}. Expand this idea into a professional 5-point content outline. Suggest angles and ways to make it engaging for an audience.",
-                        "📄 စာသားအပြည့်အစုံ (Transcript / SRT)": f"{media_verb}. Provide a clean, accurate, word-for-word transcript.{visual_cue}"
-                    }
-                    
-                    target_task = task_instructions.get(script_style, f"{media_verb}. Analyze the media and provide a detailed script.")
-                    
-                    # 💡 Professional Master Prompt (DEEP ANALYSIS EDITION)
-                    master_prompt = f"""
-                    CRITICAL INSTRUCTION: Your ENTIRE response MUST be in BURMESE language.
-                    ACT AS: A Meticulous Content Analyst and Master Scriptwriter. 
-                    
-                    IMPORTANT RULE: DO NOT SKIM or hallucinate. You must pay deep attention to every second of the media, analyzing exact spoken words, visual actions, and emotional tone before writing.
-                    
-                    TASK: {target_task}
-                    USER SPECIAL REQUEST: {custom_instructions if custom_instructions else 'None'}
-                    
-                    🔴 UNIVERSAL VOICEOVER & PRONOUN RULES:
-                    1. STRICT ACCURACY: Base your writing strictly on what is seen or heard in the file. Do not make up events.
-                    2. NO ARBITRARY NAMES: NEVER use random placeholder Burmese names. ALWAYS use pronouns like "သူ" (He), "သူမ" (She), "သူတို့" (They).
-                    3. VOICEOVER OPTIMIZED: Write strictly for the EAR. It must sound cinematic, rhythmic, and natural when read aloud.
-                    4. SPOKEN BURMESE: Use natural spoken endings (တယ်, မယ်, တဲ့). AVOID robotic book language (သည်, ၏).
-                    5. DRAMATIC PAUSES: Use ellipses (...) frequently to guide breathing and build suspense.
-                    """
-                    
-                    # SRT တောင်းဆိုပါက သီးသန့် Rule ထည့်ရန်
-                    if "Transcript" in script_style:
-                        master_prompt += "\nRULE: If the user explicitly asks for SRT format in the Special Request, use exact SRT format (1 \n 00:00:00,000 --> 00:00:02,000 \n [Text]). Otherwise, just provide the clean text format. If NO dialogue is present, reply ONLY 'NO_SPEECH_DETECTED'."
-                    
-                    # AI ဖြင့် Generate လုပ်ခြင်း
-                    st.session_state.media_final_script = generate_content_safe(master_prompt, myfile)
-                    st.session_state.current_media_name = media_file.name
-                    
-                    # Temp ဖိုင်ကို ရှင်းလင်းခြင်း
-                    if os.path.exists(tpath): os.remove(tpath)
-                    
-                except Exception as e:
-                    st.error(f"⚠️ Error: ဖိုင်ကို ဖတ်၍ မရပါ။ ({e})")
-                    
-    # 💡 ရလဒ်ပြသခြင်းနှင့် Action ခလုတ်များ (State မှတ်ထားသဖြင့် ပျောက်မသွားပါ)
-    if st.session_state.media_final_script:
-        st.success(f"✅ {script_style} ဖန်တီးပြီးပါပြီ!")
-        st.code(st.session_state.media_final_script, language="markdown")
-        
-        c1, c2 = st.columns(2)
-        with c1:
-            if st.button("📲 AI TTS သို့ ပို့ရန် (Tab 6)", key="send_media_tts", use_container_width=True):
-                st.session_state.tts_text_area = st.session_state.media_final_script
-                st.success("✅ Tab 6 သို့ ရောက်သွားပါပြီ! အသံထွက်ဖတ်ကြည့်နိုင်ပါပြီ။")
-        with c2:
-            if st.button("💾 မှတ်ဉာဏ်တိုက်သို့ သိမ်းမည်", key="save_media_vault", use_container_width=True):
-                save_to_vault(f"Media ({st.session_state.current_media_name})", st.session_state.media_final_script, script_style)
-                st.success("✅ မှတ်ဉာဏ်တိုက် (Tab 7) တွင် အောင်မြင်စွာ သိမ်းဆည်းပြီးပါပြီ!")
-
-# --- MENU 4: YOUTUBE MASTER (THE SUPER FAST BYPASS VERSION) ---
-elif selected_menu == "🔴 YouTube Master":
-    st.header("🔴 YouTube Master (Super Fast Engine ⚡)")
-    st.caption("YouTube မှ အချက်အလက်များကို စက္ကန့်ပိုင်းအတွင်း ဆွဲယူ၍ အမိုက်စား Content များ ဖန်တီးမည် (No Download Required)")
-    
-    yt_url = st.text_input("🔗 YouTube URL ကို ဤနေရာတွင် ထည့်ပါ:")
-    
-    if yt_url:
-        st.write("---")
-        
-        style_options = [
-            "🎬 ရုပ်ရှင်အနှစ်ချုပ် စတိုင် (Cinematic Recap)", 
-            "💖 နှလုံးသားခွန်အားပေး ရသစာတို (Soulful Story)", 
-            "🕵️‍♂️ မှုခင်း/လျှို့ဝှက်ဆန်းကြယ် (Mystery/True Crime)", 
-            "👻 အမှောင်ရသ (Gothic/Midnight Tale)", 
-            "😂 ခနဲ့တဲ့တဲ့ သရော်စာ (Sarcastic Roast)", 
-            "🎓 ပညာရေး / ဗဟုသုတ ရှင်းလင်းချက် (Educational Explainer)", 
-            "🎙️ ဇာတ်ကြောင်းပြော (Professional Narration)", 
-            "🗣️ ပေါ့တ်ကတ်စ် အမေးအဖြေ (Podcast Q&A)", 
-            "📱 Viral Shorts Script (စက္ကန့် ၆၀ စာ)", 
-            "📝 အဓိကအချက်များ ကောက်နုတ်ချက် (Key Takeaways)", 
-            "🧠 အိုင်ဒီယာ တိုးချဲ့ခြင်း (Idea Brainstorm & Outline)", 
-            "📄 မူရင်း စာသားအပြည့်အစုံ (Original English SRT)" # 💡 ဒီနေရာလေး နာမည်ပြောင်းထားသည်
-        ]
-        
-        yt_script_style = st.selectbox("ဖန်တီးလိုသော အမျိုးအစားကို ရွေးချယ်ပါ:", style_options)
-        yt_custom_instructions = st.text_input("💡 အထူးတောင်းဆိုချက် (Optional):", placeholder="ဥပမာ - ဟာသလေးတွေ ပိုထည့်ပေး...")
-
-        if 'yt_final_script' not in st.session_state: st.session_state.yt_final_script = ""
-        
-        if st.button("🚀 Start Fast AI Analysis", use_container_width=True, type="primary"):
-            if api_key:
-                with st.spinner("YouTube မှ အချက်အလက်များကို ဆွဲယူနေပါသည်... ⚡ (စက္ကန့်ပိုင်းသာ ကြာပါမည်)"):
-                    try:
-                        smart_data = fetch_youtube_smart_data(yt_url)
-                        
-                        # 💡 1. Original English SRT အတွက် သီးသန့် Prompt (ဘာသာမပြန်စေရန် တားမြစ်ထားသည်)
-                        if "Original" in yt_script_style or "SRT" in yt_script_style:
-                            prompt = f"""
-                            CRITICAL INSTRUCTION: You are a Professional Subtitle Formatter.
-                            TASK: Convert the provided extracted YouTube data into a STRICT, perfectly formatted SRT file in its ORIGINAL LANGUAGE (Usually English. DO NOT translate to Burmese).
-                            
-                            RULES:
-                            1. You MUST output standard SRT format (e.g., 1 \n 00:00:00,000 --> 00:00:05,000 \n [Original Text]).
-                            2. Use the timestamps provided in the data (e.g., [01:15]) to accurately estimate the SRT timecodes.
-                            3. KEEP the exact original words. DO NOT translate, do not summarize, and do not explain.
-                            4. DO NOT write an intro, outro, or conversational text. ONLY output the SRT formatted text starting with the number 1.
-                            
-                            USER SPECIAL REQUEST: {yt_custom_instructions if yt_custom_instructions else 'None'}
-                            
-                            --- EXTRACTED YOUTUBE DATA ---
-                            {smart_data}
-                            ------------------------------
-                            """
-                        else:
-                            # 💡 2. အခြား Content အမျိုးအစားများအတွက် ပုံမှန် မြန်မာဘာသာ Prompt
-                            yt_verb = "Read the extracted YouTube data carefully"
-                            task_instructions = {
-                                "🎬 ရုပ်ရှင်အနှစ်ချုပ် စတိုင် (Cinematic Recap)": f"{yt_verb}. Rewrite this as a high-energy movie recap script.",
-                                "💖 နှလုံးသားခွန်အားပေး ရသစာတို (Soulful Story)": f"{yt_verb}. Transform the content into a deeply emotional short story.",
-                                "🕵️‍♂️ မှုခင်း/လျှို့ဝှက်ဆန်းကြယ် (Mystery/True Crime)": f"{yt_verb}. Create a suspenseful mystery/true crime style narration.",
-                                "👻 အမှောင်ရသ (Gothic/Midnight Tale)": f"{yt_verb}. Re-imagine the content into a dark, mysterious narrative.",
-                                "😂 ခနဲ့တဲ့တဲ့ သရော်စာ (Sarcastic Roast)": f"{yt_verb}. Create a highly sarcastic, dry, and mocking commentary.",
-                                "🎓 ပညာရေး / ဗဟုသုတ ရှင်းလင်းချက် (Educational Explainer)": f"{yt_verb}. Create a clear, informative educational explainer script.",
-                                "🎙️ ဇာတ်ကြောင်းပြော (Professional Narration)": f"{yt_verb}. Convert the input into a professional narration script.",
-                                "🗣️ ပေါ့တ်ကတ်စ် အမေးအဖြေ (Podcast Q&A)": f"{yt_verb}. Convert them into a structured Q&A interview format.",
-                                "📱 Viral Shorts Script (စက္ကန့် ၆၀ စာ)": f"{yt_verb}. Create a fast-paced viral script for TikTok/Reels (60s limit).",
-                                "📝 အဓိကအချက်များ ကောက်နုတ်ချက် (Key Takeaways)": f"{yt_verb}. Provide a detailed summary with bullet points.",
-                                "🧠 အိုင်ဒီယာ တိုးချဲ့ခြင်း (Idea Brainstorm & Outline)": f"{yt_verb}. Expand this idea into a professional 5-point content outline."
-                            }
-                            
-                            target_task = task_instructions.get(yt_script_style, f"{yt_verb}. Provide a detailed script.")
-                            
-                            prompt = f"""
-                            CRITICAL INSTRUCTION: Output MUST be entirely in natural BURMESE language.
-                            ACT AS: A Highly Meticulous Content Analyst and Master Scriptwriter.
-                            
-                            TASK: {target_task}
-                            USER SPECIAL REQUEST: {yt_custom_instructions if yt_custom_instructions else 'None'}
-                            
-                            --- EXTRACTED YOUTUBE DATA ---
-                            {smart_data}
-                            ------------------------------
-                            
-                            🔴 DEEP ANALYSIS RULES:
-                            1. DO NOT HALLUCINATE: Base your script strictly on the provided Extracted YouTube Data (Transcript, Title, Description). Do NOT invent scenarios that are not mentioned in the text.
-                            2. CHRONOLOGICAL FLOW: If a transcript is provided, map out the story chronologically. Capture the true essence and exact points made in the video.
-                            3. NO ARBITRARY NAMES: Use appropriate pronouns (သူ, သူမ, ၎င်းတို့) instead of making up random names.
-                            4. VOICEOVER OPTIMIZED: Write for the EAR. Ensure it sounds cinematic and professional.
-                            5. SPOKEN BURMESE: Use conversational endings (တယ်, မယ်, တဲ့). AVOID robotic language (သည်, ၏).
-                            6. PAUSES & PACING: Use ellipses (...) to indicate dramatic pauses.
-                            """
-                        
-                        # 💡 AI ဖြင့် Generate လုပ်ခြင်း
-                        st.session_state.yt_final_script = generate_content_safe(prompt)
-                        
-                    except Exception as e:
-                        st.error(f"⚠️ Error: {e}")
-
-        # 💡 ရလဒ်ပြသခြင်းနှင့် ခလုတ် (၃) မျိုး (TTS, Vault, Download)
-        if st.session_state.yt_final_script:
-            st.success(f"✅ {yt_script_style} အောင်မြင်စွာ ဖန်တီးပြီးပါပြီ!")
-            st.markdown(st.session_state.yt_final_script)
-            
-            # ခလုတ် ၃ ခု ခွဲရန်
-            c1, c2, c3 = st.columns(3)
-            with c1:
-                if st.button("📲 AI TTS သို့ ပို့ရန် (Tab 6)", key="send_yt_tts", use_container_width=True):
-                    st.session_state.tts_text_area = st.session_state.yt_final_script
-                    st.success("✅ Tab 6 သို့ ရောက်သွားပါပြီ!")
-            with c2:
-                if st.button("💾 မှတ်ဉာဏ်တိုက် သိမ်းမည်", key="save_yt_vault", use_container_width=True):
-                    save_to_vault(f"YouTube Extract", st.session_state.yt_final_script, "YouTube Master")
-                    st.success("✅ Tab 7 တွင် သိမ်းဆည်းပြီးပါပြီ!")
-            with c3:
-                # 💡 ဒေါင်းလုဒ် ခလုတ် (.srt လား .txt လား ခွဲပေးထားသည်)
-                file_ext = "srt" if ("Original" in yt_script_style or "SRT" in yt_script_style) else "txt"
-                st.download_button(
-                    label=f"📥 ဖိုင် ဒေါင်းလုဒ်ဆွဲရန် (.{file_ext})", 
-                    data=st.session_state.yt_final_script, 
-                    file_name=f"universal_studio_{int(time.time())}.{file_ext}", 
-                    use_container_width=True
-                )
-
-# --- MENU 5: SMART TRANSLATOR (PRO EDITION) ---
-elif selected_menu == "🦁 Smart Translator":
-    st.header("🦁 Smart Translator (Pro Edition) 🌐")
-    st.caption("စာသားများ သို့မဟုတ် SRT ဖိုင်များကို အသက်ဝင်သော ဘာသာစကားသို့ အမိုက်စား ပြောင်းလဲမည် (အမှိုက်စာ/တိုက်ရိုက်ဘာသာပြန်များ လုံးဝမပါဝင်စေရ)")
-    
-    source_text = st.text_area("📝 မူရင်း စာသား သို့မဟုတ် SRT ကို ဤနေရာတွင် ကူးထည့်ပါ:", height=250)
-    
-    st.write("---")
-    
-    col_lang, col_mode = st.columns(2)
-    
-    with col_lang:
-        # 💡 ဘာသာစကား ရွေးချယ်ရန် ထပ်တိုးထားသော အပိုင်း
-        target_language = st.radio("🔄 ဘာသာပြန်လိုသော ပစ်မှတ်ဘာသာစကား:", [
-            "🇲🇲 မြန်မာဘာသာသို့ (To Burmese)", 
-            "🇬🇧 အင်္ဂလိပ်ဘာသာသို့ (To English)"
-        ])
-        
-    with col_mode:
-        # 💡 ရွေးချယ်စရာ ပုံစံများ
-        trans_mode = st.selectbox("ဘာသာပြန်လိုသော ပုံစံကို ရွေးပါ:", [
-            "💬 SRT စာတန်းထိုး အတိအကျ (Timestamps မပျက်စေရ)",
-            "🎬 ရုပ်ရှင်အနှစ်ချုပ် စတိုင် Voiceover (Cinematic Recap)",
-            "💖 နှလုံးသားခွန်အားပေး ရသစာတို (Soulful Story)",
-            "🕵️‍♂️ မှုခင်း/လျှို့ဝှက်ဆန်းကြယ် Voiceover (Mystery/True Crime)",
-            "👻 အမှောင်ရသ ဇာတ်လမ်း (Gothic/Midnight Tale)",
-            "😂 ခနဲ့တဲ့တဲ့ သရော်စာ (Sarcastic Roast)",
-            "🎓 ပညာရေး / ဗဟုသုတ ရှင်းလင်းချက် (Educational Explainer)",
-            "🎙️ ပရော်ဖက်ရှင်နယ် ဇာတ်ကြောင်းပြော (Pro Narration)",
-            "📱 Viral Social Media Post / Shorts (စက္ကန့် ၆၀ စာ)",
-            "📝 အဓိကအချက်များ ကောက်နုတ်ချက် (Key Takeaways)"
-        ])
-    
-    trans_custom_instructions = st.text_input("💡 အထူးတောင်းဆိုချက် (Optional):", placeholder="ဥပမာ - ပိုပြီး ရယ်စရာကောင်းအောင် ပြင်ရေးပေး...")
-
-    if 'trans_final_script' not in st.session_state: st.session_state.trans_final_script = ""
-
-    if st.button("✨ အသက်ဝင်အောင် ဘာသာပြန်မည်", type="primary", use_container_width=True):
-        if api_key and source_text:
-            with st.spinner(f"{target_language.split(' ')[1]} ပြောင်းလဲနေပါသည်... ⏳"):
-                
-                # 💡 Language Dynamics
-                if "Burmese" in target_language:
-                    lang_prompt = "natural, highly engaging BURMESE language."
-                    spoken_rule = "SPOKEN BURMESE: Use conversational endings (တယ်, မယ်, တဲ့)."
-                else:
-                    lang_prompt = "fluent, native-sounding, and engaging ENGLISH language."
-                    spoken_rule = "NATURAL ENGLISH: Use engaging vocabulary and proper pacing for a native speaker."
-
-                # 💡 Base Translation Prompt
-                base_prompt = f"""
-                CRITICAL INSTRUCTION: You are a Master Translator and Copywriter. 
-                Translate and transform the following text into {lang_prompt}
-                STRICT RULE: DO NOT use literal or direct word-for-word translations (Google Translate style). Ensure the essence and tone are perfectly adapted.
-                
-                🔴 UNIVERSAL VOICEOVER & PRONOUN RULES (Apply unless formatting as strict SRT):
-                1. NO ARBITRARY NAMES: NEVER insert random names unless translating actual names from the source. Use appropriate pronouns (He, She, They / သူ, သူမ, သူတို့).
-                2. VOICEOVER OPTIMIZED: Write for the EAR. The translation must flow naturally when spoken aloud. 
-                3. {spoken_rule}
-                4. DRAMATIC PAUSES: Use ellipses (...) frequently to guide the voice actor's pacing.
-                """
-                
-                # 💡 Format Specific Rules
-                if "SRT" in trans_mode:
-                    base_prompt += """
-                    🔴 SRT SUBTITLE PROTOCOL:
-                    1. The user has provided an SRT file format. You MUST strictly preserve the SRT structure (Sequence numbers, Timestamps `00:00:00,000 --> 00:00:05,000`, and blank lines).
-                    2. ONLY translate the dialogue text. DO NOT alter the timestamps or sequence numbers.
-                    3. Make the subtitles easy to read, concise, and cinematic. Avoid awkward direct translations.
-                    """
-                elif "Sarcastic" in trans_mode:
-                    base_prompt += f"\n🔴 TONE: Highly sarcastic, witty, and slightly mocking."
-                elif "Soulful" in trans_mode:
-                    base_prompt += "\n🔴 TONE: Deeply emotional, heartwarming, and poetic. Focus on human feelings."
-                elif "Mystery" in trans_mode:
-                    base_prompt += "\n🔴 TONE: Suspenseful, dark, and thrilling true-crime narrator style."
-                elif "Recap" in trans_mode:
-                    base_prompt += "\n🔴 TONE: Fast-paced, high-energy YouTube movie recap style."
-                elif "Social Media" in trans_mode:
-                    base_prompt += "\n🔴 TONE: Catchy, engaging, and viral. Include emojis and spacing. End with a strong Call-to-Action and 3 hashtags."
-                elif "Key Takeaways" in trans_mode:
-                    base_prompt += "\n🔴 TONE: Professional and clear. Summarize the translated text into well-organized bullet points."
-                else:
-                    base_prompt += f"\n🔴 TARGET STYLE: {trans_mode}. Adjust your tone perfectly to match this style."
-
-                # 💡 Finalizing the Prompt
-                prompt = f"""
-                {base_prompt}
-                
-                USER SPECIAL REQUEST: {trans_custom_instructions if trans_custom_instructions else 'None'}
-                
-                --- ORIGINAL TEXT / SRT ---
-                {source_text}
-                ---------------------------
-                
-                OUTPUT REQUIREMENT: Return ONLY the final transformed text. No introductory or concluding remarks.
-                """
-                
-                try:
-                    import time # Added in case it's missing
-                    st.session_state.trans_final_script = generate_content_safe(prompt)
-                except Exception as e:
-                    st.error(f"⚠️ Error: {e}")
-
-    # 💡 ရလဒ်ပြသခြင်းနှင့် Action ခလုတ်များ
-    if st.session_state.trans_final_script:
-        st.success(f"✅ {target_language.split(' ')[1]} အောင်မြင်စွာ ပြောင်းလဲပြီးပါပြီ!")
-        st.markdown(st.session_state.trans_final_script)
-        
-        c1, c2, c3 = st.columns(3)
-        with c1:
-            if st.button("📲 AI TTS သို့ ပို့ရန် (Tab 6)", key="send_trans_tts", use_container_width=True):
-                st.session_state.tts_text_area = st.session_state.trans_final_script
-                st.success("✅ Tab 6 သို့ ရောက်သွားပါပြီ!")
-        with c2:
-            if st.button("💾 မှတ်ဉာဏ်တိုက် သိမ်းမည်", key="save_trans_vault", use_container_width=True):
-                save_to_vault(f"Translated: {trans_mode} ({target_language.split(' ')[1]})", st.session_state.trans_final_script, "Smart Translator")
-                st.success("✅ Tab 7 တွင် သိမ်းဆည်းပြီးပါပြီ!")
-        with c3:
-            file_ext = "srt" if "SRT" in trans_mode else "txt"
-            st.download_button(
-                label=f"📥 ဖိုင် ဒေါင်းလုဒ်ဆွဲရန် (.{file_ext})", 
-                data=st.session_state.trans_final_script, 
-                file_name=f"translated_studio_{int(time.time())}.{file_ext}", 
-                use_container_width=True
-            )
-# --- TAB 6: AUDIO STUDIO ---
-elif selected_menu == "🎙️ Audio Studio":
-    st.header("🎧 Audio Studio Hub")
-    tts_tab, tele_tab = st.tabs(["🗣️ AI TTS Generator", "🎤 Teleprompter Recorder"])
-
-    with tts_tab:
-        st.subheader("AI Voice Generation (Multi-Character)")
-        
-        # 💡 Script Tab မှ ပို့လိုက်သော စာများကို လက်ခံရန်
-        text_input = st.text_area("Text to read:", height=150, key="tts_text_area", value=st.session_state.get("tts_text_area", "")) 
-        
-        voice_options = {
-            "🇲🇲 မြန်မာ (အမျိုးသမီး - Nilar)": "my-MM-NilarNeural",
-            "🇲🇲 မြန်မာ (အမျိုးသား - Thiha)": "my-MM-ThihaNeural",
-            "🇺🇸 English (Narrator Female - Jenny)": "en-US-JennyNeural",
-            "🇺🇸 English (Narrator Male - Guy)": "en-US-GuyNeural",
-            "👧 English (Little Girl - Ana)": "en-US-AnaNeural",
-            "👦 English (Young Boy - Roger)": "en-US-RogerNeural",
-            "👵 English (Elegant / Witchy - Sonia)": "en-GB-SoniaNeural",
-            "👴 English (Old Man / Wise - Thomas)": "en-GB-ThomasNeural",
-            "🦹‍♂️ English (Deep / Villain - Christopher)": "en-US-ChristopherNeural"
-        }
-        
-        c1, c2, c3 = st.columns(3)
-        with c1: 
-            selected_voice_label = st.selectbox("🎭 Character Voice", list(voice_options.keys()))
-            voice = voice_options[selected_voice_label]
-        with c2: 
-            rate = st.slider("🏃 Speed (အမြန်နှုန်း)", -50, 50, 0, format="%d%%", key="tts_rate")
-        with c3: 
-            pitch = st.slider("🎵 Pitch (အတက်အကျ)", -50, 50, 0, format="%dHz", key="tts_pitch")
-            
-        with st.expander("🪄 Pro Tips: ဘီလူးသံ၊ စုန်းမသံ ဖန်တီးနည်းများ"):
-            st.markdown("""
-            * **🧙‍♀️ စုန်းမသံ (Witch):** Voice `Sonia` ကို ရွေးပါ။ Pitch ကို **+15Hz** (အသံစူးစူး) ထားပြီး Speed ကို **-10%** (ဖြည်းဖြည်း) ထားပါ။
-            * **👹 ဘီလူး/လူဆိုးသံ (Villain):** Voice `Christopher` ကို ရွေးပါ။ Pitch ကို **-20Hz** (အသံသြသြ) ထားပြီး Speed ကို **-15%** (လေးလေးပင်ပင်) ထားပါ။
-            * **🧚‍♀️ နတ်သမီးသံ (Fairy):** Voice `Ana` ကို ရွေးပါ။ Pitch ကို **+20Hz** ထားပြီး Speed ကို **+10%** ထားပါ။
-            """)
-
-        if st.button("🔊 Generate AI Voice", type="primary"):
-            if text_input:
-                with st.spinner("🎧 Generating Voice... Please wait..."):
-                    # 💡 File Overwrite မဖြစ်အောင် ယာယီနာမည်ပေးခြင်း
-                    temp_audio_file = f"ai_voice_{int(time.time())}.mp3"
-
-                    async def gen_audio():
-                        pt = text_input.replace("။", "။ . ").replace("\n", " . \n")
-                        if not pt.endswith(". "): pt += " . "
-                        
-                        communicate = edge_tts.Communicate(pt, voice, rate=f"{rate:+d}%", pitch=f"{pitch:+d}Hz")
-                        await communicate.save(temp_audio_file)
-                    
-                    # 💡 Streamlit တွင် Asyncio Error မတက်စေရန် လုံခြုံသော Run နည်း
-                    try:
-                        loop = asyncio.get_event_loop()
-                    except RuntimeError:
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                    
-                    loop.run_until_complete(gen_audio())
-
-                    st.success("✅ Voice Generated Successfully!")
-                    st.audio(temp_audio_file)
-                    
-                    with open(temp_audio_file, "rb") as f: 
-                        st.download_button("💾 Download MP3", f, "ai_voice.mp3")
-            else:
-                st.warning("⚠️ ကျေးဇူးပြု၍ အသံထွက်ဖတ်ရမည့် စာသား (Text) ထည့်ပါ။")
-
-    with tele_tab:
-        st.subheader("Teleprompter & Voice Recorder")
-        # 💡 Script Tab ကပို့လိုက်တဲ့စာကို Teleprompter မှာ အလိုအလျောက် ပေါ်နေစေရန်
-        tele_text = st.text_area("Script for Teleprompter:", height=250, key="tele_text_input", value=st.session_state.get("tts_text_area", ""))
-        
-        col_t1, col_t2 = st.columns(2)
-        with col_t1: scroll_duration = st.slider("Duration (Slower)", 20, 500, 150) 
-        with col_t2: font_size = st.slider("Font Size", 20, 80, 40)
-
-        if tele_text:
-            html_code = f"""<div style="height: 300px; overflow: hidden; background: #000; color: #FFF; font-size: {font_size}px; text-align: center; padding: 20px; border-radius: 10px; line-height: 1.6;">
-                <div class="scroll" style="display: inline-block; animation: mUp {scroll_duration}s linear infinite;">{tele_text.replace(chr(10), "<br><br>")}</div></div>
-            <style>@keyframes mUp {{ 0% {{ transform: translateY(100%); }} 100% {{ transform: translateY(-100%); }} }} .scroll:hover {{ animation-play-state: paused; color: #FFD700; cursor: pointer; }}</style>"""
-            st.markdown(html_code, unsafe_allow_html=True)
-
-        st.write("---")
-        wav_audio_data = st_audiorec() 
-        if wav_audio_data is not None:
-            st.audio(wav_audio_data, format='audio/wav')
-            st.download_button("💾 Download WAV", wav_audio_data, "teleprompter_rec.wav", "audio/wav")
-            
-# --- MENU 7: VISION STUDIO ---
-elif selected_menu == "👁️ Vision Studio":
-    st.header("👁️ Vision Studio (Image to Script)")
-    st.caption("ပုံတင်ပါ၊ AI မှ ပုံထဲကစာများကို ဖတ်ပေးခြင်း၊ ပုံကိုကြည့်၍ Tone မျိုးစုံဖြင့် ဇာတ်လမ်းဖန်တီးပေးခြင်းများ လုပ်ဆောင်ပေးပါမည်။")
-    image_file = st.file_uploader("📸 ဓာတ်ပုံ သို့မဟုတ် Screenshot တင်ရန် (JPG, PNG)", type=["jpg", "png", "jpeg"])
-
-    if image_file:
-        img = Image.open(image_file)
-        st.image(img, caption="Uploaded Image", use_container_width=True)
-        st.write("---")
-        vision_task = st.selectbox("ဘာလုပ်ချင်ပါသလဲ?", [
-            "📝 ပုံထဲက စာသားများကို အတိအကျ ကူးယူရန် (OCR Engine)",
-            "🎬 ပုံကိုကြည့်ပြီး ရုပ်ရှင်အနှစ်ချုပ် စတိုင်ရေးရန် (Cinematic Recap)",
-            "💖 ပုံကိုကြည့်ပြီး ရသစာတို ရေးရန် (Soulful Story)",
-            "😂 ပုံကိုကြည့်ပြီး ခနဲ့တဲ့တဲ့ သရော်စာ ရေးရန် (Sarcastic Roast)",
-            "🕵️‍♂️ ပုံကိုကြည့်ပြီး လျှို့ဝှက်ဆန်းကြယ် ဇာတ်လမ်းရေးရန် (Mystery/Horror)",
-            "🎙️ ပုံကိုကြည့်ပြီး ပရော်ဖက်ရှင်နယ် ဇာတ်ကြောင်းပြောရေးရန် (Narration)",
-            "📱 ပုံကိုကြည့်ပြီး Social Media Caption & SEO ရေးရန်"
-        ])
-
-        vision_custom = st.text_input("💡 အထူးတောင်းဆိုချက် (Optional):", placeholder="ဥပမာ - စာပိုဒ်တိုတိုပဲ ရေးပေးပါ၊ မြန်မာလိုချည်းပဲ ရေးပေးပါ...")
-        if 'vision_final_script' not in st.session_state: st.session_state.vision_final_script = ""
-        if st.button("🚀 Start Vision AI Analysis", type="primary", use_container_width=True):
-            if api_key:
-                with st.spinner("AI မှ ပုံကို မျက်စိဖြင့် သေချာစစ်ဆေးနေပါသည်... ⏳"):
-                    # 💡 OCR လား၊ ဇာတ်လမ်းရေးတာလား ခွဲခြားခြင်း
-                    if "OCR Engine" in vision_task:
-                        vision_prompt = f"""
-                        CRITICAL INSTRUCTION: Act as an expert OCR Engine. 
-                        TASK: Extract ALL text exactly as it appears in this image. 
-                        Maintain the original formatting and language (If Burmese, output perfectly spelled Burmese text). 
-                        DO NOT explain the image, JUST extract the text.
-                        USER REQUEST: {vision_custom}
-                        """
-                    else:
-                        vision_prompt = f"""
-                        CRITICAL INSTRUCTION: You are a Master Visual Storyteller. 
-                        Look at the provided image meticulously (facial expressions, environment, mood, lighting, objects).
-                        TASK: {vision_task}. Write entirely in engaging, natural BURMESE language.
-                        SPOKEN BURMESE: Use conversational endings (တယ်, မယ်, တဲ့).
-                        USER REQUEST: {vision_custom}
-                        """
-                    try:
-                        # 💡 Image ကို media_file အဖြစ် AI ဆီ လှမ်းပို့ခြင်း
-                        st.session_state.vision_final_script = generate_content_safe(vision_prompt, media_file=img)
-                    except Exception as e:
-                        st.error(f"⚠️ Error: ပုံကို ဖတ်၍ မရပါ။ ({e})")
-
-        # 💡 ရလဒ်ပြသခြင်း နှင့် Action ခလုတ်များ
-        if st.session_state.vision_final_script:
-            st.success(f"✅ အောင်မြင်စွာ ဖန်တီးပြီးပါပြီ!")
-            st.markdown(st.session_state.vision_final_script)
-
-            c1, c2, c3 = st.columns(3)
-            with c1:
-                if st.button("📲 AI TTS သို့ ပို့ရန် (Tab 6)", key="send_vision_tts", use_container_width=True):
-                    st.session_state.tts_text_area = st.session_state.vision_final_script
-                    st.success("✅ Tab 6 သို့ ရောက်သွားပါပြီ!")
-            with c2:
-                if st.button("💾 မှတ်ဉာဏ်တိုက် သိမ်းမည်", key="save_vision_vault", use_container_width=True):
-                    save_to_vault("Vision Analysis Output", st.session_state.vision_final_script, "Vision Studio")
-                    st.success("✅ Tab 7 တွင် သိမ်းဆည်းပြီးပါပြီ!")
-            with c3:
-                st.download_button("📥 ဖိုင် ဒေါင်းလုဒ်ဆွဲရန်", st.session_state.vision_final_script, file_name="vision_output.txt", use_container_width=True)
-
-# --- NEW MENU 8: DIRECTOR'S DESK (FIXED CSV DOWNLOAD) ---
-elif selected_menu == "🎬 Director's Desk":
-    st.header("🎬 Director's Desk (Storyboard Generator)")
-    st.caption("ဇာတ်ညွှန်းကိုထည့်ပါ။ ဗီဒီယိုရိုက်ကူးတည်းဖြတ်ရန် လွယ်ကူစေမည့် ဇယားကွက် (Storyboard) အဖြစ် အလိုအလျောက် ခွဲထုတ်ပေးပါမည်။")
-    
-    dir_script = st.text_area("📝 မြန်မာ ဇာတ်ညွှန်းကို ဤနေရာတွင် Paste ချပါ:", height=200)
-    
-    if 'dir_board_res' not in st.session_state: 
-        st.session_state.dir_board_res = ""
-
-    if st.button("🎞️ ဇယားကွက်အဖြစ် ပြောင်းလဲရန်", type="primary") and api_key and dir_script:
-        with st.spinner("Director's Storyboard အဖြစ် ခွဲထုတ်နေပါသည်... ⏳"):
-            dir_prompt = f"""
-            Act as a Professional Film Director. Convert the following script into a highly detailed Storyboard Table for a video editor.
-            The response MUST be a STRICT Markdown Table with exactly 4 columns.
-            Do NOT use excessive hyphens (---). Keep the markdown clean and simple. Use exactly this table structure format:
-            
-            | Scene | မျက်နှာပြင် မြင်ကွင်း (Visual) | ပြောမည့်အသံ (Voiceover) | နောက်ခံအသံ (BGM / SFX) |
-            |---|---|---|---|
-            | 1 | [Describe visuals here] | [Voiceover text here] | [Music/SFX here] |
-            
-            CRITICAL RULES:
-            1. Write entirely in engaging BURMESE.
-            2. DO NOT generate lines longer than 200 characters.
-            
-            SCRIPT TO CONVERT:
-            {dir_script}
-            """
-            st.session_state.dir_board_res = generate_content_safe(dir_prompt)
-            
-    if st.session_state.dir_board_res:
-        st.success("✅ Storyboard ဇယားကွက် အသင့်ဖြစ်ပါပြီ!")
-        
-        # ဖန်သားပြင်ပေါ်တွင် အလှပြရန်
-        st.markdown(st.session_state.dir_board_res)
-        
-        st.write("---")
-        st.write("📋 **Copy ကူးရန် (အောက်ပါ Code Box ညာဘက်အပေါ်ထောင့်မှ Copy Icon ကို နှိပ်ပါ)**")
-        st.code(st.session_state.dir_board_res, language="markdown")
-        
-        # 💡 CSV Format သို့ ပြောင်းလဲခြင်း (Excel တွင် ဖွင့်၍ရရန်)
-        import csv
-        import io
-        
-        def get_csv_bytes(md_text):
-            lines = md_text.strip().split('\n')
-            csv_io = io.StringIO()
-            writer = csv.writer(csv_io)
-            
-            for line in lines:
-                line = line.strip()
-                # ဇယားကွက် ဖြစ်ကြောင်း စစ်ဆေးရန် ( | ဖြင့်စပြီး | ဖြင့်ဆုံးရမည်)
-                if line.startswith('|') and line.endswith('|'):
-                    if '---' in line: continue # ဇယားကွက် မျဉ်းကြောင်းများကို ချန်လှပ်မည်
-                    # | များကိုဖယ်ရှားပြီး Column များကို ခွဲထုတ်မည်
-                    row = [col.strip() for col in line.split('|')[1:-1]]
-                    writer.writerow(row)
-            
-            # Excel တွင် မြန်မာစာ မှန်ကန်စွာပေါ်ရန် UTF-8 BOM ထည့်ပေးရမည်
-            return '\ufeff'.encode('utf-8') + csv_io.getvalue().encode('utf-8')
-
-        csv_bytes = get_csv_bytes(st.session_state.dir_board_res)
-        
-        # CSV အဖြစ် Download ဆွဲရန် ခလုတ်
-        st.download_button(
-            label="📥 ဇယားကွက်ကို Excel တွင်ဖွင့်ရန် ဒေါင်းလုဒ်ဆွဲပါ (.csv)",
-            data=csv_bytes,
-            file_name=f"storyboard_{int(time.time())}.csv",
-            mime="text/csv",
-            use_container_width=True
-        )
-
-# --- NEW MENU 9: EPIC SERIES MAKER & WEB HUNTER (WIKI + PDF/TEXT ONLY) ---
-elif selected_menu == "📚 Epic Series Maker":
-    st.header("📚 Epic Series Maker & Web Hunter")
-    st.caption("Wikipedia မှ အချက်အလက်များ သို့မဟုတ် သင်၏ စာသား/ဖိုင်များကို အမိုက်စား မြန်မာ ဇာတ်လမ်းတွဲများအဖြစ် အလိုအလျောက် ပြောင်းလဲပေးမည်။")
-
-    # 💡 Reddit ကိုဖြုတ်ပြီး Wiki နှင့် PDF/Text နှစိခုသာ ချန်ထားပါသည်
-    source_type = st.radio("🔍 ဇာတ်လမ်း အရင်းအမြစ်ကို ရွေးပါ:", [
-        "🔍 Wikipedia Auto-Hunter (သမိုင်း/သိပ္ပံ အကြောင်းအရာများရှာရန်)",
-        "📄 PDF, TXT ဖိုင် (သို့မဟုတ်) စာသား ကိုယ်တိုင်ထည့်မည်"
-    ])
-
-    raw_text = ""
-
-    if "Wikipedia" in source_type:
-        st.info("ရှာဖွေလိုသော အကြောင်းအရာကို ရိုက်ထည့်ပါ။ အင်္ဂလိပ် Wikipedia မှ အချက်အလက်များကို Auto ဆွဲယူပါမည်။")
-        wiki_query = st.text_input("ရှာဖွေလိုသော ခေါင်းစဉ် (English လို ရိုက်ပါ - ဥပမာ: Bermuda Triangle, Albert Einstein):")
-        
-        if st.button("🔍 Wikipedia မှ အချက်အလက် ဆွဲယူရန်") and wiki_query:
-            with st.spinner(f"Wikipedia တွင် '{wiki_query}' ကို ရှာဖွေနေပါသည်... ⏳"):
-                raw_text = fetch_wikipedia_summary(wiki_query)
-                if "Error" not in raw_text:
-                    st.success("✅ Wikipedia မှ အချက်အလက် ဆွဲယူရရှိပါပြီ! အောက်တွင် ဇာတ်လမ်းတွဲ ခွဲထုတ်နိုင်ပါပြီ။")
-                    st.session_state.temp_raw_text = raw_text
-                else: 
-                    st.error(raw_text)
-
-    elif "PDF" in source_type:
-        st.info("စာအုပ်၊ ဆောင်းပါး သို့မဟုတ် ဇာတ်လမ်းရှည်များကို တင်ပါ။ (PDF သို့မဟုတ် TXT ဖိုင်) သို့မဟုတ် အောက်တွင် စာသားကို တိုက်ရိုက် Paste ချပါ။")
-        
-        # 1. ဖိုင်တင်မည့်နေရာ (PDF နှင့် TXT ရသည်)
-        uploaded_file = st.file_uploader("📄 PDF သို့မဟုတ် TXT ဖိုင် တင်ရန်:", type=["pdf", "txt"])
-        
-        st.write("**— (သို့မဟုတ်) —**")
-        
-        # 2. စာသားကိုယ်တိုင် ထည့်မည့်နေရာ
-        manual_text = st.text_area("📝 စာသားများကို ဤနေရာတွင် တိုက်ရိုက် Paste ချပါ:", height=200, placeholder="အင်္ဂလိပ် သို့မဟုတ် မြန်မာ စာပိုဒ် အရှည်ကြီးများကို ဤနေရာတွင် ကူးထည့်ပါ...")
-        
-        if st.button("📂 ဇာတ်လမ်းတွဲ ဖန်တီးရန် အချက်အလက်ယူမည်", type="primary"):
-            with st.spinner("အချက်အလက်များကို ဖတ်ရှုနေပါသည်... ⏳"):
-                if uploaded_file:
-                    if uploaded_file.name.endswith(".pdf"):
-                        raw_text = extract_text_from_pdf(uploaded_file)
-                    elif uploaded_file.name.endswith(".txt"):
-                        raw_text = uploaded_file.getvalue().decode("utf-8")
-                elif manual_text.strip():
-                    raw_text = manual_text
-                
-                if raw_text and "Error" not in raw_text:
-                    st.success("✅ အချက်အလက် ဖတ်ရှုခြင်း အောင်မြင်ပါသည်! အောက်တွင် ဇာတ်လမ်းတွဲ ခွဲထုတ်နိုင်ပါပြီ။")
-                    st.session_state.temp_raw_text = raw_text
-                else: 
-                    st.error(raw_text if raw_text else "⚠️ ကျေးဇူးပြု၍ ဖိုင်တစ်ခုခု တင်ပါ၊ သို့မဟုတ် စာသားထည့်ပါ။")
-
-    # 💡 ဇာတ်လမ်းတွဲ ခွဲထုတ်မည့် အပိုင်း
-    if st.session_state.get("temp_raw_text"):
-        st.write("---")
-        st.subheader("🎬 ဇာတ်လမ်းတွဲ (Series) ဖန်တီးရန်")
-        parts = st.slider("အပိုင်း (Episodes) ဘယ်နှစ်ပိုင်း ခွဲထုတ်ချင်ပါသလဲ?", 2, 15, 3)
-        
-        # 💡 ရွေးချယ်စရာ Tone (၁၁) မျိုး အပြည့်အစုံ
-        series_tone = st.selectbox("🎭 ဇာတ်လမ်းတွဲ အမျိုးအစား (Tone) ကို ရွေးပါ:", [
-            "👻 သဲထိတ်ရင်ဖို နှင့် လျှို့ဝှက်ဆန်းကြယ် (Mystery / Horror)",
-            "🔪 မှုခင်း နှင့် စုံထောက် (True Crime / Detective)",
-            "👽 သိပ္ပံလွန် နှင့် အာကာသ (Sci-Fi / Space)",
-            "💖 နှလုံးသားခွန်အားပေး ရသ (Soulful / Inspirational)",
-            "⚔️ သမိုင်းဝင် ဒဏ္ဍာရီ (Epic Historical / Myth)",
-            "🎬 ရုပ်ရှင်အနှစ်ချုပ် စတိုင် (Cinematic Recap)",
-            "🎓 ဗဟုသုတ နှင့် မှတ်တမ်းတင်ပုံစံ (Educational / Documentary)",
-            "😂 ဟာသ နှင့် သရော်စာ (Comedy / Satire)",
-            "🥀 အမှောင်ရသ နှင့် စိတ်ပညာ (Dark Fantasy / Psychological Thriller)",
-            "🧚 ဖန်တီးယဉ်ကျေးမှု နတ်သမီးပုံပြင် (Fantasy / Fairy Tale)",
-            "💔 အချစ် နှင့် ရိုမန်တစ် (Romance / Melodrama)"
-        ])
-        
-        if st.button("🚀 အမိုက်စား မြန်မာဇာတ်လမ်းတွဲ ခွဲထုတ်ရန်", type="primary") and api_key:
-            with st.spinner(f"အပိုင်း ({parts}) ပိုင်းပါဝင်သော ဇာတ်ညွှန်းများ ရေးသားနေပါသည်... (အချိန်အနည်းငယ် ကြာနိုင်ပါသည်) ⏳"):
-                series_prompt = f"""
-                Act as a Master Visual Storyteller and Series Writer.
-                I will provide you with a long source text. 
-                TASK: Adapt this story/information into an engaging BURMESE voiceover script series, strictly divided into EXACTLY {parts} Episodes (အပိုင်း {parts} ပိုင်း).
-                
-                TONE: {series_tone}
-                
-                RULES FOR EACH EPISODE:
-                1. Start with an Epic HOOK.
-                2. Write strictly for the EAR (Conversational Burmese: တယ်, မယ်, တဲ့). AVOID formal book language (သည်, ၏).
-                3. End EVERY episode (except the final one) with a MASSIVE CLIFFHANGER (e.g., "အပိုင်း ၂ မှာ ဆက်ကြည့်ကြရအောင်...").
-                4. Do NOT output a wall of text. Use spacing and ellipses (...) for pacing.
-                5. DO NOT use Markdown tables or excessive hyphens (---).
-                
-                FORMAT EXPECTED:
-                🎬 အပိုင်း (၁) 
-                [Script Body]
-                ...
-                🎬 အပိုင်း (၂)
-                [Script Body]
-                ...
-                
-                SOURCE TEXT TO ADAPT:
-                {st.session_state.temp_raw_text[:40000]}
-                """
-                series_res = generate_content_safe(series_prompt)
-                st.success("✅ ဇာတ်လမ်းတွဲ အောင်မြင်စွာ ခွဲထုတ်ပြီးပါပြီ!")
-                st.markdown(series_res)
-                
-                if st.button("💾 မှတ်ဉာဏ်တိုက် သိမ်းမည်", key="save_series_vault", use_container_width=True):
-                    save_to_vault("Epic Series Output", series_res, "Series Maker")
-                    st.success("✅ Tab 7 တွင် သိမ်းဆည်းပြီးပါပြီ!")
-# --- NEW MENU 10: GLOBAL MAGAZINE STUDIO ---
-elif selected_menu == "📖 Magazine Studio":
-    st.header("📖 Global Magazine Studio")
-    st.caption("ကမ္ဘာကျော် မဂ္ဂဇင်းကြီးများနှင့် ဟောပြောပွဲများ၏ ဟန်အတိုင်း ဆွဲဆောင်မှုရှိသော မြန်မာ Content များ အလိုအလျောက် ဖန်တီးပေးမည်။")
-
-    col_m1, col_m2 = st.columns([1, 1])
-    
-    with col_m1:
-        magazine_style = st.selectbox("📚 ဖန်တီးလိုသော စတိုင် (Style) ကို ရွေးပါ:", [
-            "📖 Reader's Digest (မိသားစု၊ ဘဝခွန်အား နှင့် ဗဟုသုတ)",
-            "🌍 National Geographic (သမိုင်း၊ သဘာဝတရား နှင့် စူးစမ်းလေ့လာမှု)",
-            "💡 TED Talks (အတွေးအခေါ်သစ်၊ စိတ်ပညာ နှင့် ဟောပြောပွဲ)",
-            "🍲 Chicken Soup for the Soul (နှလုံးသားကို ထိရှစေသော ရသများ)"
-        ])
-    
-    with col_m2:
-        if "Reader's Digest" in magazine_style:
-            content_type = st.radio("📑 ကဏ္ဍ ရွေးပါ:", [
-                "💖 Inspiring True Stories (ဘဝခွန်အားပေး တကယ့်ဖြစ်ရပ်မှန်များ)",
-                "🎓 Articles (အသုံးဝင် ဗဟုသုတ ဆောင်းပါးများ)",
-                "📖 Condensed Books (ဝတ္ထုရှည် အနှစ်ချုပ်များ)",
-                "😂 Humor & Jokes (ဟာသ နှင့် ရယ်စရာများ)"
-            ])
-        elif "National Geographic" in magazine_style:
-            content_type = st.radio("📑 ကဏ္ဍ ရွေးပါ:", [
-                "🏛️ Unsolved Ancient Mysteries (ဖြေရှင်းမရသေးသော ရှေးဟောင်းလျှို့ဝှက်ချက်များ)",
-                "🦁 Extreme Wildlife Survival (တိရစ္ဆာန်တို့၏ ကြမ်းတမ်းသော ရှင်သန်မှု)",
-                "🌊 Deep Ocean / Space (နက်ရှိုင်းသော သမုဒ္ဒရာ သို့မဟုတ် အာကာသ အကြောင်း)"
-            ])
-        elif "TED Talks" in magazine_style:
-            content_type = st.radio("📑 ကဏ္ဍ ရွေးပါ:", [
-                "🧠 Psychological Deep Dive (စိတ်ပညာ ခွဲခြမ်းစိတ်ဖြာချက်)",
-                "🚀 Future & Humanity (အနာဂတ်နည်းပညာ နှင့် လူသားမျိုးနွယ်)",
-                "🎤 Motivational Speech (စိတ်ခွန်အားပေး ဟောပြောချက် ဇာတ်ညွှန်း)"
-            ])
-        elif "Chicken Soup" in magazine_style:
-            content_type = st.radio("📑 ကဏ္ဍ ရွေးပါ:", [
-                "👨‍👩‍👧 Tear-jerking Family Stories (မျက်ရည်ကျစေမည့် မိသားစု မေတ္တာဖွဲ့)",
-                "🤝 Kindness of Strangers (သူစိမ်းများထံမှ ရရှိသော ကြင်နာမှုများ)",
-                "💪 Overcoming Grief (အဆိုးဝါးဆုံး အခြေအနေမှ ပြန်လည်ထူမတ်လာခြင်း)"
-            ])
-
-    st.write("---")
-    mag_topic = st.text_area("📝 အကြောင်းအရာ (Topic) ရိုက်ထည့်ပါ:", placeholder="ဥပမာ - မုန်တိုင်းထဲ ပိတ်မိသွားတဲ့ သင်္ဘောသားအကြောင်း၊ စိတ်ကျရောဂါကို ကျော်လွှားခဲ့သူအကြောင်း (သို့မဟုတ် အလွတ်ထားလျှင် AI မှ Auto စဉ်းစားပေးပါမည်)...")
-
-    if st.button("✨ အမိုက်စား Content ဖန်တီးရန်", type="primary", use_container_width=True) and api_key:
-        with st.spinner(f"{magazine_style} စတိုင်ဖြင့် ရေးသားနေပါသည်... ⏳"):
-            topic_instruction = f"about '{mag_topic}'" if mag_topic.strip() else "by coming up with a brilliant, highly engaging original topic on your own"
-            
-            mag_prompt = f"""
-            Act as an elite Master Copywriter and Editor for a globally renowned publication.
-            Your task is to write a highly captivating piece {topic_instruction}.
-            
-            PUBLICATION STYLE: {magazine_style}
-            SPECIFIC CATEGORY: {content_type}
-            
-            CRITICAL RULES:
-            1. Write the ENTIRE output in natural, highly engaging BURMESE language.
-            2. Match the exact emotional tone of the chosen publication (e.g., Reader's Digest = warm and concise; NatGeo = epic and descriptive; TED = thought-provoking and conversational; Chicken Soup = deeply emotional and touching).
-            3. Write for the EAR if it is a story or speech (use conversational Burmese: တယ်, မယ်, တဲ့).
-            4. Start with a massive, attention-grabbing HOOK.
-            5. Structure with clear paragraphs and use dramatic ellipses (...) where necessary.
-            """
-            
-            mag_res = generate_content_safe(mag_prompt)
-            st.success("✅ အောင်မြင်စွာ ဖန်တီးပြီးပါပြီ!")
-            st.markdown(mag_res)
-            
-            c1, c2 = st.columns(2)
-            with c1:
-                if st.button("📲 AI TTS သို့ ပို့ရန် (Tab 6)", key="send_mag_tts", use_container_width=True):
-                    st.session_state.tts_text_area = mag_res
-                    st.success("✅ Tab 6 သို့ ရောက်သွားပါပြီ!")
-            with c2:
-                if st.button("💾 မှတ်ဉာဏ်တိုက် သိမ်းမည်", key="save_mag_vault", use_container_width=True):
-                    save_to_vault(f"Magazine: {content_type}", mag_res, "Magazine Studio")
-                    st.success("✅ Tab 7 တွင် သိမ်းဆည်းပြီးပါပြီ!")
-                    
-# --- MENU 10, 11, 12 ---
-elif selected_menu == "📚 မှတ်ဉာဏ်တိုက်":
-    st.header("📚 Memory Vault")
-    saved_items = load_vault()
-    if not saved_items: st.info("မှတ်ဉာဏ်တိုက်ထဲတွင် ဘာမှ မရှိသေးပါ။")
-    else:
-        for item in reversed(saved_items):
-            with st.expander(f"📖 {item['title']} ({item['type']})"): st.write(item['content'])
-
-elif selected_menu == "🕵️‍♂️ Lore Hunter":
-    st.header("🕵️‍♂️ Lore Hunter")
-    st.write("ကမ္ဘာတစ်ဝှမ်းမှ ထူးဆန်းသော အကြောင်းအရာများကို AI ထံမှ တောင်းယူပါ။")
-    if st.button("🔍 ရှားပါး အိုင်ဒီယာ ၃ ခု ရှာဖွေရန်", type="primary") and api_key:
-        with st.spinner("ရှာဖွေနေပါသည်..."):
-            st.markdown(generate_content_safe("Find 3 highly obscure, creepy historical facts. Output in engaging BURMESE language."))
-
-elif selected_menu == "🎨 Visual Director":
-    st.header("🚀 Social Media SEO & Captions Studio")
-    seo_text = st.text_area("ဗီဒီယို အကြောင်းအရာကို ထည့်ပါ:")
-    if st.button("🔥 Generate SEO Pack", type="primary") and api_key and seo_text:
-        with st.spinner("ရေးသားနေပါသည်..."):
-            st.markdown(generate_content_safe(f"Create a highly engaging Burmese Caption, Title, and 5 hashtags for TikTok/FB based on: {seo_text}"))
-
-
-
-
-
+import streamlit as st
+import google.generativeai as genai
+from google.api_core import exceptions
+from google.ai import generativelanguage as glm
+import tempfile
+import time
+import os
+import json
+import asyncio
+import edge_tts
+import aiohttp
+from st_audiorec import st_audiorec  
+from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
+import yt_dlp
+import random
+import re
+import math
+import zlib
+from urllib.parse import urlparse, parse_qs
+from PIL import Image
+import PyPDF2
+import hashlib
+import threading
+import sqlite3
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor, wait, as_completed
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import io
+import zipfile
+import shutil
+import datetime
+import subprocess
+import uuid
+from collections import OrderedDict, deque
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+# ==========================================
+# 💾 Memory Vault (မှတ်ဉာဏ်တိုက်)
+# ==========================================
+VAULT_FILE = "muse_memory.json"  # အဟောင်း (JSON) - ပထမဆုံးအကြိမ်တွင် SQLite သို့ ပြောင်းရွှေ့မည်
+VAULT_DB = "muse_memory.db"
+VAULT_PAGE_SIZE = 20
+VAULT_USER = "default"  # Sidebar ရှိ Workspace မှ ပြောင်းလဲသည်
+
+def _open_vault_db():
+    conn = sqlite3.connect(VAULT_DB, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
+
+# 💡 zlib ဖြင့် ချုံ့၍ ပိုမသေးပါက (စာတိုများ) မူရင်း Bytes ကိုသာ compressed = 0 ဖြင့် သိမ်းသည်
+def _pack_blob(raw, level=6):
+    data = zlib.compress(raw, level)
+    return (data, 1) if len(data) < len(raw) else (raw, 0)
+
+def _unpack_blob(data, compressed):
+    return zlib.decompress(data) if compressed else bytes(data)
+
+# 💡 အကြောင်းအရာ တူညီပါက Blob တစ်ခုတည်းကိုသာ မျှဝေသုံးစွဲပြီး zlib ဖြင့် ချုံ့သိမ်းသည်
+def _put_vault_blob(conn, content, level=6):
+    raw = (content or "").encode("utf-8")
+    blob_hash = hashlib.sha256(raw).hexdigest()
+    if not conn.execute("SELECT 1 FROM vault_blobs WHERE hash = ?", (blob_hash,)).fetchone():
+        data, compressed = _pack_blob(raw, level)
+        conn.execute("INSERT OR IGNORE INTO vault_blobs (hash, data, raw_size, stored_size, compressed) VALUES (?, ?, ?, ?, ?)",
+                     (blob_hash, data, len(raw), len(data), compressed))
+    return blob_hash
+
+def _row_content(row):
+    if row["data"] is not None: return _unpack_blob(row["data"], row["compressed"]).decode("utf-8")
+    return row["content"] or ""
+
+VAULT_SELECT = ("SELECT e.id, e.title, e.content, e.type, e.source, e.created_at, b.data, b.compressed "
+                "FROM vault_entries e LEFT JOIN vault_blobs b ON b.hash = e.blob_hash")
+
+def _vault_rows(cursor):
+    rows = []
+    for row in cursor:
+        item = {k: row[k] for k in ("id", "title", "type", "source", "created_at")}
+        item["content"] = _row_content(row)
+        rows.append(item)
+    return rows
+
+def _migrate_json_vault(conn):
+    # 💡 JSON Vault အဟောင်းကို တစ်ကြိမ်တည်း ပြောင်းရွှေ့ခြင်း (Session နှစ်ခု တပြိုင်နက် မလုပ်မိစေရန် IMMEDIATE Lock ယူသည်)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if conn.execute("SELECT 1 FROM vault_meta WHERE key = 'json_migrated'").fetchone() or not os.path.exists(VAULT_FILE):
+            conn.execute("COMMIT")
+            return
+        with open(VAULT_FILE, "r", encoding="utf-8") as f:
+            legacy = json.load(f)
+        base_time = os.path.getmtime(VAULT_FILE) - len(legacy)
+        conn.executemany(
+            "INSERT INTO vault_entries (user_ns, title, content, blob_hash, type, source, created_at) VALUES (?, ?, '', ?, ?, ?, ?)",
+            [("default", item.get("title", ""), _put_vault_blob(conn, item.get("content", "")), item.get("type", ""), "json-import", base_time + i)
+             for i, item in enumerate(legacy)])
+        conn.execute("INSERT INTO vault_meta (key, value) VALUES ('json_migrated', ?)", (str(len(legacy)),))
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    os.replace(VAULT_FILE, VAULT_FILE + ".migrated")
+
+# ==========================================
+# 🔎 Vault Full-Text Index (Burmese + English)
+# ==========================================
+_MY_CHARS = "\u1000-\u109F\uA9E0-\uA9FF\uAA60-\uAA7F"
+_TOKEN_RE = re.compile(f"([{_MY_CHARS}]+)|([^\\W_{_MY_CHARS}]+)")
+# 💡 မြန်မာစာတွင် Space မပါသဖြင့် ဗျည်း (သို့) သရ အစတိုင်းတွင် ဝဏ္ဏ (Syllable) ခွဲသည် (္ နောက်၊ ် / ္ ရှေ့ မဟုတ်လျှင်)
+_MY_SYLLABLE_BREAK = re.compile("(?<!\u1039)([\u1000-\u1021\u1023-\u102A\u103F\u104C-\u104F\u1040-\u1049])(?![\u103A\u1039])")
+_MY_PUNCT = "\u104A\u104B"
+_EN_STOPWORDS = {"the", "a", "an", "and", "or", "of", "to", "in", "on", "for", "is", "are", "was", "it", "this", "that", "with", "as", "at", "by"}
+FIELD_WEIGHTS = {"title": 3.0, "type": 2.0, "content": 1.0}
+
+def burmese_syllables(run):
+    run = re.sub(f"[{_MY_PUNCT}]", " ", run)
+    return _MY_SYLLABLE_BREAK.sub(r" \1", run).split()
+
+def tokenize_text(text, bigrams=True):
+    tokens = []
+    for my_run, word in _TOKEN_RE.findall((text or "").lower()):
+        if word:
+            if word not in _EN_STOPWORDS: tokens.append(word)
+            continue
+        syllables = burmese_syllables(my_run)
+        tokens.extend(syllables)
+        if bigrams: tokens.extend(a + b for a, b in zip(syllables, syllables[1:]))
+    return tokens
+
+def _index_vault_entry(conn, entry_id, title, content, type_tag):
+    scores = {}
+    for field, text in (("title", title), ("type", type_tag), ("content", content)):
+        for term in tokenize_text(text):
+            scores[term] = scores.get(term, 0.0) + FIELD_WEIGHTS[field]
+    # tf ကို Saturate လုပ်၍ စာရှည်များ အမှတ်မကျော်စေရန်
+    conn.executemany("INSERT OR REPLACE INTO vault_terms (term, entry_id, weight) VALUES (?, ?, ?)",
+                     [(term, entry_id, tf * 2.2 / (tf + 1.2)) for term, tf in scores.items()])
+
+def _backfill_vault_index(conn):
+    row = conn.execute("SELECT value FROM vault_meta WHERE key = 'index_upto'").fetchone()
+    indexed_upto = int(row[0]) if row else 0
+    pending = _vault_rows(conn.execute(f"{VAULT_SELECT} WHERE e.id > ? ORDER BY e.id", (indexed_upto,)))
+    if not pending: return
+    with conn:
+        for entry in pending:
+            _index_vault_entry(conn, entry["id"], entry["title"], entry["content"], entry["type"])
+        conn.execute("INSERT OR REPLACE INTO vault_meta (key, value) VALUES ('index_upto', ?)", (str(pending[-1]["id"]),))
+
+@st.cache_resource
+def init_vault():
+    with closing(_open_vault_db()) as conn:
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS vault_entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_ns TEXT NOT NULL DEFAULT 'default',
+                title TEXT NOT NULL,
+                content TEXT,
+                blob_hash TEXT,
+                type TEXT NOT NULL,
+                source TEXT,
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_vault_user_created ON vault_entries (user_ns, created_at);
+            CREATE INDEX IF NOT EXISTS idx_vault_user_type ON vault_entries (user_ns, type, created_at);
+            CREATE INDEX IF NOT EXISTS idx_vault_user_source ON vault_entries (user_ns, source, created_at);
+            CREATE TABLE IF NOT EXISTS vault_meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS vault_blobs (
+                hash TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                raw_size INTEGER NOT NULL,
+                stored_size INTEGER NOT NULL,
+                compressed INTEGER NOT NULL DEFAULT 1
+            );
+            CREATE TABLE IF NOT EXISTS vault_terms (
+                term TEXT NOT NULL,
+                entry_id INTEGER NOT NULL,
+                weight REAL NOT NULL,
+                PRIMARY KEY (term, entry_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_vault_terms_entry ON vault_terms (entry_id);
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                user_ns TEXT NOT NULL DEFAULT 'default',
+                kind TEXT NOT NULL,
+                title TEXT NOT NULL,
+                status TEXT NOT NULL,
+                progress REAL NOT NULL DEFAULT 0,
+                message TEXT,
+                result TEXT,
+                meta TEXT,
+                error TEXT,
+                target TEXT,
+                vault_id INTEGER,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_user_created ON jobs (user_ns, created_at);
+        """)
+        # Blob မပါခင်က ဖန်တီးထားသော DB များအတွက် Column ထပ်တိုးသည် (အဟောင်းများကို compact_vault() က ပြောင်းပေးမည်)
+        columns = [row["name"] for row in conn.execute("PRAGMA table_info(vault_entries)")]
+        if "blob_hash" not in columns: conn.execute("ALTER TABLE vault_entries ADD COLUMN blob_hash TEXT")
+        # compressed Flag မပါခင်က Blob အားလုံးသည် zlib ဖြင့် ချုံ့ထားသဖြင့် Default 1 ဖြစ်သည်
+        if "compressed" not in [row["name"] for row in conn.execute("PRAGMA table_info(vault_blobs)")]:
+            conn.execute("ALTER TABLE vault_blobs ADD COLUMN compressed INTEGER NOT NULL DEFAULT 1")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_vault_blob ON vault_entries (blob_hash)")
+        _migrate_json_vault(conn)
+        _backfill_vault_index(conn)
+    return True
+
+def vault_connect():
+    init_vault()
+    return _open_vault_db()
+
+def _vault_filters(user_ns, type_tag=None, source=None, alias=""):
+    clauses, params = [f"{alias}user_ns = ?"], [user_ns or VAULT_USER]
+    if isinstance(type_tag, (list, tuple)):
+        if type_tag:
+            clauses.append(f"{alias}type IN ({', '.join('?' * len(type_tag))})")
+            params.extend(type_tag)
+    elif type_tag:
+        clauses.append(f"{alias}type = ?")
+        params.append(type_tag)
+    if source:
+        clauses.append(f"{alias}source = ?")
+        params.append(source)
+    return " AND ".join(clauses), params
+
+def load_vault(page=0, page_size=VAULT_PAGE_SIZE, type_tag=None, source=None, user_ns=None):
+    where, params = _vault_filters(user_ns, type_tag, source, alias="e.")
+    with closing(vault_connect()) as conn:
+        return _vault_rows(conn.execute(
+            f"{VAULT_SELECT} WHERE {where} ORDER BY e.created_at DESC, e.id DESC LIMIT ? OFFSET ?",
+            params + [page_size, page * page_size]))
+
+def count_vault(type_tag=None, source=None, user_ns=None):
+    where, params = _vault_filters(user_ns, type_tag, source)
+    with closing(vault_connect()) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM vault_entries WHERE {where}", params).fetchone()[0]
+
+def vault_types(user_ns=None):
+    with closing(vault_connect()) as conn:
+        return [row[0] for row in conn.execute("SELECT DISTINCT type FROM vault_entries WHERE user_ns = ? ORDER BY type", (user_ns or VAULT_USER,))]
+
+def search_vault(query, type_tag=None, page=0, page_size=VAULT_PAGE_SIZE, user_ns=None):
+    terms = tokenize_text(query, bigrams=False)
+    if not terms: return [], 0
+    # 💡 ဝဏ္ဏ/စကားလုံး အားလုံး ပါရမည်၊ Burmese Bigram များသည် အစီအစဉ်မှန်ပါက အမှတ်ပိုပေးသည်
+    required = set(terms)
+    boosters = set(tokenize_text(query)) - required
+    where, params = _vault_filters(user_ns, type_tag, alias="e.")
+    with closing(vault_connect()) as conn:
+        total_docs = conn.execute("SELECT COUNT(*) FROM vault_entries").fetchone()[0] or 1
+        all_terms = list(required | boosters)
+        df = dict(conn.execute(f"SELECT term, COUNT(*) FROM vault_terms WHERE term IN ({', '.join('?' * len(all_terms))}) GROUP BY term", all_terms).fetchall())
+        if any(term not in df for term in required): return [], 0
+        q_rows = [(term, math.log(1 + (total_docs - df[term] + 0.5) / (df[term] + 0.5)), 1 if term in required else 0)
+                  for term in all_terms if term in df]
+        q_values = ", ".join("(?, ?, ?)" for _ in q_rows)
+        q_params = [v for row in q_rows for v in row]
+        matches = f"""
+            WITH q(term, idf, required) AS (VALUES {q_values})
+            SELECT e.id, SUM(t.weight * q.idf) AS score, e.created_at
+            FROM q JOIN vault_terms t ON t.term = q.term JOIN vault_entries e ON e.id = t.entry_id
+            WHERE {where}
+            GROUP BY e.id HAVING SUM(q.required) = {len(required)}
+        """
+        total = conn.execute(f"SELECT COUNT(*) FROM ({matches})", q_params + params).fetchone()[0]
+        ranked = conn.execute(f"{matches} ORDER BY score DESC, e.created_at DESC LIMIT ? OFFSET ?",
+                              q_params + params + [page_size, page * page_size]).fetchall()
+        if not ranked: return [], total
+        ids = [row["id"] for row in ranked]
+        rows = {row["id"]: row for row in _vault_rows(conn.execute(f"{VAULT_SELECT} WHERE e.id IN ({', '.join('?' * len(ids))})", ids))}
+    return [rows[i] for i in ids], total
+
+def _vault_disk_size():
+    return sum(os.path.getsize(VAULT_DB + suffix) for suffix in ("", "-wal", "-shm") if os.path.exists(VAULT_DB + suffix))
+
+def compact_vault():
+    # 💡 Inline စာသားများကို Blob သို့ ပြောင်း၊ မသုံးတော့သော Blob များဖျက်၊ အမြင့်ဆုံး ချုံ့ပြီး VACUUM လုပ်သည်
+    legacy_size = os.path.getsize(VAULT_FILE) if os.path.exists(VAULT_FILE) else 0
+    size_before = _vault_disk_size() + legacy_size
+    with closing(vault_connect()) as conn:
+        with conn:
+            inline_rows = conn.execute("SELECT id, content FROM vault_entries WHERE blob_hash IS NULL").fetchall()
+            for row in inline_rows:
+                conn.execute("UPDATE vault_entries SET blob_hash = ?, content = '' WHERE id = ?",
+                             (_put_vault_blob(conn, row["content"], level=9), row["id"]))
+            orphans = conn.execute("DELETE FROM vault_blobs WHERE hash NOT IN (SELECT blob_hash FROM vault_entries WHERE blob_hash IS NOT NULL)").rowcount
+            for row in conn.execute("SELECT hash, data, stored_size, compressed FROM vault_blobs").fetchall():
+                data, compressed = _pack_blob(_unpack_blob(row["data"], row["compressed"]), 9)
+                if len(data) < row["stored_size"]:
+                    conn.execute("UPDATE vault_blobs SET data = ?, stored_size = ?, compressed = ? WHERE hash = ?", (data, len(data), compressed, row["hash"]))
+        stats = conn.execute("""
+            SELECT (SELECT COUNT(*) FROM vault_entries) AS entries, COUNT(*) AS blobs,
+                   COALESCE(SUM(raw_size), 0) AS raw_bytes, COALESCE(SUM(stored_size), 0) AS stored_bytes
+            FROM vault_blobs""").fetchone()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+    size_after = _vault_disk_size()
+    return {"before": size_before, "after": size_after, "saved": size_before - size_after, "moved_inline": len(inline_rows),
+            "orphans_removed": orphans, "entries": stats["entries"], "unique_blobs": stats["blobs"],
+            "raw_bytes": stats["raw_bytes"], "stored_bytes": stats["stored_bytes"]}
+
+def save_to_vault(title, content, type_tag, source=None, user_ns=None):
+    with closing(vault_connect()) as conn, conn:
+        cur = conn.execute(
+            "INSERT INTO vault_entries (user_ns, title, content, blob_hash, type, source, created_at) VALUES (?, ?, '', ?, ?, ?, ?)",
+            (user_ns or VAULT_USER, title, _put_vault_blob(conn, content), type_tag, source, time.time()))
+        _index_vault_entry(conn, cur.lastrowid, title, content, type_tag)
+        conn.execute("INSERT OR REPLACE INTO vault_meta (key, value) VALUES ('index_upto', MAX(?, CAST(COALESCE((SELECT value FROM vault_meta WHERE key = 'index_upto'), 0) AS INTEGER)))", (cur.lastrowid,))
+        return cur.lastrowid
+
+# ==========================================
+# 🚀 1. SYSTEM CONFIGURATION
+# ==========================================
+st.set_page_config(page_title="Universal Studio AI", page_icon="🎬", layout="wide")
+
+# ==========================================
+# 🛠️ 2. CORE HELPER FUNCTIONS
+# ==========================================
+
+# ==========================================
+# ♻️ Response Cache (Memory LRU + Disk)
+# ==========================================
+CACHE_DIR = ".muse_cache"
+MODELS_TO_TRY = ["models/gemini-2.5-flash", "models/gemini-2.5-pro", "models/gemini-2.0-flash", "models/gemini-flash-latest"]
+GEN_CONFIG = {"temperature": 0.7, "max_output_tokens": 8192}
+USE_RESPONSE_CACHE = True  # Sidebar ခလုတ်မှ ပြောင်းလဲသည်
+
+def make_cache_key(*parts):
+    raw = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+class TieredCache:
+    # 💡 Hot entries live in an in-process LRU, everything is also persisted as JSON on disk
+    def __init__(self, name, ttl=6 * 3600, max_items=256, max_disk_mb=200):
+        self.dir = os.path.join(CACHE_DIR, name)
+        os.makedirs(self.dir, exist_ok=True)
+        self.ttl = ttl
+        self.max_items = max_items
+        self.max_disk_bytes = max_disk_mb * 1024 * 1024
+        self.mem = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = self.disk_hits = self.misses = 0
+        self._writes = 0
+
+    def _path(self, key):
+        return os.path.join(self.dir, f"{key}.json")
+
+    def _remember(self, key, expires, value):
+        self.mem[key] = (expires, value)
+        self.mem.move_to_end(key)
+        while len(self.mem) > self.max_items:
+            self.mem.popitem(last=False)
+
+    def get(self, key):
+        now = time.time()
+        with self.lock:
+            if key in self.mem:
+                expires, value = self.mem[key]
+                if expires > now:
+                    self.mem.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self.mem[key]
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+            if record["expires"] > now:
+                os.utime(path)  # Disk LRU အတွက် mtime ကို update လုပ်သည်
+                with self.lock:
+                    self._remember(key, record["expires"], record["value"])
+                    self.hits += 1
+                    self.disk_hits += 1
+                return record["value"]
+            os.remove(path)
+        except (OSError, ValueError, KeyError):
+            pass
+        with self.lock:
+            self.misses += 1
+        return None
+
+    def set(self, key, value, ttl=None):
+        expires = time.time() + (ttl or self.ttl)
+        with self.lock:
+            self._remember(key, expires, value)
+            self._writes += 1
+            run_eviction = self._writes % 20 == 0
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"expires": expires, "value": value}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path): os.remove(tmp_path)
+        if run_eviction: self.evict_disk()
+
+    def evict_disk(self):
+        now = time.time()
+        files = []
+        for fname in os.listdir(self.dir):
+            if not fname.endswith(".json"): continue
+            path = os.path.join(self.dir, fname)
+            try:
+                st_info = os.stat(path)
+                with open(path, "r", encoding="utf-8") as f:
+                    expired = json.load(f)["expires"] <= now
+            except (OSError, ValueError, KeyError):
+                expired, st_info = True, None
+            if expired:
+                try: os.remove(path)
+                except OSError: pass
+            else:
+                files.append((st_info.st_mtime, st_info.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes: break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError: pass
+
+    def clear(self):
+        with self.lock:
+            self.mem.clear()
+            self.hits = self.disk_hits = self.misses = 0
+        for fname in os.listdir(self.dir):
+            try: os.remove(os.path.join(self.dir, fname))
+            except OSError: pass
+
+    def stats(self):
+        with self.lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                    "hit_rate": (self.hits / total) if total else 0.0, "mem_items": len(self.mem)}
+
+@st.cache_resource
+def get_response_cache():
+    return TieredCache("responses", ttl=24 * 3600, max_items=256, max_disk_mb=200)
+
+# 💡 Upload လုပ်ထားသော ဖိုင် / ပုံ တို့ကို အကြောင်းအရာအလိုက် ခွဲခြားသိရှိရန်
+def media_fingerprint(media_file):
+    if media_file is None: return None
+    sha = getattr(media_file, "sha256_hash", None)
+    if sha: return f"file:{sha}"
+    if isinstance(media_file, Image.Image):
+        return f"image:{media_file.mode}:{media_file.size}:{hashlib.sha256(media_file.tobytes()).hexdigest()}"
+    if isinstance(media_file, (bytes, bytearray)):
+        return f"bytes:{hashlib.sha256(media_file).hexdigest()}"
+    return None
+
+def response_cache_key(prompt, media_file=None):
+    media_id = media_fingerprint(media_file)
+    if media_file is not None and media_id is None: return None
+    return make_cache_key(MODELS_TO_TRY, GEN_CONFIG, prompt, media_id)
+
+# ==========================================
+# 🩺 Model Health & Circuit Breaker
+# ==========================================
+AVAILABLE_MODELS = None  # list_models() ရလဒ် (Sidebar တွင် Cache လုပ်ထားသည်)
+
+def classify_model_error(e):
+    msg = str(e).lower()
+    if "api key" in msg or isinstance(e, (exceptions.PermissionDenied, exceptions.Unauthenticated)): return "auth"
+    if isinstance(e, (exceptions.ResourceExhausted, exceptions.TooManyRequests)) or "429" in msg or "quota" in msg: return "quota"
+    if isinstance(e, (exceptions.InvalidArgument, exceptions.NotFound, exceptions.FailedPrecondition)): return "invalid_argument"
+    return "transient"
+
+class ModelHealthRegistry:
+    # 💡 Failing models are skipped for an exponentially growing cool-down, then probed in the background
+    def __init__(self, base_cooldown=15, quota_cooldown=60, max_cooldown=900, window=40):
+        self.base_cooldown = base_cooldown
+        self.quota_cooldown = quota_cooldown
+        self.max_cooldown = max_cooldown
+        self.window = window
+        self.lock = threading.Lock()
+        self.models = {}
+
+    def _state(self, model_name):
+        if model_name not in self.models:
+            self.models[model_name] = {"failures": 0, "open_until": 0.0, "latencies": deque(maxlen=self.window),
+                                       "last_kind": None, "last_error": None, "probing": False}
+        return self.models[model_name]
+
+    def record_success(self, model_name, latency):
+        with self.lock:
+            state = self._state(model_name)
+            state["failures"] = 0
+            state["open_until"] = 0.0
+            state["latencies"].append(latency)
+
+    def record_failure(self, model_name, kind, error):
+        with self.lock:
+            state = self._state(model_name)
+            state["last_kind"] = kind
+            state["last_error"] = str(error)[:300]
+            # Prompt မှားခြင်း / Key မှားခြင်းသည် Model ချို့ယွင်းခြင်း မဟုတ်သဖြင့် Circuit မဖွင့်ပါ
+            if kind in ("invalid_argument", "auth"): return
+            state["failures"] += 1
+            base = self.quota_cooldown if kind == "quota" else self.base_cooldown
+            cooldown = min(self.max_cooldown, base * 2 ** (state["failures"] - 1))
+            state["open_until"] = time.time() + cooldown
+
+    def percentile(self, model_name, q):
+        with self.lock:
+            samples = sorted(self._state(model_name)["latencies"])
+        if not samples: return None
+        return samples[min(len(samples) - 1, int(round(q * (len(samples) - 1))))]
+
+    def route(self, models):
+        # Healthy models: measured models swap places by rolling p50 (fastest first), unmeasured models keep their preference slot
+        # Open circuits: kept as a last resort, the one cooling down soonest first
+        now = time.time()
+        with self.lock:
+            states = {m: self._state(m) for m in models}
+        healthy = [m for m in models if states[m]["open_until"] <= now]
+        tripped = [m for m in models if states[m]["open_until"] > now]
+        p50 = {m: self.percentile(m, 0.5) for m in healthy}
+        slots = [i for i, m in enumerate(healthy) if p50[m] is not None]
+        for i, m in zip(slots, sorted((healthy[i] for i in slots), key=lambda m: (p50[m], models.index(m)))): healthy[i] = m
+        tripped.sort(key=lambda m: states[m]["open_until"])
+        return healthy + tripped
+
+    def probe_candidates(self):
+        now = time.time()
+        with self.lock:
+            ready = [m for m, state in self.models.items() if state["failures"] and state["open_until"] <= now and not state["probing"]]
+            for m in ready: self.models[m]["probing"] = True
+        return ready
+
+    def probe(self, model_name):
+        started = time.time()
+        try:
+            genai.GenerativeModel(model_name).generate_content("ping", generation_config={"max_output_tokens": 1})
+            self.record_success(model_name, time.time() - started)
+        except Exception as e:
+            self.record_failure(model_name, classify_model_error(e), e)
+        finally:
+            with self.lock: self._state(model_name)["probing"] = False
+
+    def snapshot(self):
+        with self.lock:
+            names = list(self.models)
+        rows = []
+        for m in names:
+            with self.lock:
+                state = dict(self.models[m])
+            rows.append({"model": m, "open": state["open_until"] > time.time(), "failures": state["failures"],
+                         "p50": self.percentile(m, 0.5), "p95": self.percentile(m, 0.95),
+                         "last_kind": state["last_kind"], "last_error": state["last_error"]})
+        return rows
+
+def _health_probe_loop(registry, interval=20):
+    while True:
+        time.sleep(interval)
+        for model_name in registry.probe_candidates():
+            registry.probe(model_name)
+
+@st.cache_resource
+def get_model_health():
+    registry = ModelHealthRegistry()
+    threading.Thread(target=_health_probe_loop, args=(registry,), daemon=True, name="model-health-probe").start()
+    return registry
+
+@st.cache_data(ttl=600, show_spinner=False)
+def list_available_models(key_fingerprint):
+    # key_fingerprint သည် Cache ကို API Key အလိုက် ခွဲရန်သာ ဖြစ်သည်
+    return sorted(m.name for m in genai.list_models() if "generateContent" in m.supported_generation_methods)
+
+def key_fingerprint(key):
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+def candidate_models():
+    models = MODELS_TO_TRY
+    if AVAILABLE_MODELS:
+        models = [m for m in MODELS_TO_TRY if m in AVAILABLE_MODELS] or MODELS_TO_TRY
+    return get_model_health().route(models)
+
+def format_model_errors(errors):
+    if any("[auth]" in e for e in errors):
+        return "⚠️ Error: API Key မှားယွင်းနေပါသည် (သို့) ခွင့်ပြုချက် မရှိပါ။ Check API Key.\nLogs:\n" + "\n".join(errors)
+    return "⚠️ Error: All models failed.\nLogs:\n" + "\n".join(errors)
+
+def generate_content_safe(prompt, media_file=None, use_cache=None):
+    if use_cache is None: use_cache = USE_RESPONSE_CACHE
+    cache = get_response_cache()
+    cache_key = response_cache_key(prompt, media_file) if use_cache else None
+    if cache_key:
+        cached = cache.get(cache_key)
+        if cached is not None: return cached["text"]
+
+    health = get_model_health()
+    errors = []
+    for m in candidate_models():
+        started = time.time()
+        try:
+            model = genai.GenerativeModel(m)
+            if media_file: text = model.generate_content([media_file, prompt], generation_config=GEN_CONFIG).text
+            else: text = model.generate_content(prompt, generation_config=GEN_CONFIG).text
+            health.record_success(m, time.time() - started)
+            if cache_key: cache.set(cache_key, {"text": text, "model": m})
+            return text
+        except Exception as e:
+            kind = classify_model_error(e)
+            health.record_failure(m, kind, e)
+            errors.append(f"{m} [{kind}]: {str(e)}")
+            if kind == "auth": break  # Key မှားလျှင် ကျန် Model များလည်း ကျရှုံးမည်သာ
+            continue 
+    return format_model_errors(errors)
+
+# ==========================================
+# 🔁 Background Async Runtime
+# ==========================================
+ASYNC_LLM_CONCURRENCY = 4
+
+class AsyncRuntime:
+    # 💡 Process တစ်ခုလုံးတွင် Event Loop တစ်ခုတည်းကို သီးခြား Thread ပေါ်တွင် အမြဲ Run ထားပြီး Async အလုပ်အားလုံးကို ဤနေရာသို့ ပို့သည်
+    # (Script Thread ပေါ်တွင် run_until_complete မလုပ်တော့သဖြင့် Rerun / Session အကြား Loop ပြဿနာ မရှိတော့ပါ)
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._http = None
+        self._llm_sem = None
+        ready = threading.Event()
+        def run():
+            asyncio.set_event_loop(self.loop)
+            self.loop.call_soon(ready.set)
+            self.loop.run_forever()
+        threading.Thread(target=run, daemon=True, name="muse-asyncio").start()
+        ready.wait()
+
+    def submit(self, coro):
+        # concurrent.futures.Future ကို ပြန်ပေးသဖြင့် UI ဘက်မှ done() / result() ဖြင့် စစ်နိုင်သည်
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout=None):
+        return self.submit(coro).result(timeout)
+
+    def http(self):
+        # aiohttp (edge-tts ၏ Dependency) Session ကို Loop ပေါ်တွင်သာ ဖန်တီး၍ Connection များ ပြန်သုံးသည်
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=15))
+        return self._http
+
+    def llm_semaphore(self):
+        if self._llm_sem is None: self._llm_sem = asyncio.Semaphore(ASYNC_LLM_CONCURRENCY)
+        return self._llm_sem
+
+@st.cache_resource
+def get_async_runtime():
+    return AsyncRuntime()
+
+def track_async_job(label, future):
+    # 💡 Session တစ်ခုတွင် Async Job အများအပြား တပြိုင်နက် Run နိုင်ပြီး Handle ကို Session State တွင် မှတ်ထားသည်
+    jobs = st.session_state.setdefault("async_jobs", {})
+    job_id = f"{int(time.time() * 1000)}-{len(jobs)}"
+    jobs[job_id] = {"label": label, "future": future, "started": time.time()}
+    future.add_done_callback(lambda f: jobs[job_id].setdefault("finished", time.time()))
+    return job_id
+
+def async_job_status(job):
+    future = job["future"]
+    if not future.done(): return "running"
+    return "failed" if future.exception() else "done"
+
+def generate_content_async(prompt, media_file=None, use_cache=None):
+    # generate_content_safe ၏ Async မူ (Model Fallback, Health, Response Cache တူညီသည်)
+    # 💡 cache_resource များနှင့် Model စာရင်းကို ခေါ်သည့် Script Thread ပေါ်တွင်သာ ယူပြီး Loop ပေါ်တွင် Run မည့် Coroutine ကို ပြန်ပေးသည်
+    if use_cache is None: use_cache = USE_RESPONSE_CACHE
+    cache, health, runtime = get_response_cache(), get_model_health(), get_async_runtime()
+    cache_key = response_cache_key(prompt, media_file) if use_cache else None
+    models = candidate_models()
+
+    async def run():
+        if cache_key:
+            cached = cache.get(cache_key)
+            if cached is not None: return cached["text"]
+        errors = []
+        async with runtime.llm_semaphore():
+            for m in models:
+                started = time.time()
+                try:
+                    model = genai.GenerativeModel(m)
+                    response = await model.generate_content_async([media_file, prompt] if media_file else prompt, generation_config=GEN_CONFIG)
+                    text = response.text
+                    health.record_success(m, time.time() - started)
+                    if cache_key: cache.set(cache_key, {"text": text, "model": m})
+                    return text
+                except Exception as e:
+                    kind = classify_model_error(e)
+                    health.record_failure(m, kind, e)
+                    errors.append(f"{m} [{kind}]: {str(e)}")
+                    if kind == "auth": break
+        return format_model_errors(errors)
+    return run()
+
+# ==========================================
+# ⚡ Streaming Generation (Time-to-First-Token)
+# ==========================================
+@st.cache_resource
+def get_generation_metrics():
+    return {"lock": threading.Lock(), "calls": deque(maxlen=50)}
+
+def record_generation_metric(model_name, ttft, total):
+    metrics = get_generation_metrics()
+    with metrics["lock"]:
+        metrics["calls"].append({"model": model_name, "ttft": ttft, "total": total, "at": time.time()})
+
+def generate_content_stream(prompt, media_file=None, use_cache=None):
+    if use_cache is None: use_cache = USE_RESPONSE_CACHE
+    cache = get_response_cache()
+    cache_key = response_cache_key(prompt, media_file) if use_cache else None
+    if cache_key:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            record_generation_metric("cache", 0.0, 0.0)
+            yield cached["text"]
+            return
+
+    health = get_model_health()
+    errors = []
+    for m in candidate_models():
+        started = time.time()
+        ttft = None
+        parts = []
+        try:
+            model = genai.GenerativeModel(m)
+            contents = [media_file, prompt] if media_file else prompt
+            for chunk in model.generate_content(contents, generation_config=GEN_CONFIG, stream=True):
+                try: piece = chunk.text
+                except ValueError: continue  # Safety filter ကြောင့် စာသားမပါသော chunk
+                if not piece: continue
+                if ttft is None: ttft = time.time() - started
+                parts.append(piece)
+                yield piece
+        except Exception as e:
+            # 💡 စာသား ထွက်ပြီးမှ ပြတ်သွားပါက နောက် Model သို့ ပြောင်း၍ မရတော့ပါ (စာသား ထပ်နေမည်ဖြစ်သောကြောင့်)
+            kind = classify_model_error(e)
+            health.record_failure(m, kind, e)
+            if parts:
+                record_generation_metric(m, ttft, time.time() - started)
+                yield f"\n\n⚠️ Stream interrupted ({m}): {e}"
+                return
+            errors.append(f"{m} [{kind}]: {str(e)}")
+            if kind == "auth": break
+            continue
+        if not parts:
+            errors.append(f"{m} [transient]: empty response")
+            continue
+        health.record_success(m, time.time() - started)
+        record_generation_metric(m, ttft, time.time() - started)
+        if cache_key: cache.set(cache_key, {"text": "".join(parts), "model": m})
+        return
+    yield format_model_errors(errors)
+
+# 💡 စာသားများကို ထွက်လာသည်နှင့် ပြသပြီး၊ ပြီးဆုံးပါက Session State ထဲ သိမ်းထားရန်
+def stream_to_state(state_key, prompt, media_file=None):
+    placeholder = st.empty()
+    text = placeholder.write_stream(generate_content_stream(prompt, media_file))
+    if not isinstance(text, str): text = "".join(str(t) for t in text)
+    placeholder.empty()
+    st.session_state[state_key] = text
+    return text
+
+# ==========================================
+# 🧠 Gemini Context Cache (Multi-Style Runs)
+# ==========================================
+CONTEXT_CACHE_TTL = 20 * 60
+CONTEXT_CACHE_MIN_TOKENS = 1024  # ဤထက်နည်းပါက Gemini က Context Cache မဖန်တီးပေးပါ
+MULTI_STYLE_WORKERS = 4
+
+class ContextCacheRegistry:
+    def __init__(self, keyring):
+        self.keyring = keyring
+        self.lock = threading.Lock()
+        self.entries = {}  # (key_fp, content_id) -> {"name", "model", "expires"}
+
+    def lookup(self, key_fp, content_id):
+        with self.lock:
+            entry = self.entries.get((key_fp, content_id))
+            return dict(entry) if entry and entry["expires"] - time.time() > 60 else None
+
+    def register(self, key_fp, content_id, name, model_name):
+        with self.lock:
+            self.entries[(key_fp, content_id)] = {"name": name, "model": model_name, "expires": time.time() + CONTEXT_CACHE_TTL}
+
+    def touch(self, key_fp, content_id):
+        with self.lock:
+            if (key_fp, content_id) in self.entries: self.entries[(key_fp, content_id)]["expires"] = time.time() + CONTEXT_CACHE_TTL
+
+    def forget(self, key_fp, content_id):
+        with self.lock: return self.entries.pop((key_fp, content_id), None)
+
+    def cleanup(self):
+        now, removed = time.time(), 0
+        with self.lock:
+            stale = [k for k, e in self.entries.items() if e["expires"] <= now]
+            stale = [(k, self.entries.pop(k)) for k in stale]
+        for (key_fp, _), entry in stale:
+            if self._delete(key_fp, entry): removed += 1
+        return removed
+
+    def _delete(self, key_fp, entry):
+        # Cache ဖန်တီးခဲ့သည့် Key ၏ Client ဖြင့် ဖျက်သည်
+        client = self.keyring.client(key_fp, "Cache")
+        if client is None: return False
+        try:
+            client.delete_cached_content(name=entry["name"])
+            return True
+        except Exception:
+            return False  # TTL ကုန်၍ Gemini ဘက်မှ ဖျက်ပြီးသား ဖြစ်နိုင်သည်
+
+    def release(self, key_fp, content_id):
+        # 💡 Multi-Style Run ပြီးသည်နှင့် TTL ကုန်သည်အထိ Storage ခ မပေးရစေရန် ချက်ချင်း ဖျက်သည်
+        entry = self.forget(key_fp, content_id)
+        return bool(entry) and self._delete(key_fp, entry)
+
+def _context_cache_cleanup_loop(registry, interval=300):
+    while True:
+        time.sleep(interval)
+        registry.cleanup()
+
+@st.cache_resource
+def get_context_registry():
+    registry = ContextCacheRegistry(get_genai_keyring())
+    threading.Thread(target=_context_cache_cleanup_loop, args=(registry,), daemon=True, name="gemini-context-cleanup").start()
+    return registry
+
+def get_context_cache(content_id, contents):
+    # 💡 Media / YouTube Data ကို တစ်ကြိမ်သာ Cache လုပ်ပြီး Style တိုင်းတွင် Input Token ထပ်မပို့ရ
+    registry = get_context_registry()
+    entry = registry.lookup(GENAI_KEY_FP, content_id)
+    if entry:
+        try:
+            cached = genai.caching.CachedContent.get(entry["name"])
+            cached.update(ttl=datetime.timedelta(seconds=CONTEXT_CACHE_TTL))
+            registry.touch(GENAI_KEY_FP, content_id)
+            return cached
+        except Exception:
+            registry.forget(GENAI_KEY_FP, content_id)
+    errors = []
+    for m in candidate_models():
+        try:
+            cached = genai.caching.CachedContent.create(model=m, contents=contents, display_name=f"muse-{content_id[:40]}",
+                                                        ttl=datetime.timedelta(seconds=CONTEXT_CACHE_TTL))
+            registry.register(GENAI_KEY_FP, content_id, cached.name, m)
+            return cached
+        except Exception as e:
+            kind = classify_model_error(e)
+            errors.append(f"{m} [{kind}]: {str(e)[:150]}")
+            if kind == "auth": break
+    raise RuntimeError(format_model_errors(errors))
+
+def generate_from_context(cached, content_id, prompt, use_cache=None):
+    if use_cache is None: use_cache = USE_RESPONSE_CACHE
+    cache = get_response_cache()
+    cache_key = make_cache_key("context", content_id, prompt) if use_cache else None
+    if cache_key:
+        hit = cache.get(cache_key)
+        if hit is not None: return hit["text"]
+    health = get_model_health()
+    started = time.time()
+    try:
+        text = genai.GenerativeModel.from_cached_content(cached).generate_content(prompt, generation_config=GEN_CONFIG).text
+    except Exception as e:
+        health.record_failure(cached.model, classify_model_error(e), e)
+        raise
+    health.record_success(cached.model, time.time() - started)
+    if cache_key: cache.set(cache_key, {"text": text, "model": cached.model})
+    return text
+
+def run_multi_style(content_id, contents, prompts, fallback, on_progress=None):
+    # 💡 Context Cache ဖန်တီး၍ မရပါက (Token နည်းလွန်းခြင်း၊ Model မထောက်ပံ့ခြင်း) ပုံမှန်နည်းဖြင့် အပြိုင် Generate လုပ်သည်
+    cached, cache_note = None, "Context သေးလွန်းသဖြင့် Cache မလိုပါ"
+    if contents:
+        try: cached, cache_note = get_context_cache(content_id, contents), None
+        except Exception as e: cache_note = str(e).splitlines()[0]
+    def run_one(prompt):
+        if cached is not None:
+            try: return generate_from_context(cached, content_id, prompt)
+            except Exception: pass
+        return fallback(prompt)
+    pool = ThreadPoolExecutor(max_workers=MULTI_STYLE_WORKERS, thread_name_prefix="muse-multi")
+    try:
+        futures = {ctx_submit(pool, run_one, prompt): style for style, prompt in prompts.items()}
+        results = {}
+        for done_count, future in enumerate(as_completed(futures), 1):
+            results[futures[future]] = future.result()
+            if on_progress: on_progress(done_count, len(prompts))
+    finally:
+        pool.shutdown(wait=False)
+        if cached is not None: get_context_registry().release(GENAI_KEY_FP, content_id)
+    return {style: results[style] for style in prompts}, cached is not None, cache_note
+
+def render_multi_results(results, key_prefix, title, vault_source):
+    tabs = st.tabs(list(results))
+    for i, (tab, (style, text)) in enumerate(zip(tabs, results.items())):
+        with tab:
+            st.code(text, language="markdown")
+            c1, c2, c3 = st.columns(3)
+            with c1:
+                if st.button("📲 AI TTS သို့ ပို့ရန် (Tab 6)", key=f"{key_prefix}_tts_{i}", use_container_width=True):
+                    st.session_state.tts_text_area = text
+                    st.success("✅ Tab 6 သို့ ရောက်သွားပါပြီ!")
+            with c2:
+                if st.button("💾 မှတ်ဉာဏ်တိုက်သို့ သိမ်းမည်", key=f"{key_prefix}_vault_{i}", use_container_width=True):
+                    save_to_vault(title, text, style, source=vault_source)
+                    st.success("✅ မှတ်ဉာဏ်တိုက်တွင် သိမ်းဆည်းပြီးပါပြီ!")
+            with c3:
+                file_ext = "srt" if text.lstrip().startswith("1\n") else "txt"
+                st.download_button(f"📥 Download (.{file_ext})", data=text, file_name=f"{key_prefix}_{i + 1}_{int(time.time())}.{file_ext}",
+                                   key=f"{key_prefix}_dl_{i}", use_container_width=True)
+
+# ==========================================
+# 🎞️ Subtitle Engine (SRT / WebVTT)
+# ==========================================
+SUB_MAX_CHARS = 42     # တစ်ကြောင်းလျှင် အများဆုံး စာလုံးရေ
+SUB_MAX_LINES = 2
+SUB_MAX_CPS = 17       # တစ်စက္ကန့်လျှင် ဖတ်နိုင်သော စာလုံးရေ (Reading Speed)
+SUB_MIN_DURATION = 1.0
+SUB_MAX_DURATION = 7.0
+
+def _subtitle_atoms(text, width):
+    # 💡 Space ဖြင့် ခွဲပြီး၊ ရှည်လွန်းသော မြန်မာစကားလုံးများကို ဝဏ္ဏအလိုက် ထပ်ခွဲသည် (joiner, atom)
+    atoms = []
+    for word in text.split():
+        if len(word) > width and re.search(f"[{_MY_CHARS}]", word):
+            syllables = [syl for syl in _MY_SYLLABLE_BREAK.sub("\x00\\1", word).split("\x00") if syl]
+            atoms.extend((" " if i == 0 else "", syl) for i, syl in enumerate(syllables))
+        else:
+            atoms.append((" ", word))
+    return atoms
+
+def _pack_atoms(atoms, width):
+    lines, current = [], ""
+    for joiner, atom in atoms:
+        candidate = f"{current}{joiner}{atom}" if current else atom
+        if current and len(candidate) > width:
+            lines.append(current)
+            current = atom
+        else:
+            current = candidate
+    if current: lines.append(current)
+    return lines
+
+def wrap_subtitle_text(text, max_chars=SUB_MAX_CHARS):
+    return _pack_atoms(_subtitle_atoms(text, max_chars), max_chars)
+
+def build_subtitle_cues(segments, max_chars=SUB_MAX_CHARS, max_lines=SUB_MAX_LINES, max_cps=SUB_MAX_CPS,
+                        min_duration=SUB_MIN_DURATION, max_duration=SUB_MAX_DURATION):
+    # 1) Segment များကို သန့်စင်ပြီး ထပ်နေသော အချိန်များကို ဖြတ်သည်
+    items = []
+    for seg in segments:
+        text = " ".join(str(seg["text"]).replace("\n", " ").split())
+        if text: items.append({"start": float(seg["start"]), "end": float(seg["start"]) + float(seg.get("duration") or 0), "text": text})
+    items.sort(key=lambda c: c["start"])
+    for cur, nxt in zip(items, items[1:]):
+        cur["end"] = min(max(cur["end"], cur["start"] + 0.3), nxt["start"]) if nxt["start"] > cur["start"] else cur["end"]
+
+    # 2) အရှည်ကြီး / ကြာလွန်းသော Segment များကို စာလုံးရေ အချိုးအလိုက် အချိန်ခွဲ၍ ဖြတ်သည်
+    block_chars = max_chars * max_lines
+    split_items = []
+    for item in items:
+        duration = max(item["end"] - item["start"], 0.001)
+        lines = wrap_subtitle_text(item["text"], max_chars)
+        pieces_needed = max((len(lines) + max_lines - 1) // max_lines, math.ceil(duration / max_duration))
+        if pieces_needed <= 1:
+            split_items.append(item)
+            continue
+        target = max(1, math.ceil(len(item["text"]) / pieces_needed))
+        pieces = _pack_atoms(_subtitle_atoms(item["text"], min(target, block_chars)), min(target, block_chars))
+        total_chars = sum(len(piece) for piece in pieces) or 1
+        cursor = item["start"]
+        for piece in pieces:
+            piece_duration = duration * len(piece) / total_chars
+            split_items.append({"start": cursor, "end": cursor + piece_duration, "text": piece})
+            cursor += piece_duration
+
+    # 3) တိုလွန်းသော Cue များကို စာကြောင်း/အချိန်/ဖတ်နှုန်း ကန့်သတ်ချက်အတွင်း ပေါင်းသည်
+    cues = []
+    for item in split_items:
+        if cues:
+            prev = cues[-1]
+            merged_text = f"{prev['text']} {item['text']}"
+            merged_duration = item["end"] - prev["start"]
+            fits = len(wrap_subtitle_text(merged_text, max_chars)) <= max_lines and merged_duration <= max_duration
+            readable = len(merged_text) / max(merged_duration, 0.001) <= max_cps
+            if fits and readable and item["start"] - prev["end"] < 0.5:
+                prev.update(end=item["end"], text=merged_text)
+                continue
+        cues.append(dict(item))
+
+    # 4) ဖတ်ရန် အချိန်မလောက်သော Cue များကို နောက် Cue မတိုင်ခင်အထိ ဆွဲဆန့်သည်
+    for i, cue in enumerate(cues):
+        needed = max(min_duration, len(cue["text"]) / max_cps)
+        limit = cues[i + 1]["start"] if i + 1 < len(cues) else cue["start"] + max(needed, max_duration)
+        if cue["end"] - cue["start"] < needed: cue["end"] = min(cue["start"] + needed, limit)
+        cue["lines"] = wrap_subtitle_text(cue["text"], max_chars)
+    return cues
+
+def format_timecode(seconds, sep=","):
+    ms = int(round(max(seconds, 0) * 1000))
+    return f"{ms // 3600000:02d}:{ms // 60000 % 60:02d}:{ms // 1000 % 60:02d}{sep}{ms % 1000:03d}"
+
+def cues_to_srt(cues):
+    return "\n".join(f"{i}\n{format_timecode(c['start'])} --> {format_timecode(c['end'])}\n" + "\n".join(c["lines"]) + "\n"
+                     for i, c in enumerate(cues, 1))
+
+def cues_to_vtt(cues):
+    return "WEBVTT\n\n" + "\n".join(f"{format_timecode(c['start'], '.')} --> {format_timecode(c['end'], '.')}\n" + "\n".join(c["lines"]) + "\n"
+                                      for c in cues)
+
+# ==========================================
+# 📤 Gemini Media Upload (Deduplicated by SHA-256)
+# ==========================================
+UPLOAD_CHUNK_BYTES = 8 * 1024 * 1024
+UPLOAD_POLL_TIMEOUT = 600
+REMOTE_FILE_IDLE = 6 * 3600     # ၆ နာရီ မသုံးပါက Remote ဖိုင်ကို ဖျက်မည်
+REMOTE_FILE_MAX_AGE = 46 * 3600  # Gemini သည် ၄၈ နာရီအကြာတွင် ဖျက်သဖြင့် ထိုမတိုင်မီ Registry မှ ဖယ်သည်
+MEDIA_MIME_TYPES = {
+    "mp4": "video/mp4", "mov": "video/quicktime", "avi": "video/x-msvideo",
+    "mp3": "audio/mpeg", "wav": "audio/wav", "m4a": "audio/mp4", "ogg": "audio/ogg",
+}
+GENAI_KEY_FP = None  # လက်ရှိ API Key ၏ Fingerprint (Sidebar တွင် သတ်မှတ်သည်)
+
+class GenaiKeyring:
+    # 💡 genai.configure သည် Process တစ်ခုလုံးအတွက် Key တစ်ခုသာ ဖြစ်သဖြင့် Background Cleanup များက
+    # Remote ဖိုင် / Cache ကို ဖန်တီးခဲ့သည့် Key ၏ ကိုယ်ပိုင် Client ဖြင့်သာ ဖျက်နိုင်ရန် Key များကို မှတ်ထားသည်
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.keys, self.clients = {}, {}
+
+    def remember(self, api_key):
+        key_fp = key_fingerprint(api_key)
+        with self.lock: self.keys[key_fp] = api_key
+        return key_fp
+
+    def client(self, key_fp, service):
+        # service = "File" / "Cache" (glm.FileServiceClient / glm.CacheServiceClient)
+        with self.lock:
+            if key_fp not in self.keys: return None
+            if (key_fp, service) not in self.clients:
+                self.clients[(key_fp, service)] = getattr(glm, f"{service}ServiceClient")(client_options={"api_key": self.keys[key_fp]})
+            return self.clients[(key_fp, service)]
+
+@st.cache_resource
+def get_genai_keyring():
+    return GenaiKeyring()
+
+def hash_upload(media_file):
+    # 💡 getvalue() ဖြင့် Copy ထပ်မလုပ်ဘဲ Chunk လိုက် ဖတ်၍ SHA-256 တွက်သည်
+    if isinstance(media_file, str):
+        with open(media_file, "rb") as f: return hash_upload(f)
+    sha = hashlib.sha256()
+    media_file.seek(0)
+    for chunk in iter(lambda: media_file.read(UPLOAD_CHUNK_BYTES), b""): sha.update(chunk)
+    media_file.seek(0)
+    return sha.hexdigest()
+
+def spool_upload(media_file, suffix, spool_dir=None):
+    if spool_dir: os.makedirs(spool_dir, exist_ok=True)
+    media_file.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=spool_dir) as tmp:
+        for chunk in iter(lambda: media_file.read(UPLOAD_CHUNK_BYTES), b""): tmp.write(chunk)
+    media_file.seek(0)
+    return tmp.name
+
+def wait_for_file_active(remote, timeout=UPLOAD_POLL_TIMEOUT):
+    # 💡 ၂ စက္ကန့် ပုံသေ မစောင့်ဘဲ 1s → 1.5x → အများဆုံး 10s ဖြင့် Backoff လုပ်ပြီး Timeout ထားသည်
+    deadline, delay = time.time() + timeout, 1.0
+    while remote.state.name == "PROCESSING":
+        if time.time() + delay > deadline: raise TimeoutError(f"Gemini က ဖိုင်ကို {timeout}s အတွင်း Process မလုပ်နိုင်ပါ။")
+        time.sleep(delay)
+        delay = min(delay * 1.5, 10.0)
+        remote = genai.get_file(remote.name)
+    if remote.state.name != "ACTIVE": raise RuntimeError(f"Gemini File Processing မအောင်မြင်ပါ ({remote.state.name})")
+    return remote
+
+class GeminiFileRegistry:
+    def __init__(self, keyring):
+        self.keyring = keyring
+        self.lock = threading.Lock()
+        self.entries = {}  # (key_fp, sha256) -> {"name", "uploaded_at", "last_used", "size"}
+
+    def lookup(self, key_fp, sha):
+        with self.lock:
+            entry = self.entries.get((key_fp, sha))
+            if entry is None or time.time() - entry["uploaded_at"] > REMOTE_FILE_MAX_AGE: return None
+            entry["last_used"] = time.time()
+            return entry["name"]
+
+    def register(self, key_fp, sha, name, size):
+        with self.lock:
+            now = time.time()
+            self.entries[(key_fp, sha)] = {"name": name, "uploaded_at": now, "last_used": now, "size": size}
+
+    def forget(self, key_fp, sha):
+        with self.lock: self.entries.pop((key_fp, sha), None)
+
+    def expired(self):
+        now = time.time()
+        with self.lock:
+            stale = [k for k, e in self.entries.items() if now - e["last_used"] > REMOTE_FILE_IDLE or now - e["uploaded_at"] > REMOTE_FILE_MAX_AGE]
+            return [(k, self.entries.pop(k)) for k in stale]
+
+    def cleanup(self):
+        removed = 0
+        for (key_fp, _), entry in self.expired():
+            # Upload တင်ခဲ့သည့် Key ၏ Client ဖြင့် ဖျက်သည် (ဤ Process တွင် မသိသော Key ဆိုပါက Gemini ၏ ၄၈ နာရီ သက်တမ်းကို စောင့်မည်)
+            client = self.keyring.client(key_fp, "File")
+            if client is None: continue
+            try:
+                client.delete_file(name=entry["name"])
+                removed += 1
+            except Exception:
+                pass  # သက်တမ်းကုန်၍ ဖျက်ပြီးသား ဖြစ်နိုင်သည်
+        return removed
+
+def _remote_file_cleanup_loop(registry, interval=900):
+    while True:
+        time.sleep(interval)
+        registry.cleanup()
+
+@st.cache_resource
+def get_file_registry():
+    registry = GeminiFileRegistry(get_genai_keyring())
+    threading.Thread(target=_remote_file_cleanup_loop, args=(registry,), daemon=True, name="gemini-file-cleanup").start()
+    return registry
+
+def upload_media_file(media_file, on_status=None, content_id=None):
+    # 💡 ဖိုင်တူကို Style အမျိုးမျိုးဖြင့် ထပ်ခါထပ်ခါ Run သည့်အခါ Upload ထပ်မတင်ဘဲ Remote ဖိုင်ဟောင်းကို ပြန်သုံးသည်
+    # (media_file သည် Streamlit UploadedFile သို့မဟုတ် Local Path ဖြစ်နိုင်သည်)
+    registry = get_file_registry()
+    local_path = media_file if isinstance(media_file, str) else None
+    sha = content_id or hash_upload(media_file)
+    name = registry.lookup(GENAI_KEY_FP, sha)
+    if name:
+        try:
+            remote = genai.get_file(name)
+            if remote.state.name in ("ACTIVE", "PROCESSING"):
+                if on_status: on_status("♻️ ယခင် Upload လုပ်ထားသော ဖိုင်ကို ပြန်လည်အသုံးပြုနေပါသည်")
+                return wait_for_file_active(remote)
+        except Exception:
+            pass
+        registry.forget(GENAI_KEY_FP, sha)
+    file_name = os.path.basename(local_path) if local_path else media_file.name
+    ext = file_name.rsplit(".", 1)[-1].lower()
+    tpath = local_path or spool_upload(media_file, f".{ext}")
+    try:
+        size = os.path.getsize(tpath)
+        if on_status: on_status(f"📤 Gemini သို့ Upload တင်နေပါသည် ({format_size(size)})")
+        remote = genai.upload_file(tpath, mime_type=MEDIA_MIME_TYPES.get(ext), display_name=file_name)
+    finally:
+        if not local_path and os.path.exists(tpath): os.remove(tpath)
+    registry.register(GENAI_KEY_FP, sha, remote.name, size)
+    if on_status: on_status("⏳ Gemini က ဖိုင်ကို Process လုပ်နေပါသည်")
+    return wait_for_file_active(remote)
+
+# 💡 Video / Audio Hub ၏ Style အလိုက် Master Prompt
+def media_prompt_cues(is_video):
+    media_verb = "Watch the visuals and listen to the audio carefully" if is_video else "Listen to the audio carefully"
+    visual_cue = " Include visual markers [Visual: ...] for key scene changes." if is_video else ""
+    return media_verb, visual_cue
+
+def build_media_prompt(style, custom_instructions, is_video, proxy_preset=None):
+    media_verb, visual_cue = media_prompt_cues(is_video)
+
+    # 💡 Master Task Dictionary
+    task_instructions = {
+        "🎬 ရုပ်ရှင်အနှစ်ချုပ် စတိုင် (Cinematic Recap)": f"{media_verb}. Rewrite this as a high-energy movie recap script. Use a storytelling tone like popular YouTube recap channels.",
+        "💖 နှလုံးသားခွန်အားပေး ရသစာတို (Soulful Story)": f"{media_verb}. Transform the content into a deeply emotional, heartwarming, and poetic short story (Chicken Soup style). Focus on human feelings and life lessons.",
+        "🕵️‍♂️ မှုခင်း/လျှို့ဝှက်ဆန်းကြယ် (Mystery/True Crime)": f"{media_verb}. Create a suspenseful mystery/true crime style narration. Highlight the most unsettling or intriguing parts.",
+        "👻 အမှောင်ရသ (Gothic/Midnight Tale)": f"{media_verb}. Re-imagine the content into a dark, mysterious, and Gothic-themed narrative. Add chilling and aesthetic elements.",
+        "😂 ခနဲ့တဲ့တဲ့ သရော်စာ (Sarcastic Roast)": f"{media_verb}. Create a highly sarcastic, dry, and slightly mocking commentary/roast about the content. Make it funny and witty.",
+        "🎓 ပညာရေး / ဗဟုသုတ ရှင်းလင်းချက် (Educational Explainer)": f"{media_verb}. Create a clear, highly informative educational explainer script. Break down complex topics so anyone can understand.",
+        "🎙️ ဇာတ်ကြောင်းပြော (Professional Narration)": f"{media_verb}. Convert the input into a well-structured, professional narration script suitable for a documentary-style video.",
+        "🗣️ ပေါ့တ်ကတ်စ် အမေးအဖြေ (Podcast Q&A)": f"{media_verb}. Extract the key topics and convert them into a structured Q&A interview format. Make it sound like an engaging podcast conversation.",
+        "📱 Viral Shorts Script (စက္ကန့် ၆၀ စာ)": f"{media_verb}. Create a fast-paced viral script for TikTok/Reels. Start with a powerful HOOK. Ensure it fits a 60-second time limit. Include a catchy caption and 3 trending hashtags at the end.",
+        "📝 အဓိကအချက်များ ကောက်နုတ်ချက် (Key Takeaways)": f"{media_verb}. Provide a very detailed, organized summary with bullet points highlighting the key takeaways and main concepts.",
+        "🧠 အိုင်ဒီယာ တိုးချဲ့ခြင်း (Idea Brainstorm & Outline)": f"{media_verb}. Expand this idea into a professional 5-point content outline. Suggest angles and ways to make it engaging for an audience.",
+        "📄 စာသားအပြည့်အစုံ (Transcript / SRT)": f"{media_verb}. Provide a clean, accurate, word-for-word transcript.{visual_cue}"
+    }
+    
+    target_task = task_instructions.get(style, f"{media_verb}. Analyze the media and provide a detailed script.")
+    
+    # 💡 Professional Master Prompt (DEEP ANALYSIS EDITION)
+    master_prompt = f"""
+    CRITICAL INSTRUCTION: Your ENTIRE response MUST be in BURMESE language.
+    ACT AS: A Meticulous Content Analyst and Master Scriptwriter. 
+    
+    IMPORTANT RULE: DO NOT SKIM or hallucinate. You must pay deep attention to every second of the media, analyzing exact spoken words, visual actions, and emotional tone before writing.
+    
+    TASK: {target_task}
+    USER SPECIAL REQUEST: {custom_instructions if custom_instructions else 'None'}
+    
+    🔴 UNIVERSAL VOICEOVER & PRONOUN RULES:
+    1. STRICT ACCURACY: Base your writing strictly on what is seen or heard in the file. Do not make up events.
+    2. NO ARBITRARY NAMES: NEVER use random placeholder Burmese names. ALWAYS use pronouns like "သူ" (He), "သူမ" (She), "သူတို့" (They).
+    3. VOICEOVER OPTIMIZED: Write strictly for the EAR. It must sound cinematic, rhythmic, and natural when read aloud.
+    4. SPOKEN BURMESE: Use natural spoken endings (တယ်, မယ်, တဲ့). AVOID robotic book language (သည်, ၏).
+    5. DRAMATIC PAUSES: Use ellipses (...) frequently to guide breathing and build suspense.
+    """
+    
+    if proxy_preset:
+        master_prompt += f"\nNOTE: The video is a reduced analysis proxy ({proxy_preset['height']}p, {proxy_preset['fps']} fps). Its timeline is identical to the original, so keep all timestamps and [Visual: ...] markers in original video time."
+    
+    # SRT တောင်းဆိုပါက သီးသန့် Rule ထည့်ရန်
+    if "Transcript" in style:
+        master_prompt += "\nRULE: If the user explicitly asks for SRT format in the Special Request, use exact SRT format (1 \n 00:00:00,000 --> 00:00:02,000 \n [Text]). Otherwise, just provide the clean text format. If NO dialogue is present, reply ONLY 'NO_SPEECH_DETECTED'."
+    return master_prompt
+
+# ==========================================
+# 🗜️ ffmpeg Media Proxy (Cached by Source Hash)
+# ==========================================
+FFMPEG_BIN = shutil.which("ffmpeg")
+MEDIA_CACHE_DIR = os.path.join(CACHE_DIR, "media")
+MEDIA_CACHE_MAX_MB = 1024
+FFMPEG_TIMEOUT = 1800
+
+# 💡 Gemini သည် Video ကို 1 FPS ခန့်သာ ကြည့်သဖြင့် Resolution / FPS / Bitrate လျှော့ထားသော Proxy ဖြင့် လုံလောက်သည်
+# (Timeline ကို မဖြတ်သဖြင့် [Visual: ...] Marker နှင့် Timestamp များ မူရင်းဗီဒီယိုအတိုင်း ကိုက်ညီသည်)
+VIDEO_PROXY_PRESETS = {
+    "⚡ Fast (360p • 1 fps)": {"id": "v360f1", "height": 360, "fps": 1, "crf": 34, "maxrate": "250k", "audio": "32k"},
+    "🎯 Balanced (480p • 2 fps)": {"id": "v480f2", "height": 480, "fps": 2, "crf": 32, "maxrate": "450k", "audio": "48k"},
+    "🔍 Detailed (720p • 4 fps)": {"id": "v720f4", "height": 720, "fps": 4, "crf": 30, "maxrate": "1000k", "audio": "64k"},
+}
+
+def parse_ffmpeg_duration(stderr):
+    m = re.search(r"Duration: (\d+):(\d+):([\d.]+)", stderr)
+    return int(m.group(1)) * 3600 + int(m.group(2)) * 60 + float(m.group(3)) if m else None
+
+def run_ffmpeg(args, timeout=FFMPEG_TIMEOUT):
+    if not FFMPEG_BIN: raise RuntimeError("ffmpeg ကို ရှာမတွေ့ပါ။ (packages.txt တွင် ffmpeg ထည့်ထားရန် လိုသည်)")
+    result = subprocess.run([FFMPEG_BIN, "-hide_banner", "-nostdin", "-y", *args], capture_output=True, text=True, timeout=timeout)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg error: {(result.stderr.strip().splitlines() or ['unknown'])[-1][:200]}")
+    return result
+
+def _evict_media_cache(max_mb=MEDIA_CACHE_MAX_MB):
+    files = []
+    for fname in os.listdir(MEDIA_CACHE_DIR):
+        path = os.path.join(MEDIA_CACHE_DIR, fname)
+        try: st_info = os.stat(path)
+        except OSError: continue
+        files.append((st_info.st_mtime, st_info.st_size, path))
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= max_mb * 1024 * 1024: break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError: pass
+
+def cached_ffmpeg_output(media_file, cache_name, build_args):
+    # 💡 Source Hash + Preset အလိုက် Cache လုပ်ထားသဖြင့် ဖိုင်တူကို ထပ် Transcode မလုပ်ရ
+    os.makedirs(MEDIA_CACHE_DIR, exist_ok=True)
+    out_path = os.path.join(MEDIA_CACHE_DIR, cache_name)
+    if os.path.exists(out_path):
+        os.utime(out_path)
+        return out_path, True
+    local_path = media_file if isinstance(media_file, str) else None
+    ext = (local_path or media_file.name).rsplit(".", 1)[-1].lower()
+    src_path = local_path or spool_upload(media_file, f".{ext}")
+    part_path = f"{out_path}.part{os.path.splitext(out_path)[1]}"
+    try:
+        run_ffmpeg(build_args(src_path, part_path))
+        os.replace(part_path, out_path)
+    finally:
+        for path in (src_path, part_path):
+            if path != local_path and os.path.exists(path): os.remove(path)
+    _evict_media_cache()
+    return out_path, False
+
+def make_video_proxy(media_file, sha, preset):
+    def build_args(src, dst):
+        return ["-i", src,
+                "-vf", f"scale=-2:'min({preset['height']},ih)',fps={preset['fps']}",
+                "-c:v", "libx264", "-preset", "veryfast", "-crf", str(preset["crf"]),
+                "-maxrate", preset["maxrate"], "-bufsize", preset["maxrate"],
+                "-c:a", "aac", "-b:a", preset["audio"], "-ac", "1", "-ar", "16000",
+                "-movflags", "+faststart", dst]
+    return cached_ffmpeg_output(media_file, f"{sha}-{preset['id']}.mp4", build_args)
+
+# 💡 စကားပြောအတွက် 16 kHz Mono Opus သို့ ပြောင်းပြီး ကြာရှည် တိတ်ဆိတ်နေသော အပိုင်းများကို ဖြတ်သည်
+AUDIO_PROXY_BITRATE = "24k"
+SILENCE_NOISE_DB = -35
+SILENCE_MIN_SECONDS = 1.5
+SILENCE_KEEP_SECONDS = 0.35  # သဘာဝကျစေရန် ဖြတ်လိုက်သော နေရာ၏ နှစ်ဖက်စလုံးတွင် ချန်ထားမည့် အချိန်
+
+def detect_silences(src_path):
+    result = run_ffmpeg(["-i", src_path, "-af", f"silencedetect=noise={SILENCE_NOISE_DB}dB:d={SILENCE_MIN_SECONDS}", "-f", "null", "-"])
+    duration = parse_ffmpeg_duration(result.stderr)
+    starts = [float(x) for x in re.findall(r"silence_start: (-?[\d.]+)", result.stderr)]
+    ends = [float(x) for x in re.findall(r"silence_end: ([\d.]+)", result.stderr)]
+    silences = [(max(s, 0.0), ends[i] if i < len(ends) else duration) for i, s in enumerate(starts)]
+    return duration, [(s, e) for s, e in silences if e is not None]
+
+def speech_intervals(duration, silences):
+    keep, cursor = [], 0.0
+    for start, end in silences:
+        cut_start, cut_end = start + SILENCE_KEEP_SECONDS, end - SILENCE_KEEP_SECONDS
+        if cut_end - cut_start <= 0: continue
+        if cut_start > cursor: keep.append((cursor, cut_start))
+        cursor = cut_end
+    if duration is None or duration > cursor: keep.append((cursor, duration))
+    return keep
+
+def build_timestamp_map(intervals):
+    # 💡 Proxy အချိန် → မူရင်း အချိန် ပြန်တွက်ရန် [proxy_start, original_start] စာရင်း
+    tmap, proxy_t = [], 0.0
+    for start, end in intervals:
+        tmap.append([round(proxy_t, 3), round(start, 3)])
+        if end is not None: proxy_t += end - start
+    return tmap
+
+def map_to_original(seconds, tmap):
+    if not tmap: return seconds
+    i = max(bisect_right([p for p, _ in tmap], seconds) - 1, 0)
+    return tmap[i][1] + (seconds - tmap[i][0])
+
+_SRT_TIME_RE = re.compile(r"(\d{2}):(\d{2}):(\d{2})([,.])(\d{3})")
+_BRACKET_TIME_RE = re.compile(r"\[(?:(\d{1,2}):)?(\d{1,2}):(\d{2})\]")
+
+def remap_timestamps(text, tmap):
+    # SRT (00:01:02,500) နှင့် [mm:ss] / [h:mm:ss] Marker များကို မူရင်း Timeline သို့ ပြန်ပြောင်းသည်
+    if not tmap or tmap == [[0.0, 0.0]]: return text
+    def srt_sub(m):
+        seconds = int(m.group(1)) * 3600 + int(m.group(2)) * 60 + int(m.group(3)) + int(m.group(5)) / 1000
+        return format_timecode(map_to_original(seconds, tmap), m.group(4))
+    def bracket_sub(m):
+        seconds = map_to_original(int(m.group(1) or 0) * 3600 + int(m.group(2)) * 60 + int(m.group(3)), tmap)
+        hours = int(seconds // 3600)
+        return f"[{hours}:{int(seconds // 60 % 60):02d}:{int(seconds % 60):02d}]" if hours else f"[{format_mmss(seconds)}]"
+    return _BRACKET_TIME_RE.sub(bracket_sub, _SRT_TIME_RE.sub(srt_sub, text))
+
+def make_audio_proxy(media_file, sha, trim_silence=True):
+    proxy_id = "a16k-vad" if trim_silence else "a16k"
+    os.makedirs(MEDIA_CACHE_DIR, exist_ok=True)
+    map_path = os.path.join(MEDIA_CACHE_DIR, f"{sha}-{proxy_id}.json")
+    audio_path = os.path.join(MEDIA_CACHE_DIR, f"{sha}-{proxy_id}.ogg")
+    if not os.path.exists(map_path) and os.path.exists(audio_path): os.remove(audio_path)
+    info = {}
+    def build_args(src, dst):
+        duration, silences = detect_silences(src) if trim_silence else (None, [])
+        intervals = speech_intervals(duration, silences)
+        kept = sum(e - s for s, e in intervals) if duration is not None else None
+        info.update(duration=duration, kept=kept, tmap=build_timestamp_map(intervals))
+        filters = []
+        if len(intervals) > 1 or intervals[0][0] > 0:
+            select = "+".join(f"between(t,{s:.3f},{e:.3f})" if e is not None else f"gte(t,{s:.3f})" for s, e in intervals)
+            filters += [f"aselect='{select}'", "asetpts=N/SR/TB"]
+        filters += ["loudnorm=I=-16:TP=-1.5:LRA=11", "aresample=16000"]
+        return ["-i", src, "-vn", "-af", ",".join(filters), "-ac", "1", "-c:a", "libopus", "-b:a", AUDIO_PROXY_BITRATE, "-application", "voip", dst]
+    out_path, cached = cached_ffmpeg_output(media_file, os.path.basename(audio_path), build_args)
+    if info:
+        with open(map_path, "w", encoding="utf-8") as f: json.dump(info, f)
+    else:
+        with open(map_path, "r", encoding="utf-8") as f: info = json.load(f)
+    return out_path, info, cached
+
+def show_note(kind, message):
+    getattr(st, kind)(message)
+
+def prepare_media_upload(media_file, proxy_preset, use_audio_proxy, trim_silence, on_status, on_note=show_note):
+    # 💡 ffmpeg Proxy / Audio Normalize ကို လိုအပ်သလို ပြုလုပ်ပြီး Upload တင်မည့် ဖိုင်၊ Registry ID နှင့် Timestamp Map ကို ပြန်ပေးသည်
+    # (Background Job တွင် UI မရှိသဖြင့် on_note ဖြင့် Caption / Warning များကို မှတ်စုအဖြစ် ယူနိုင်သည်)
+    media_sha = hash_upload(media_file)
+    media_size = os.path.getsize(media_file) if isinstance(media_file, str) else media_file.size
+    upload_target, upload_id, media_tmap = media_file, media_sha, None
+    if proxy_preset:
+        try:
+            on_status("🗜️ ffmpeg ဖြင့် Analysis Proxy ပြုလုပ်နေပါသည်")
+            upload_target, proxy_cached = make_video_proxy(media_file, media_sha, proxy_preset)
+            upload_id = f"{media_sha}:{proxy_preset['id']}"
+            proxy_size = os.path.getsize(upload_target)
+            saved = max(0.0, 1 - proxy_size / media_size) * 100
+            on_note("caption", f"🗜️ Proxy{' (cached)' if proxy_cached else ''}: {format_size(media_size)} → {format_size(proxy_size)} • {saved:.0f}% saved")
+        except Exception as e:
+            on_note("warning", f"⚠️ Proxy မရပါ၍ မူရင်းဖိုင်ကို Upload တင်ပါမည်။ ({e})")
+    elif use_audio_proxy:
+        try:
+            on_status("🎚️ ffmpeg ဖြင့် အသံကို Normalize လုပ်နေပါသည်")
+            upload_target, audio_info, proxy_cached = make_audio_proxy(media_file, media_sha, trim_silence)
+            upload_id = f"{media_sha}:{'a16k-vad' if trim_silence else 'a16k'}"
+            media_tmap = audio_info["tmap"]
+            proxy_size = os.path.getsize(upload_target)
+            saved = max(0.0, 1 - proxy_size / media_size) * 100
+            trimmed = f" • {audio_info['duration'] - audio_info['kept']:.0f}s silence removed" if audio_info.get("kept") is not None else ""
+            on_note("caption", f"🎚️ Audio{' (cached)' if proxy_cached else ''}: {format_size(media_size)} → {format_size(proxy_size)} • {saved:.0f}% saved{trimmed}")
+        except Exception as e:
+            on_note("warning", f"⚠️ Audio Preprocessing မအောင်မြင်ပါ၍ မူရင်းဖိုင်ကို Upload တင်ပါမည်။ ({e})")
+    return upload_target, upload_id, media_tmap
+
+def format_size(num_bytes):
+    return f"{num_bytes / (1024 * 1024):.1f} MB"
+
+# ==========================================
+# 🧩 Segmented Media Analysis (Long Video / Audio)
+# ==========================================
+MEDIA_SEGMENT_OVERLAP = 15  # အပိုင်းဆက်ကြားတွင် စကားမပြတ်စေရန် ထပ်နေမည့် စက္ကန့်
+MEDIA_SEGMENT_RETRIES = 1
+
+def probe_duration(path):
+    return parse_ffmpeg_duration(run_ffmpeg(["-i", path, "-t", "0", "-f", "null", "-"]).stderr)
+
+def plan_media_segments(duration, segment_seconds, overlap=MEDIA_SEGMENT_OVERLAP):
+    # 💡 အပိုင်းတစ်ခုစီသည် နောက်အပိုင်းနှင့် overlap စက္ကန့် ထပ်ပြီး၊ ထပ်နေသော အလယ်မှတ်အထိကိုသာ "ပိုင်ဆိုင်" သည်
+    segments, start = [], 0.0
+    while True:
+        end = min(start + segment_seconds + overlap, duration)
+        segments.append({"start": start, "end": end})
+        if end >= duration: break
+        start += segment_seconds
+    for i, seg in enumerate(segments):
+        seg["own_start"] = seg["start"] + overlap / 2 if i else 0.0
+        seg["own_end"] = segments[i + 1]["start"] + overlap / 2 if i + 1 < len(segments) else float("inf")
+    return segments
+
+def cut_media_segment(src_path, seg, dst_path, is_video):
+    codec = (["-c:v", "libx264", "-preset", "veryfast", "-crf", "30", "-c:a", "aac", "-b:a", "48k", "-ac", "1"] if is_video
+             else ["-vn", "-c:a", "libopus", "-b:a", AUDIO_PROXY_BITRATE, "-ac", "1", "-ar", "16000"])
+    run_ffmpeg(["-ss", f"{seg['start']:.3f}", "-i", src_path, "-t", f"{seg['end'] - seg['start']:.3f}", *codec, dst_path])
+
+def build_media_notes_prompt(is_video):
+    media_verb, visual_cue = media_prompt_cues(is_video)
+    return f"""
+    TASK: {media_verb}. Write dense, chronological notes of EVERYTHING in this file: what is said (close to word-for-word),
+    who says it, key actions and emotional turns. Start every note line with a [mm:ss] timestamp.{visual_cue}
+    Do NOT add opinions or content that is not in the file. Use the original spoken language.
+    """
+
+def _analyze_media_segment(src_path, seg, index, total, prompt, content_id, work_dir, is_video):
+    dst_path = os.path.join(work_dir, f"part{index:03d}.{'mp4' if is_video else 'ogg'}")
+    part_prompt = prompt + f"""
+    NOTE: This file is PART {index} of {total} of a longer recording (original time {format_mmss(seg['start'])} - {format_mmss(seg['end'])}).
+    Cover ONLY this part. Write every timestamp relative to the start of THIS part (00:00 = start of the part).
+    """
+    last_error = None
+    for attempt in range(MEDIA_SEGMENT_RETRIES + 1):
+        try:
+            if not os.path.exists(dst_path): cut_media_segment(src_path, seg, dst_path, is_video)
+            remote = upload_media_file(dst_path, content_id=f"{content_id}:{seg['start']:.0f}-{seg['end']:.0f}")
+            text = generate_content_safe(part_prompt, remote)
+            if text.startswith("⚠️ Error"): raise RuntimeError(text.splitlines()[0])
+            # Part အတွင်း Timestamp များကို ဖိုင်တစ်ခုလုံး၏ Timeline သို့ ရွှေ့သည်
+            return remap_timestamps(text, [[0.0, seg["start"]]])
+        except Exception as e:
+            last_error = e
+            if attempt < MEDIA_SEGMENT_RETRIES: time.sleep(2)
+    return f"[{format_mmss(seg['start'])}] ⚠️ Part {index} ({format_mmss(seg['start'])} - {format_mmss(seg['end'])}) failed: {str(last_error)[:150]}"
+
+_SRT_CUE_RE = re.compile(r"(?:^|\n)\s*\d+\s*\n(\d{2}:\d{2}:\d{2}[,.]\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}[,.]\d{3})[^\n]*\n(.*?)(?=\n\s*\n|\Z)", re.S)
+_LINE_TIME_RE = re.compile(r"^\W*\[(?:(\d{1,2}):)?(\d{1,2}):(\d{2})\]")
+
+def parse_srt_timecode(text):
+    h, m, rest = text.replace(",", ".").split(":")
+    return int(h) * 3600 + int(m) * 60 + float(rest)
+
+def parse_srt_cues(text):
+    return [{"start": parse_srt_timecode(a), "end": parse_srt_timecode(b), "text": body.strip()} for a, b, body in _SRT_CUE_RE.findall(text) if body.strip()]
+
+def stitch_segment_outputs(parts):
+    # 💡 အပိုင်းတစ်ခုစီ၏ "ပိုင်ဆိုင်ရာ" အချိန်အတွင်းရှိ Cue / Line များကိုသာ ယူပြီး ထပ်နေသော စာကြောင်းများကို ဖယ်ရှားသည်
+    cue_parts = [parse_srt_cues(text) for _, text in parts]
+    if any(cue_parts):
+        cues = [c for (seg, _), part_cues in zip(parts, cue_parts) for c in part_cues if seg["own_start"] <= c["start"] < seg["own_end"]]
+        return "\n".join(f"{i}\n{format_timecode(c['start'])} --> {format_timecode(c['end'])}\n{c['text']}\n" for i, c in enumerate(cues, 1))
+    lines, recent = [], deque(maxlen=12)
+    for seg, text in parts:
+        for line in text.splitlines():
+            m = _LINE_TIME_RE.match(line)
+            if m:
+                seconds = int(m.group(1) or 0) * 3600 + int(m.group(2)) * 60 + int(m.group(3))
+                if not seg["own_start"] - 1 <= seconds < seg["own_end"]: continue
+            key = " ".join(line.split())
+            if key and key in recent: continue
+            if key: recent.append(key)
+            lines.append(line)
+    return "\n".join(lines).strip()
+
+def run_segmented_media_analysis(media, content_id, prompt, is_video, segment_seconds, workers=3, on_progress=None):
+    work_dir = tempfile.mkdtemp(prefix="muse-seg-")
+    local_path = media if isinstance(media, str) else None
+    src_path = local_path or spool_upload(media, f".{media.name.rsplit('.', 1)[-1].lower()}")
+    try:
+        duration = probe_duration(src_path)
+        if not duration: raise RuntimeError("ဖိုင်၏ အရှည်ကို ffmpeg ဖြင့် ဖတ်၍ မရပါ။")
+        segments = plan_media_segments(duration, segment_seconds)
+        outputs = [None] * len(segments)
+        # 💡 Worker အရေအတွက်ဖြင့် ကန့်သတ်ပြီး Cut → Upload → Analyze ကို အပြိုင် လုပ်ဆောင်သည်
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="muse-seg") as pool:
+            futures = {ctx_submit(pool, _analyze_media_segment, src_path, seg, i + 1, len(segments), prompt, content_id, work_dir, is_video): i
+                       for i, seg in enumerate(segments)}
+            for done_count, future in enumerate(as_completed(futures), 1):
+                outputs[futures[future]] = future.result()
+                if on_progress: on_progress(done_count, len(segments))
+        return stitch_segment_outputs(list(zip(segments, outputs))), len(segments)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        if not local_path and os.path.exists(src_path): os.remove(src_path)
+
+# ==========================================
+# 🔊 Chunked TTS Engine (edge-tts)
+# ==========================================
+TTS_CHUNK_CHARS = 600
+TTS_CHUNK_MIN_CHARS = 200
+TTS_MAX_INFLIGHT = 4  # edge-tts ဆာဗာသို့ တပြိုင်နက် ပို့မည့် Request အများဆုံး
+TTS_RETRIES = 2
+TTS_CACHE_MAX_MB = 300
+TTS_TICKS_PER_SECOND = 10_000_000
+TTS_MP3_BYTES_PER_SECOND = 6000  # edge-tts Output သည် 48 kbps CBR ဖြစ်သဖြင့် Byte အရေအတွက်မှ အရှည်ကို တွက်နိုင်သည်
+
+class AudioCache:
+    # 💡 စာသား + Voice + Rate + Pitch ၏ Hash ဖြင့် MP3 Chunk များကို Disk ပေါ်တွင် သိမ်းပြီး Quota ကျော်ပါက အဟောင်းဆုံး (LRU) မှ ဖျက်သည်
+    def __init__(self, name, max_disk_mb=TTS_CACHE_MAX_MB):
+        self.dir = os.path.join(CACHE_DIR, name)
+        os.makedirs(self.dir, exist_ok=True)
+        self.max_disk_bytes = max_disk_mb * 1024 * 1024
+        self.lock = threading.Lock()
+        self.hits = self.misses = 0
+        self._writes = 0
+
+    def _path(self, key, ext="mp3"):
+        return os.path.join(self.dir, f"{key}.{ext}")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f: data = f.read()
+            os.utime(path)
+            with self.lock: self.hits += 1
+            return data
+        except OSError:
+            with self.lock: self.misses += 1
+            return None
+
+    def get_meta(self, key):
+        try:
+            with open(self._path(key, "json"), "r", encoding="utf-8") as f: return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key, data, meta=None):
+        if meta is not None:
+            try:
+                with open(self._path(key, "json"), "w", encoding="utf-8") as f: json.dump(meta, f, ensure_ascii=False)
+            except OSError: pass
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f: f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path): os.remove(tmp_path)
+        with self.lock:
+            self._writes += 1
+            run_eviction = self._writes % 10 == 0
+        if run_eviction: self.evict_disk()
+
+    def disk_usage(self):
+        files = []
+        for fname in os.listdir(self.dir):
+            path = os.path.join(self.dir, fname)
+            try: st_info = os.stat(path)
+            except OSError: continue
+            files.append((st_info.st_mtime, st_info.st_size, path))
+        return files
+
+    def evict_disk(self):
+        files = self.disk_usage()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes: break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError: pass
+
+    def clear(self):
+        with self.lock: self.hits = self.misses = 0
+        for _, _, path in self.disk_usage():
+            try: os.remove(path)
+            except OSError: pass
+
+    def stats(self):
+        files = self.disk_usage()
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "files": sum(path.endswith(".mp3") for _, _, path in files),
+                    "bytes": sum(size for _, size, _ in files)}
+
+def _sweep_legacy_voice_files(max_age=3600):
+    # ယခင် Version များက Working Directory ထဲ ချန်ထားခဲ့သော ai_voice_*.mp3 များကို ရှင်းသည်
+    for fname in os.listdir("."):
+        if not re.fullmatch(r"ai_voice_\d+\.mp3", fname): continue
+        try:
+            if time.time() - os.path.getmtime(fname) > max_age: os.remove(fname)
+        except OSError: pass
+
+@st.cache_resource
+def get_audio_cache():
+    _sweep_legacy_voice_files()
+    return AudioCache("tts")
+
+def tts_cache_key(text, voice, rate, pitch):
+    normalized = "\n".join(" ".join(line.split()) for line in text.strip().splitlines() if line.strip())
+    return make_cache_key("tts", normalized, voice, rate, pitch)
+
+_TTS_SENTENCE_RE = re.compile(r".+?(?:[။၊]\s*|[!?.]\s+|\n+|$)", re.S)
+
+def _tts_cut_point(sentence, max_chars):
+    # 💡 ၊ , Space မတွေ့ပါက Syllable အစတွင်သာ ဖြတ်သည် (Chunk အစတွင် Combining Mark ကျန်ခဲ့ပါက edge-tts အသံထွက် မှားသည်)
+    cut = max(sentence.rfind(sep, 0, max_chars) for sep in ("၊", ",", " "))
+    if cut > 0: return cut + 1
+    starts = [m.start(1) for m in _MY_SYLLABLE_BREAK.finditer(sentence, 0, max_chars + 2) if 0 < m.start(1) <= max_chars]
+    return starts[-1] if starts else max_chars
+
+def split_tts_text(text, max_chars=TTS_CHUNK_CHARS, min_chars=TTS_CHUNK_MIN_CHARS):
+    # 💡 ။ ၊ (နောက်တွင် Space မပါလည်း)၊ ! ? . နှင့် စာကြောင်းဆင်း နေရာများတွင်သာ ဖြတ်ပြီး မူရင်း Separator အတိုင်း max_chars အထိ ပြန်စုသည်
+    # Chunk အဆုံးကို ဝါကျ၏ Hash ဖြင့် ဆုံးဖြတ်သဖြင့် (Content-Defined) ဝါကျတစ်ခု ပြင်လိုက်လျှင် နောက်ဆက်တွဲ Chunk များ မပြောင်းဘဲ Cache ကို ပြန်သုံးနိုင်သည်
+    sentences = [m.group(0).lstrip() for m in _TTS_SENTENCE_RE.finditer(text) if m.group(0).strip()]
+    chunks, current = [], ""
+    for sentence in sentences:
+        while len(sentence.rstrip()) > max_chars:
+            cut = _tts_cut_point(sentence, max_chars)
+            if current.strip(): chunks.append(current.strip())
+            chunks.append(sentence[:cut].strip())
+            current, sentence = "", sentence[cut:].lstrip()
+        if current and len(current.rstrip()) + len(sentence.rstrip()) > max_chars:
+            chunks.append(current.strip())
+            current = sentence
+        else:
+            current += sentence
+        if len(current.strip()) >= min_chars and zlib.crc32(sentence.strip().encode("utf-8")) % 4 == 0:
+            chunks.append(current.strip())
+            current = ""
+    if current.strip(): chunks.append(current.strip())
+    return chunks
+
+def prepare_tts_text(text):
+    # 💡 မြန်မာ ပုဒ်မ (။) နှင့် စာကြောင်းဆင်းတွင် အသံ ခဏနားစေရန်
+    pt = text.replace("။", "။ . ").replace("\n", " . \n")
+    if not pt.endswith(". "): pt += " . "
+    return pt
+
+async def synthesize_chunk(text, voice, rate, pitch):
+    last_error = None
+    for attempt in range(TTS_RETRIES + 1):
+        try:
+            audio, words = bytearray(), []
+            communicate = edge_tts.Communicate(prepare_tts_text(text), voice, rate=f"{rate:+d}%", pitch=f"{pitch:+d}Hz", boundary="WordBoundary")
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio": audio.extend(chunk["data"])
+                elif chunk["type"] == "WordBoundary":
+                    # offset / duration များသည် 100ns Tick ဖြင့် လာသည်
+                    words.append([chunk["offset"] / TTS_TICKS_PER_SECOND, chunk["duration"] / TTS_TICKS_PER_SECOND, chunk["text"]])
+            return bytes(audio), words
+        except Exception as e:
+            last_error = e
+            await asyncio.sleep(1 + attempt)
+    raise last_error
+
+async def _synthesize_chunks(job, max_inflight, cache):
+    sem = asyncio.Semaphore(max_inflight)
+    async def run_one(i, item):
+        cache_key = tts_cache_key(item["text"], item["voice"], item["rate"], item["pitch"])
+        audio = cache.get(cache_key)
+        if audio is not None:
+            job["reused"] += 1
+            words = (cache.get_meta(cache_key) or {}).get("words")
+        else:
+            async with sem:
+                audio, words = await synthesize_chunk(item["text"], item["voice"], item["rate"], item["pitch"])
+            cache.set(cache_key, audio, {"words": words})
+        with job["cond"]:
+            job["words"][i] = words
+            job["audio"][i] = audio
+            job["cond"].notify_all()
+    await asyncio.gather(*(run_one(i, item) for i, item in enumerate(job["chunks"])))
+
+def build_tts_items(text, voice, rate, pitch):
+    return [{"text": chunk, "voice": voice, "rate": rate, "pitch": pitch, "gap_after": False} for chunk in split_tts_text(text)]
+
+def start_tts_job(items, max_inflight=TTS_MAX_INFLIGHT):
+    # 💡 Chunk များကို Background Async Runtime ပေါ်တွင် အပြိုင် ဖန်တီးပြီး Script Thread ကို မပိတ်ထားတော့ပါ
+    job = {"chunks": items, "audio": [None] * len(items), "words": [None] * len(items), "reused": 0, "error": None, "done": False, "cond": threading.Condition()}
+    def finished(future):
+        with job["cond"]:
+            job["error"] = future.exception()
+            job["done"] = True
+            job["cond"].notify_all()
+    job["future"] = get_async_runtime().submit(_synthesize_chunks(job, max_inflight, get_audio_cache()))
+    job["future"].add_done_callback(finished)
+    return job
+
+def tts_job_progress(job):
+    with job["cond"]:
+        return sum(a is not None for a in job["audio"]), len(job["audio"])
+
+# ==========================================
+# 🎭 Multi-Character Voice Rendering
+# ==========================================
+TTS_MAX_INFLIGHT_MULTI = 8  # စာကြောင်းများကို အပြိုင် ဖန်တီးသဖြင့် အကြာဆုံး စာကြောင်းလောက်သာ ကြာစေရန်
+_SPEAKER_TAG_RE = re.compile(r"^\s*\**\[([^\]\n]{1,40})\]\**\s*[:：]?\s*(.*)$")
+# 💡 App ၏ Script / Transcript များတွင်ပါသော [00:01] Timestamp နှင့် [Visual: ...] စသည့် Marker များသည် Speaker မဟုတ်ပါ
+_NON_SPEAKER_TAG_RE = re.compile(r"\d+\s*:\s*\d+|^\s*(?:visual|scene|sfx|sound|music|camera|shot|cut|b-roll|note|on-screen|text)\b|[:：]", re.I)
+
+VOICE_PRESETS = {
+    "🎙️ Narrator (Thiha)": {"voice": "my-MM-ThihaNeural", "rate": 0, "pitch": 0},
+    "🎙️ Narrator (Nilar)": {"voice": "my-MM-NilarNeural", "rate": 0, "pitch": 0},
+    "🧙‍♀️ Witch (Sonia)": {"voice": "en-GB-SoniaNeural", "rate": -10, "pitch": 15},
+    "👹 Villain (Christopher)": {"voice": "en-US-ChristopherNeural", "rate": -15, "pitch": -20},
+    "🧚‍♀️ Fairy (Ana)": {"voice": "en-US-AnaNeural", "rate": 10, "pitch": 20},
+    "👴 Wise Old Man (Thomas)": {"voice": "en-GB-ThomasNeural", "rate": -10, "pitch": -5},
+    "👦 Young Boy (Roger)": {"voice": "en-US-RogerNeural", "rate": 5, "pitch": 5},
+    "🇺🇸 Narrator (Jenny)": {"voice": "en-US-JennyNeural", "rate": 0, "pitch": 0},
+}
+_PRESET_HINTS = [
+    (("witch", "စုန်း"), "🧙‍♀️ Witch (Sonia)"), (("villain", "ဘီလူး", "လူဆိုး"), "👹 Villain (Christopher)"),
+    (("fairy", "နတ်သမီး"), "🧚‍♀️ Fairy (Ana)"), (("old", "အဘိုး", "ဦး"), "👴 Wise Old Man (Thomas)"),
+    (("boy", "ကောင်လေး"), "👦 Young Boy (Roger)"), (("she", "her", "girl", "woman", "သူမ", "မိန်းကလေး", "အမျိုးသမီး"), "🎙️ Narrator (Nilar)"),
+]
+
+# 💡 Edge TTS ၏ Output (24 kHz / 48 kbps / Mono MPEG-2 Layer III) နှင့် ကိုက်ညီသော 24ms အသံတိတ် Frame
+SILENT_MP3_FRAME = b"\xff\xf3\x64\xc0" + bytes(140)
+
+def parse_speaker_script(text, default_speaker="Narrator"):
+    # [Narrator] / [Witch]: ... ပုံစံ Tag များဖြင့် ခွဲပြီး Tag မပါသော စာကြောင်းများကို ယခင် Speaker ထံ ဆက်ပေးသည်
+    lines, speaker = [], default_speaker
+    for raw in text.splitlines():
+        m = _SPEAKER_TAG_RE.match(raw)
+        if m and _NON_SPEAKER_TAG_RE.search(m.group(1)): m = None
+        if m: speaker, body = m.group(1).strip(), m.group(2).strip()
+        else: body = raw.strip()
+        if not body: continue
+        if lines and not m and lines[-1]["speaker"] == speaker: lines[-1]["text"] += "\n" + body
+        else: lines.append({"speaker": speaker, "text": body})
+    return lines
+
+def guess_voice_preset(speaker):
+    name = speaker.lower()
+    words = set(re.findall(r"[a-z]+", name))
+    for keywords, preset in _PRESET_HINTS:
+        if any((k in words) if k.isascii() else (k in name) for k in keywords): return preset
+    return None  # မသိသော Speaker သည် အသုံးပြုသူ ရွေးထားသော Main Voice ကိုသာ သုံးမည်
+
+def build_multi_voice_items(lines, speaker_voices):
+    items = []
+    for line in lines:
+        settings = speaker_voices[line["speaker"]]
+        items.extend(build_tts_items(line["text"], settings["voice"], settings["rate"], settings["pitch"]))
+        items[-1]["gap_after"] = True
+    if items: items[-1]["gap_after"] = False
+    return items
+
+def silence_mp3(ms):
+    return SILENT_MP3_FRAME * max(0, round(ms / 24))
+
+def assemble_tts_audio(job, gap_ms=0):
+    # edge-tts ၏ MP3 Frame များသည် Format တူသဖြင့် အစဉ်လိုက် ဆက်လိုက်ရုံဖြင့် ဖိုင်တစ်ခုတည်း ဖြစ်သည်
+    gap = silence_mp3(gap_ms)
+    return b"".join(audio + (gap if item["gap_after"] else b"") for item, audio in zip(job["chunks"], job["audio"]))
+
+# 💡 edge-tts ၏ WordBoundary အချိန်များမှ API ထပ်မခေါ်ဘဲ SRT / VTT စာတန်းထိုး ထုတ်သည်
+def _join_caption_word(left, right):
+    both_burmese = re.match(f"[{_MY_CHARS}]", left[-1:]) and re.match(f"[{_MY_CHARS}]", right[:1])
+    return f"{left}{right}" if both_burmese else f"{left} {right}"
+
+def group_caption_words(words, offset=0.0, max_gap=0.5):
+    # စကားလုံးများကို ဝါကျအဆုံး၊ အသံနားချိန်၊ စာကြောင်းရေ / ကြာချိန် ကန့်သတ်ချက်အလိုက် Phrase များအဖြစ် စုသည်
+    phrases, current = [], None
+    for start, duration, text in words:
+        text = text.strip()
+        if not text: continue
+        start += offset
+        if current and (current["break"] or start - current["end"] > max_gap
+                        or len(wrap_subtitle_text(_join_caption_word(current["text"], text))) > SUB_MAX_LINES
+                        or start + duration - current["start"] > SUB_MAX_DURATION):
+            phrases.append(current)
+            current = None
+        if current is None: current = {"start": start, "end": start + duration, "text": text, "break": False}
+        else: current.update(end=start + duration, text=_join_caption_word(current["text"], text))
+        if text[-1] in "။.!?": current["break"] = True
+    if current: phrases.append(current)
+    return [{"start": p["start"], "duration": p["end"] - p["start"], "text": p["text"]} for p in phrases]
+
+def build_tts_captions(job, gap_ms=0):
+    segments, cursor = [], 0.0
+    gap_seconds = len(silence_mp3(gap_ms)) / TTS_MP3_BYTES_PER_SECOND
+    for item, audio, words in zip(job["chunks"], job["audio"], job["words"]):
+        duration = len(audio) / TTS_MP3_BYTES_PER_SECOND
+        # Word Boundary မပါသော Cache ဟောင်းများအတွက် Chunk တစ်ခုလုံးကို အချိန်အလိုက် ခွဲဝေသည်
+        if words: segments.extend(group_caption_words(words, cursor))
+        else: segments.append({"start": cursor, "duration": duration, "text": item["text"]})
+        cursor += duration + (gap_seconds if item["gap_after"] else 0)
+    cues = build_subtitle_cues(segments)
+    return cues_to_srt(cues), cues_to_vtt(cues)
+
+TTS_POLL_SECONDS = 0.5
+
+def render_tts_job_progress():
+    # 💡 TTS Job Run နေစဉ်သာ Fragment (run_every) အဖြစ် Poll လုပ်သဖြင့် ဖန်တီးနေစဉ် စာမျက်နှာ၏ ကျန်အပိုင်းများကို ဆက်သုံးနိုင်သည်
+    job = st.session_state.get("tts_job")
+    if not job: return
+    ready, total = tts_job_progress(job)
+    if not job["done"]:
+        st.progress(ready / total, text=f"🎧 Generating Voice... ({ready} / {total} parts)")
+        if total > 1 and job["audio"][0] is not None:
+            st.caption("▶️ ပထမအပိုင်း အသင့်ဖြစ်ပါပြီ (ကျန်အပိုင်းများကို ဆက်လက် ဖန်တီးနေပါသည်)")
+            st.audio(job["audio"][0], format="audio/mp3")
+        return
+    st.session_state.tts_job = None
+    if job["error"] or ready < total:
+        st.session_state.tts_status = ("error", f"⚠️ Error: အသံဖိုင် ဖန်တီး၍ မရပါ။ ({job['error']})")
+    else:
+        st.session_state.tts_audio = assemble_tts_audio(job, job["gap_ms"])
+        st.session_state.tts_srt, st.session_state.tts_vtt = build_tts_captions(job, job["gap_ms"])
+        reused = f" • ♻️ {job['reused']} reused from cache" if job["reused"] else ""
+        st.session_state.tts_status = ("success", f"✅ Voice Generated Successfully! ({total} parts{reused})")
+    st.rerun()
+
+# ==========================================
+# 🔴 YouTube Extraction (Cached by Video ID)
+# ==========================================
+YT_FETCH_BUDGET = 15  # Metadata + Transcript နှစ်ခုလုံးအတွက် စုစုပေါင်း စက္ကန့်
+
+@st.cache_resource
+def get_io_pool():
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="muse-io")
+
+# 💡 Worker Thread များမှ st.cache_* ကို ခေါ်သည့်အခါ ScriptRunContext သတိပေးချက် မထွက်စေရန်
+def ctx_submit(pool, fn, *args, **kwargs):
+    ctx = get_script_run_ctx(suppress_warning=True)
+    def runner():
+        if ctx is not None: add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args, **kwargs)
+    return pool.submit(runner)
+
+# 💡 Smart YouTube Data Extractor
+def parse_youtube_id(url):
+    parsed = urlparse(url.strip())
+    if "v" in parse_qs(parsed.query): return parse_qs(parsed.query)["v"][0]
+    path_parts = [part for part in parsed.path.split("/") if part]
+    if "youtu.be" in parsed.netloc and path_parts: return path_parts[0]
+    for marker in ("shorts", "embed", "live", "v"):
+        if marker in path_parts and path_parts.index(marker) + 1 < len(path_parts):
+            return path_parts[path_parts.index(marker) + 1]
+    return path_parts[-1] if path_parts else url.strip()
+
+@st.cache_resource
+def get_youtube_cache():
+    return TieredCache("youtube", ttl=7 * 24 * 3600, max_items=128, max_disk_mb=100)
+
+# 💡 YoutubeDL ကို ခေါ်တိုင်း အသစ်မဆောက်ဘဲ တစ်ခုတည်းကို Lock ဖြင့် မျှဝေသုံးသည်
+@st.cache_resource
+def get_youtube_dl():
+    ydl_opts = {'quiet': True, 'skip_download': True, 'extract_flat': 'in_playlist', 'no_warnings': True, 'socket_timeout': YT_FETCH_BUDGET}
+    return {"ydl": yt_dlp.YoutubeDL(ydl_opts), "lock": threading.Lock()}
+
+def fetch_youtube_metadata(video_id, report=None):
+    cache = get_youtube_cache()
+    cache_key = make_cache_key("yt-meta", video_id)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        if report is not None: report["cached"] = True
+        return cached
+    ytdl = get_youtube_dl()
+    with ytdl["lock"]:
+        info = ytdl["ydl"].extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
+    meta = {
+        "title": info.get('title', 'Unknown Title'),
+        "description": info.get('description', '') or '',
+        "duration": info.get('duration'),
+        "uploader": info.get('uploader'),
+        "chapters": [{"title": c.get("title", ""), "start": c.get("start_time", 0), "end": c.get("end_time", 0)} for c in (info.get("chapters") or [])],
+    }
+    cache.set(cache_key, meta)
+    return meta
+
+def _list_youtube_transcripts(video_id):
+    # youtube-transcript-api 1.x တွင် list_transcripts() အစား instance .list() ကို သုံးရသည်
+    if hasattr(YouTubeTranscriptApi, "list_transcripts"): return YouTubeTranscriptApi.list_transcripts(video_id)
+    return YouTubeTranscriptApi().list(video_id)
+
+def _segment_field(segment, field):
+    return segment[field] if isinstance(segment, dict) else getattr(segment, field)
+
+def fetch_youtube_transcript(video_id, report=None):
+    cache = get_youtube_cache()
+    cache_key = make_cache_key("yt-transcript", video_id)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        if report is not None: report["cached"] = True
+        return cached or None
+    try:
+        transcript_list = _list_youtube_transcripts(video_id)
+    except (TranscriptsDisabled, NoTranscriptFound, VideoUnavailable):
+        cache.set(cache_key, {}, ttl=3600)  # စာတန်းထိုး မရှိကြောင်းကို ၁ နာရီ မှတ်ထားသည်
+        return None
+    try: found = transcript_list.find_transcript(['my', 'en'])
+    except Exception: found = next(iter(transcript_list))
+    segments = [{"start": float(_segment_field(i, "start")), "duration": float(_segment_field(i, "duration")), "text": _segment_field(i, "text")}
+                for i in found.fetch()]
+    transcript = {"language": getattr(found, "language_code", ""), "segments": segments}
+    cache.set(cache_key, transcript)
+    return transcript
+
+def _timed_fetch(fetcher, video_id, report):
+    started = time.time()
+    try: return fetcher(video_id, report)
+    finally: report["elapsed"] = time.time() - started
+
+def get_youtube_source(url, budget=YT_FETCH_BUDGET):
+    # 💡 Metadata နှင့် Transcript ကို တပြိုင်နက် ဆွဲယူပြီး Deadline အတွင်း ရောက်လာသမျှကိုသာ သုံးသည်
+    # (Deadline ကျော်သွားသော Thread များသည် နောက်ကွယ်တွင် ဆက်လုပ်ပြီး Cache ထဲ ထည့်ထားမည်)
+    video_id = parse_youtube_id(url)
+    pool = get_io_pool()
+    reports = {"metadata": {}, "transcript": {}}
+    futures = {
+        "metadata": ctx_submit(pool, _timed_fetch, fetch_youtube_metadata, video_id, reports["metadata"]),
+        "transcript": ctx_submit(pool, _timed_fetch, fetch_youtube_transcript, video_id, reports["transcript"]),
+    }
+    started = time.time()
+    wait(futures.values(), timeout=budget)
+    results, status = {}, {}
+    for name, future in futures.items():
+        report = reports[name]
+        if not future.done():
+            results[name] = None
+            status[name] = {"state": "timeout", "elapsed": time.time() - started}
+            continue
+        try:
+            results[name] = future.result()
+            state = "cached" if report.get("cached") else ("ok" if results[name] else "missing")
+            status[name] = {"state": state, "elapsed": report.get("elapsed", 0.0)}
+        except Exception as e:
+            results[name] = None
+            status[name] = {"state": "error", "elapsed": report.get("elapsed", 0.0), "error": str(e)[:200]}
+    return {"video_id": video_id, "meta": results["metadata"], "transcript": results["transcript"], "status": status}
+
+# 💡 Transcript ကို အချိန်အလိုက် Index လုပ်ထားပြီး လိုသည့် အပိုင်း (ဥပမာ ၁၂:၀၀ - ၂၀:၀၀) ကိုသာ Prompt ထဲ ထည့်သည်
+class TranscriptIndex:
+    def __init__(self, segments):
+        self.segments = sorted(segments, key=lambda s: s["start"])
+        self.starts = [s["start"] for s in self.segments]
+        # ထပ်နေသော Segment များ မလွတ်စေရန် အဆုံးချိန်ကို Running Max ဖြင့် သိမ်းသည်
+        self.max_ends = list(accumulate((s["start"] + s["duration"] for s in self.segments), max))
+
+    @property
+    def duration(self):
+        return self.max_ends[-1] if self.max_ends else 0.0
+
+    def slice(self, start, end):
+        lo, hi = bisect_right(self.max_ends, start), bisect_left(self.starts, end)
+        return [s for s in self.segments[lo:hi] if s["start"] + s["duration"] > start]
+
+def parse_timecode(text):
+    # "12:30", "1:02:03", "95" စသည်ဖြင့် လက်ခံသည်
+    text = (text or "").strip()
+    if not text: return None
+    if not re.fullmatch(r"\d+(:\d{1,2}){0,2}(\.\d+)?", text): raise ValueError(f"အချိန်ပုံစံ မှားနေပါသည်: {text} (ဥပမာ 12:30)")
+    seconds = 0.0
+    for part in text.split(":"): seconds = seconds * 60 + float(part)
+    return seconds
+
+def chapter_ranges(meta):
+    chapters = (meta or {}).get("chapters") or []
+    ranges = []
+    for i, c in enumerate(chapters):
+        end = c.get("end") or (chapters[i + 1]["start"] if i + 1 < len(chapters) else (meta.get("duration") or float("inf")))
+        ranges.append({"title": c["title"], "start": float(c["start"]), "end": float(end)})
+    return ranges
+
+def merge_ranges(ranges):
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]: merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else: merged.append((start, end))
+    return merged
+
+def clip_youtube_source(source, ranges):
+    # 💡 ရွေးထားသော အချိန်အပိုင်းများနှင့် ထပ်နေသော Segment များကိုသာ ချန်ထားသည် (Timestamp များ မူရင်းအတိုင်း)
+    ranges = merge_ranges(ranges or [])
+    if not ranges: return source
+    label = ", ".join(f"{format_mmss(s)} - {format_mmss(e) if e != float('inf') else 'End'}" for s, e in ranges)
+    meta = dict(source["meta"], range_label=label) if source.get("meta") else None
+    transcript, clip = source.get("transcript"), {"label": label}
+    if transcript:
+        index = TranscriptIndex(transcript["segments"])
+        segments = [seg for start, end in ranges for seg in index.slice(start, end)]
+        if not segments: raise Exception(f"ရွေးထားသော အချိန် ({label}) အတွင်း စကားပြော မရှိပါ။ (ဗီဒီယိုအရှည် {format_mmss(index.duration)})")
+        clip.update(segments=len(segments), total_segments=len(index.segments))
+        transcript = {**transcript, "segments": segments}
+    return {**source, "meta": meta, "transcript": transcript, "clip": clip}
+
+def is_srt_style(style):
+    return "Original" in style or "SRT" in style
+
+def build_local_subtitles(source):
+    # 💡 LLM မလိုဘဲ Transcript ၏ start / duration အတိအကျမှ SRT နှင့် WebVTT ကို တိုက်ရိုက် ထုတ်သည်
+    if not source.get("transcript"): raise Exception("ဤဗီဒီယိုတွင် စာတန်းထိုး (Transcript) မပါဝင်သဖြင့် SRT ထုတ်၍ မရပါ။")
+    cues = build_subtitle_cues(source["transcript"]["segments"])
+    return cues_to_srt(cues), cues_to_vtt(cues)
+
+def build_youtube_prompt(style, custom_instructions, smart_data):
+    # 💡 Original SRT သည် build_local_subtitles ဖြင့်သာ ထွက်သဖြင့် (LLM Timestamp မသုံးရ) ဤနေရာတွင် မြန်မာဘာသာ Script Prompt သာ ရှိသည်
+    yt_verb = "Read the extracted YouTube data carefully"
+    task_instructions = {
+        "🎬 ရုပ်ရှင်အနှစ်ချုပ် စတိုင် (Cinematic Recap)": f"{yt_verb}. Rewrite this as a high-energy movie recap script.",
+        "💖 နှလုံးသားခွန်အားပေး ရသစာတို (Soulful Story)": f"{yt_verb}. Transform the content into a deeply emotional short story.",
+        "🕵️‍♂️ မှုခင်း/လျှို့ဝှက်ဆန်းကြယ် (Mystery/True Crime)": f"{yt_verb}. Create a suspenseful mystery/true crime style narration.",
+        "👻 အမှောင်ရသ (Gothic/Midnight Tale)": f"{yt_verb}. Re-imagine the content into a dark, mysterious narrative.",
+        "😂 ခနဲ့တဲ့တဲ့ သရော်စာ (Sarcastic Roast)": f"{yt_verb}. Create a highly sarcastic, dry, and mocking commentary.",
+        "🎓 ပညာရေး / ဗဟုသုတ ရှင်းလင်းချက် (Educational Explainer)": f"{yt_verb}. Create a clear, informative educational explainer script.",
+        "🎙️ ဇာတ်ကြောင်းပြော (Professional Narration)": f"{yt_verb}. Convert the input into a professional narration script.",
+        "🗣️ ပေါ့တ်ကတ်စ် အမေးအဖြေ (Podcast Q&A)": f"{yt_verb}. Convert them into a structured Q&A interview format.",
+        "📱 Viral Shorts Script (စက္ကန့် ၆၀ စာ)": f"{yt_verb}. Create a fast-paced viral script for TikTok/Reels (60s limit).",
+        "📝 အဓိကအချက်များ ကောက်နုတ်ချက် (Key Takeaways)": f"{yt_verb}. Provide a detailed summary with bullet points.",
+        "🧠 အိုင်ဒီယာ တိုးချဲ့ခြင်း (Idea Brainstorm & Outline)": f"{yt_verb}. Expand this idea into a professional 5-point content outline."
+    }
+
+    target_task = task_instructions.get(style, f"{yt_verb}. Provide a detailed script.")
+
+    prompt = f"""
+        CRITICAL INSTRUCTION: Output MUST be entirely in natural BURMESE language.
+        ACT AS: A Highly Meticulous Content Analyst and Master Scriptwriter.
+
+        TASK: {target_task}
+        USER SPECIAL REQUEST: {custom_instructions if custom_instructions else 'None'}
+
+        --- EXTRACTED YOUTUBE DATA ---
+        {smart_data}
+        ------------------------------
+
+        🔴 DEEP ANALYSIS RULES:
+        1. DO NOT HALLUCINATE: Base your script strictly on the provided Extracted YouTube Data (Transcript, Title, Description). Do NOT invent scenarios that are not mentioned in the text.
+        2. CHRONOLOGICAL FLOW: If a transcript is provided, map out the story chronologically. Capture the true essence and exact points made in the video.
+        3. NO ARBITRARY NAMES: Use appropriate pronouns (သူ, သူမ, ၎င်းတို့) instead of making up random names.
+        4. VOICEOVER OPTIMIZED: Write for the EAR. Ensure it sounds cinematic and professional.
+        5. SPOKEN BURMESE: Use conversational endings (တယ်, မယ်, တဲ့). AVOID robotic language (သည်, ၏).
+        6. PAUSES & PACING: Use ellipses (...) to indicate dramatic pauses.
+        """
+    return prompt
+
+# ==========================================
+# 🧩 Long Transcript Map-Reduce
+# ==========================================
+LONG_TRANSCRIPT_TOKENS = 12000  # ဤထက်ကျော်လျှင် Map-Reduce ကို အလိုအလျောက် သုံးမည်
+MAP_WINDOW_TOKENS = 4000
+
+def estimate_tokens(text):
+    # မြန်မာစာသည် Token ပိုစားသဖြင့် သီးခြားတွက်သည်
+    myanmar_chars = len(re.findall(f"[{_MY_CHARS}]", text))
+    return int((len(text) - myanmar_chars) / 4 + myanmar_chars / 1.5) + 1
+
+def format_mmss(seconds):
+    return f"{int(seconds // 60):02d}:{int(seconds % 60):02d}"
+
+def window_segments(segments, max_tokens=MAP_WINDOW_TOKENS):
+    windows, current, current_tokens = [], [], 0
+    for seg in segments:
+        seg_tokens = estimate_tokens(seg["text"]) + 3
+        if current and current_tokens + seg_tokens > max_tokens:
+            windows.append(current)
+            current, current_tokens = [], 0
+        current.append(seg)
+        current_tokens += seg_tokens
+    if current: windows.append(current)
+    return windows
+
+def _map_transcript_window(index, total, window, title):
+    start, end = format_mmss(window[0]["start"]), format_mmss(window[-1]["start"] + window[-1]["duration"])
+    prompt = f"""
+    You are preparing notes from PART {index} of {total} ({start} - {end}) of the video "{title}".
+    TASK: Write dense, chronological notes of everything said in this part. Keep the [mm:ss] timestamps of key moments,
+    exact names, numbers, quotes and turning points. Do NOT add opinions or content from outside this part. Use the transcript's original language.
+
+    --- TRANSCRIPT PART {index} ---
+    {format_transcript_lines(window)}
+    -------------------------------
+    """
+    request = generate_content_async(prompt)
+    async def run():
+        notes = await request
+        if notes.startswith("⚠️ Error"): notes = format_transcript_lines(window)  # Map မအောင်မြင်ပါက မူရင်းစာသားကိုသာ ထည့်မည်
+        return f"### Part {index} [{start} - {end}]\n{notes.strip()}"
+    return run()
+
+def prepare_youtube_data(source, style, on_progress=None):
+    # 💡 Transcript ရှည်လွန်းပါက Window များခွဲပြီး အပြိုင် Summarize (Map) လုပ်၊ အချိန်အစဉ်အတိုင်း ပြန်ဆက်ကာ Reduce အဆင့်သို့ ပို့သည်
+    transcript = source.get("transcript")
+    if is_srt_style(style) or not transcript or estimate_tokens(format_transcript_lines(transcript["segments"])) <= LONG_TRANSCRIPT_TOKENS:
+        return format_youtube_smart_data(source), 0
+    windows = window_segments(transcript["segments"])
+    title = (source.get("meta") or {}).get("title", "")
+    # Window များကို Async Runtime ပေါ်တွင် တပြိုင်နက် Run ပြီး (ASYNC_LLM_CONCURRENCY ဖြင့် ကန့်သတ်) ပြီးသည့်အစဉ်အတိုင်း Progress ပြမည်
+    runtime = get_async_runtime()
+    futures = {runtime.submit(_map_transcript_window(i + 1, len(windows), w, title)): i for i, w in enumerate(windows)}
+    notes = [None] * len(windows)
+    for done_count, future in enumerate(as_completed(futures), 1):
+        notes[futures[future]] = future.result()
+        if on_progress: on_progress(done_count, len(windows))
+    data = f"{format_youtube_header(source.get('meta'))}💬 ဗီဒီယို အပိုင်းလိုက် မှတ်စုများ (Chronological Notes from {len(windows)} parts):\n\n" + "\n\n".join(notes)
+    return data, len(windows)
+
+# ==========================================
+# 📦 YouTube Batch Mode
+# ==========================================
+YT_COLLECTION_MARKERS = ("list=", "/playlist", "/@", "/channel/", "/c/", "/user/")
+
+def expand_youtube_urls(text, limit=50):
+    # 💡 Playlist / Channel ကို Flat Extract လုပ်ပြီး Video တစ်ခုချင်းစီ ခွဲထုတ်သည်
+    items, seen = [], set()
+    for line in text.splitlines():
+        url = line.strip()
+        if not url: continue
+        if any(marker in url for marker in YT_COLLECTION_MARKERS):
+            if re.search(r"/(@[^/]+|channel/[^/]+|c/[^/]+|user/[^/]+)/?$", urlparse(url).path): url = url.rstrip("/") + "/videos"
+            ytdl = get_youtube_dl()
+            with ytdl["lock"]:
+                info = ytdl["ydl"].extract_info(url, download=False)
+            entries = [(e.get("id"), e.get("title")) for e in (info.get("entries") or []) if e and e.get("id") and e.get("ie_key", "Youtube") == "Youtube"]
+        else:
+            entries = [(parse_youtube_id(url), None)]
+        for video_id, title in entries:
+            if video_id in seen: continue
+            seen.add(video_id)
+            items.append({"video_id": video_id, "url": f"https://www.youtube.com/watch?v={video_id}", "title": title})
+            if len(items) >= limit: return items
+    return items
+
+class RateLimiter:
+    def __init__(self, per_minute):
+        self.interval = 60.0 / per_minute if per_minute else 0.0
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+
+    def acquire(self):
+        with self.lock:
+            now = time.time()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now: time.sleep(slot - now)
+
+def run_youtube_batch_item(item, style, custom_instructions, limiter, retries=1):
+    started = time.time()
+    last_error = None
+    for attempt in range(1, retries + 2):
+        try:
+            source = get_youtube_source(item["url"])
+            if is_srt_style(style):
+                text = build_local_subtitles(source)[0]
+            else:
+                smart_data, _ = prepare_youtube_data(source, style)
+                limiter.acquire()
+                text = generate_content_safe(build_youtube_prompt(style, custom_instructions, smart_data))
+                if text.startswith("⚠️ Error"): raise RuntimeError(text.splitlines()[0])
+            title = item["title"] or (source["meta"] or {}).get("title") or item["video_id"]
+            return {**item, "title": title, "text": text, "status": "done", "attempts": attempt, "elapsed": time.time() - started}
+        except Exception as e:
+            last_error = str(e)
+            if attempt <= retries: time.sleep(2 ** attempt)
+    return {**item, "title": item["title"] or item["video_id"], "text": "", "status": "failed", "error": last_error,
+            "attempts": retries + 1, "elapsed": time.time() - started}
+
+def build_batch_zip(results, file_ext):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        report = []
+        for i, result in enumerate(results, 1):
+            report.append(f"{i:02d}. [{result['status']}] {result['title']} ({result['url']})" + (f" - {result['error']}" if result.get("error") else ""))
+            if result["status"] != "done": continue
+            safe_title = re.sub(r"[^\w\-]+", "_", result["title"])[:60].strip("_") or result["video_id"]
+            zf.writestr(f"{i:02d}_{safe_title}.{file_ext}", result["text"])
+        zf.writestr("batch_report.txt", "\n".join(report))
+    return buffer.getvalue()
+
+def format_fetch_status(status):
+    icons = {"ok": "✅", "cached": "♻️", "missing": "➖", "timeout": "⏱️", "error": "❌"}
+    labels = {"metadata": "🎬 Metadata", "transcript": "💬 Transcript"}
+    lines = [" • ".join(f"{labels.get(name, name)}: {icons[info['state']]} {info['state']} ({info['elapsed']:.1f}s)" for name, info in status.items())]
+    lines += [f"↳ {labels.get(name, name)} error: {info['error']}" for name, info in status.items() if info.get("error")]
+    return lines
+
+def render_fetch_status(status):
+    for line in format_fetch_status(status): st.caption(line)
+
+def format_transcript_lines(segments):
+    return "\n".join(f"[{int(i['start'] // 60):02d}:{int(i['start'] % 60):02d}] {i['text']}" for i in segments)
+
+def format_youtube_header(meta):
+    if not meta: return ""
+    range_line = f"⏱️ ဗီဒီယို အပိုင်း (Selected Range): {meta['range_label']}\n" if meta.get("range_label") else ""
+    return f"🎬 ဗီဒီယို ခေါင်းစဉ်: {meta['title']}\n{range_line}📝 အကြောင်းအရာ: {meta['description']}\n\n"
+
+def format_youtube_smart_data(source):
+    parts = [format_youtube_header(source["meta"])]
+    if source["transcript"]:
+        parts.append(f"💬 ဗီဒီယိုတွင်း စကားပြောများ:\n{format_transcript_lines(source['transcript']['segments'])}\n")
+    else:
+        parts.append("⚠️ (ဤဗီဒီယိုတွင် စာတန်းထိုး မပါဝင်ပါ။)")
+    data_collected = "".join(parts)
+    if not source["meta"] and not source["transcript"]:
+        raise Exception("ဗီဒီယိုကို ဖတ်၍မရပါ။ လင့်ခ်မှန်ကန်မှု စစ်ဆေးပါ။")
+    return data_collected
+
+def fetch_youtube_smart_data(url):
+    return format_youtube_smart_data(get_youtube_source(url))
+
+# 💡 Reddit Auto Fetcher (FIXED User-Agent to bypass 403)
+REDDIT_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'}
+WIKI_HEADERS = {'User-Agent': 'UniversalStudioAI/1.0 (contact@example.com)'}
+
+async def fetch_reddit_story_async(subreddit):
+    try:
+        url = f"https://www.reddit.com/{subreddit}/top.json?limit=1&t=day"
+        async with get_async_runtime().http().get(url, headers=REDDIT_HEADERS) as response:
+            if response.status == 200:
+                data = await response.json(content_type=None)
+                post = data['data']['children'][0]['data']
+                return f"Title: {post.get('title', 'Unknown')}\n\nContent:\n{post.get('selftext', 'No text content found.')}"
+            else:
+                return f"Error: Reddit လုံခြုံရေးစနစ်မှ ပိတ်ထားပါသည် (Status: {response.status})။ Website သို့ တိုက်ရိုက်သွား၍ Copy ကူးပြီး အောက်ပါ Text Box တွင် ထည့်ပါ။"
+    except Exception as e:
+        return f"Error connecting to Reddit: {e}"
+
+def fetch_reddit_story(subreddit):
+    return get_async_runtime().run(fetch_reddit_story_async(subreddit))
+
+# 💡 Wikipedia Auto Fetcher (FIXED API Format & User-Agent)
+async def fetch_wikipedia_summary_async(query):
+    try:
+        params = {"action": "query", "prop": "extracts", "exintro": "1", "titles": query, "format": "json", "explaintext": "1"}
+        async with get_async_runtime().http().get("https://en.wikipedia.org/w/api.php", params=params, headers=WIKI_HEADERS) as response:
+            if response.status == 200:
+                data = await response.json(content_type=None)
+                pages = data['query']['pages']
+                for page_id in pages:
+                    if page_id == "-1": return "Error: ဤအကြောင်းအရာအတွက် Wikipedia တွင် မတွေ့ရှိပါ။"
+                    return pages[page_id].get('extract', 'စာသား ရှာမတွေ့ပါ။')
+            else:
+                return "Error: Wikipedia ဆာဗာမှ ပြန်လည်တုံ့ပြန်မှု မရှိပါ။"
+    except Exception as e:
+        return f"Error fetching Wikipedia: {e}"
+
+def fetch_wikipedia_summary(query):
+    return get_async_runtime().run(fetch_wikipedia_summary_async(query))
+
+# ==========================================
+# 📄 PDF Text Extraction (Lazy + Cached)
+# ==========================================
+PDF_CHAR_BUDGET = 30000  # Prompt ထဲ ထည့်မည့် အများဆုံး စာလုံးရေ (ပြည့်သည်နှင့် ဆက်မဖတ်တော့ပါ)
+
+@st.cache_resource
+def get_pdf_cache():
+    return TieredCache("pdf_text", ttl=7 * 24 * 3600, max_items=32, max_disk_mb=100)
+
+def pdf_page_count(pdf_file):
+    cache, key = get_pdf_cache(), make_cache_key("pdf-pages", hash_upload(pdf_file))
+    count = cache.get(key)
+    if count is None:
+        count = len(PyPDF2.PdfReader(io.BytesIO(pdf_file.getvalue())).pages)
+        cache.set(key, count)
+    return count
+
+def _read_pdf_page(reader, n):
+    try: return reader.pages[n].extract_text() or ""
+    except Exception: return ""  # ပျက်နေသော စာမျက်နှာ တစ်ခုကြောင့် ဖိုင်တစ်ခုလုံး မကျစေရန်
+
+def _extract_pages(reader, pages, budget):
+    # 💡 Budget ပြည့်ရန် စာမျက်နှာ အနည်းငယ်သာ လိုသဖြင့် အစဉ်လိုက်ဖတ်ပြီး ပြည့်သည်နှင့် ရပ်သည်
+    texts, total = [], 0
+    for n in pages:
+        texts.append(_read_pdf_page(reader, n))
+        total += len(texts[-1]) + 1
+        if total >= budget: break
+    return texts
+
+# 💡 PDF Extractor
+def extract_text_from_pdf(pdf_file, page_range=None, budget=PDF_CHAR_BUDGET):
+    # page_range = (ပထမ, နောက်ဆုံး) စာမျက်နှာ (1 မှ စသည်)၊ ဖိုင် Hash အလိုက် Cache လုပ်သဖြင့် ပြန်တင်/Rerun တွင် ချက်ချင်း ရမည်
+    try:
+        cache, key = get_pdf_cache(), make_cache_key("pdf-text", hash_upload(pdf_file), page_range, budget)
+        cached = cache.get(key)
+        if cached is not None: return cached["text"]
+        reader = PyPDF2.PdfReader(io.BytesIO(pdf_file.getvalue()))
+        first, last = page_range or (1, len(reader.pages))
+        pages = list(range(max(first, 1) - 1, min(last, len(reader.pages))))
+        texts = _extract_pages(reader, pages, budget)
+        text = "".join(t + "\n" for t in texts)[:budget]
+        cache.set(key, {"text": text, "pages": len(texts)})
+        return text
+    except Exception as e:
+        return f"Error extracting PDF: {e}"
+
+# ==========================================
+# 🗂️ Background Job Queue (Persistent)
+# ==========================================
+JOB_WORKERS = 2  # Gemini Quota ကို မကုန်စေရန် တပြိုင်နက် Run မည့် အလုပ်ကြီး အရေအတွက်
+JOB_HISTORY_LIMIT = 30
+JOB_POLL_SECONDS = 2
+JOB_PROGRESS_INTERVAL = 0.5
+JOB_SPOOL_DIR = os.path.join(CACHE_DIR, "job_spool")  # Job များအတွက် Disk ပေါ်သို့ ချထားသော Upload ဖိုင်များ
+JOB_ICONS = {"queued": "🕒", "running": "⏳", "done": "✅", "partial": "🧩", "failed": "❌", "interrupted": "⚠️"}
+
+class JobQueue:
+    # 💡 Worker အရေအတွက် ကန့်သတ်ထားသော Pool ပေါ်တွင် Run ပြီး Job Record များကို Vault DB ထဲ သိမ်းသဖြင့်
+    # Tab Reload / Menu ပြောင်းသော်လည်း အလုပ်နှင့် ရလဒ် မပျောက်ပါ
+    def __init__(self, workers=JOB_WORKERS):
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="muse-job")
+        with closing(vault_connect()) as conn, conn:
+            # Server ပြန်စသဖြင့် Thread ပါ ပျောက်သွားသော Job များ
+            conn.execute("UPDATE jobs SET status = 'failed', error = 'Server restarted before the job finished.', finished_at = ? WHERE status IN ('queued', 'running')",
+                         (time.time(),))
+        # ထို Job များ၏ ဖျက်ရန် ကျန်ခဲ့သော Spool ဖိုင်များ
+        shutil.rmtree(JOB_SPOOL_DIR, ignore_errors=True)
+
+    def _update(self, job_id, **fields):
+        with closing(vault_connect()) as conn, conn:
+            conn.execute(f"UPDATE jobs SET {', '.join(f'{k} = ?' for k in fields)} WHERE id = ?", (*fields.values(), job_id))
+
+    def submit(self, kind, title, fn, user_ns, target=None, vault=None):
+        # 💡 cache_resource Object ဖြစ်သဖြင့် Workspace (user_ns) ကို Global မှ မဖတ်ဘဲ ခေါ်သူက အမြဲ ပေးရမည်
+        job_id = uuid.uuid4().hex[:12]
+        with closing(vault_connect()) as conn, conn:
+            conn.execute("INSERT INTO jobs (id, user_ns, kind, title, status, target, created_at) VALUES (?, ?, ?, ?, 'queued', ?, ?)",
+                         (job_id, user_ns, kind, title, target, time.time()))
+            conn.execute("DELETE FROM jobs WHERE user_ns = ? AND status NOT IN ('queued', 'running') AND id NOT IN "
+                         "(SELECT id FROM jobs WHERE user_ns = ? ORDER BY created_at DESC LIMIT ?)", (user_ns, user_ns, JOB_HISTORY_LIMIT))
+        # 💡 Job အတွင်း st.cache_resource Getter များ ခေါ်သဖြင့် ScriptRunContext ပါအောင် ctx_submit ဖြင့် တင်သည်
+        ctx_submit(self.pool, self._run, job_id, fn, user_ns, vault)
+        return job_id
+
+    def _run(self, job_id, fn, user_ns, vault):
+        self._update(job_id, status="running", started_at=time.time(), message="Starting...")
+        last_write = [0.0]
+        def on_progress(fraction, message="", partial=None):
+            # DB ကို ခဏခဏ မရေးမိစေရန် Progress ကို Throttle လုပ်သည် (partial ရလဒ်ပါလျှင်မူ ချက်ချင်း ရေးမည်)
+            if partial is None and time.time() - last_write[0] < JOB_PROGRESS_INTERVAL: return
+            last_write[0] = time.time()
+            fields = {"progress": min(max(fraction, 0.0), 0.99), "message": message}
+            if partial is not None: fields["result"] = partial
+            self._update(job_id, **fields)
+        try:
+            output = fn(on_progress)
+            text = output["text"]
+            if not text or text.startswith("⚠️ Error"): raise RuntimeError(text or "Empty result")
+            # 💡 output["error"] ပါလျှင် အစိတ်အပိုင်းတချို့သာ အောင်မြင်သဖြင့် (partial) ရလဒ်ကို ပေးသော်လည်း Vault ထဲ အပြည့်အစုံအဖြစ် မသိမ်းပါ
+            error = output.get("error")
+            vault_id = save_to_vault(vault["title"], text, vault["type"], source=vault.get("source"), user_ns=user_ns) if vault and not error else None
+            meta = {k: v for k, v in output.items() if k not in ("text", "error")}
+            self._update(job_id, status="partial" if error else "done", progress=1.0, message="", result=text, meta=json.dumps(meta, ensure_ascii=False),
+                         error=error, vault_id=vault_id, finished_at=time.time())
+        except Exception as e:
+            self._update(job_id, status="failed", message="", error=str(e)[:2000], finished_at=time.time())
+
+    def list(self, user_ns, limit=JOB_HISTORY_LIMIT):
+        with closing(vault_connect()) as conn:
+            rows = conn.execute("SELECT * FROM jobs WHERE user_ns = ? ORDER BY created_at DESC LIMIT ?", (user_ns, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def get(self, job_id):
+        with closing(vault_connect()) as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def clear_finished(self, user_ns):
+        with closing(vault_connect()) as conn, conn:
+            return conn.execute("DELETE FROM jobs WHERE user_ns = ? AND status NOT IN ('queued', 'running')", (user_ns,)).rowcount
+
+@st.cache_resource
+def get_job_queue():
+    return JobQueue()
+
+def enqueue_job(kind, title, fn, target, vault=None):
+    # 💡 ဤ Session မှ တင်ထားသော Job များကို မှတ်ထားပြီး ပြီးဆုံးသည်နှင့် ရလဒ်ကို Session State သို့ အလိုအလျောက် ထည့်ပေးမည်
+    # (Sidebar ၏ My Jobs Panel က Poll စလုပ်နိုင်ရန် ချက်ချင်း Rerun လုပ်သည်)
+    job_id = get_job_queue().submit(kind, title, fn, user_ns=VAULT_USER, target=target, vault=vault)
+    st.session_state.setdefault("my_job_ids", []).append(job_id)
+    st.session_state.job_flash = f"🗂️ '{title}' ကို Queue ထဲ ထည့်ပြီးပါပြီ! ပြီးဆုံးပါက ရလဒ် စာမျက်နှာတွင် အလိုအလျောက် ပေါ်လာပါမည်။"
+    st.rerun()
+
+def deliver_job_result(job):
+    # Job ၏ ရလဒ်ကို target Key သို့၊ meta["state"] ထဲရှိ Key များကိုလည်း Session State သို့ ထည့်သည်
+    meta = json.loads(job["meta"] or "{}")
+    if job["target"]: st.session_state[job["target"]] = job["result"]
+    for key, value in (meta.get("state") or {}).items(): st.session_state[key] = value
+
+def collect_finished_jobs():
+    pending = st.session_state.get("my_job_ids", [])
+    if not pending: return 0
+    queue, delivered = get_job_queue(), 0
+    for job_id in list(pending):
+        job = queue.get(job_id)
+        if job is None or job["status"] in ("queued", "running"): continue
+        if job["status"] in ("done", "partial"):
+            deliver_job_result(job)
+            delivered += 1
+        pending.remove(job_id)
+    return delivered
+
+def pending_job_for(target):
+    # ဤ Session မှ တင်ထားပြီး မပြီးသေးသော target တူ Job (စာမျက်နှာတွင် Progress ပြရန်)
+    queue = get_job_queue()
+    for job_id in reversed(st.session_state.get("my_job_ids", [])):
+        job = queue.get(job_id)
+        if job and job["target"] == target and job["status"] in ("queued", "running"): return job
+    return None
+
+def render_job_row(job):
+    elapsed = (job["finished_at"] or time.time()) - (job["started_at"] or job["created_at"])
+    st.caption(f"{JOB_ICONS.get(job['status'], '•')} **{job['title']}** • {job['status']} • {elapsed:.0f}s")
+    if job["status"] == "running": st.progress(job["progress"], text=job["message"] or None)
+    if job["status"] in ("partial", "failed", "interrupted") and job["error"]: st.caption(f"↳ {job['error'][:200]}")
+    if job["status"] in ("done", "partial"):
+        for note in json.loads(job["meta"] or "{}").get("notes", []): st.caption(f"↳ {note}")
+        if job["vault_id"]: st.caption("↳ 💾 မှတ်ဉာဏ်တိုက်ထဲ သိမ်းပြီး")
+        if job["target"] and st.button("📥 Load result", key=f"job_load_{job['id']}", use_container_width=True):
+            deliver_job_result(job)
+            st.rerun()
+
+def render_my_jobs(active_before):
+    jobs = get_job_queue().list(user_ns=VAULT_USER)
+    active = sum(job["status"] in ("queued", "running") for job in jobs)
+    # 💡 Job တစ်ခု ပြီးသွားပါက App တစ်ခုလုံးကို Rerun ၍ ရလဒ်ကို စာမျက်နှာတွင် ချက်ချင်း ပြမည်
+    if active < active_before:
+        collect_finished_jobs()
+        st.rerun()
+    if not jobs: st.caption("Background Job မရှိသေးပါ။")
+    for job in jobs[:8]: render_job_row(job)
+    if active < len(jobs) and st.button("🧹 ပြီးဆုံးသော Job များ ရှင်းမည်", key="clear_jobs"):
+        get_job_queue().clear_finished(user_ns=VAULT_USER)
+        st.rerun()
+
+# 💡 Job တစ်ခုချင်းစီအတွက် Worker Thread ပေါ်တွင် Run မည့် Function များ (st.* UI မခေါ်ရ၊ on_progress ဖြင့်သာ အခြေအနေ ပြန်ပို့သည်)
+def run_media_script_job(media_path, media_name, style, custom_instructions, is_video, proxy_preset, use_audio_proxy, trim_silence, segment_seconds, segment_workers, on_progress):
+    # 💡 media_path သည် spool_upload ဖြင့် Disk ပေါ်သို့ ချထားသော Temp ဖိုင် (RAM ထဲ Copy မထားရ)၊ Job ပြီးသည်နှင့် ဖျက်မည်
+    try:
+        return _run_media_script(media_path, media_name, style, custom_instructions, is_video, proxy_preset, use_audio_proxy, trim_silence,
+                                 segment_seconds, segment_workers, on_progress)
+    finally:
+        if os.path.exists(media_path): os.remove(media_path)
+
+def _run_media_script(media, media_name, style, custom_instructions, is_video, proxy_preset, use_audio_proxy, trim_silence, segment_seconds, segment_workers, on_progress):
+    notes = []
+    upload_target, upload_id, media_tmap = prepare_media_upload(media, proxy_preset, use_audio_proxy, trim_silence,
+                                                                lambda msg: on_progress(0.05, msg), on_note=lambda kind, msg: notes.append(msg))
+    master_prompt = build_media_prompt(style, custom_instructions, is_video, proxy_preset if upload_target is not media else None)
+    if segment_seconds:
+        is_transcript = "Transcript" in style
+        part_prompt = master_prompt if is_transcript else build_media_notes_prompt(is_video)
+        stitched, n_parts = run_segmented_media_analysis(upload_target, upload_id, part_prompt, is_video, segment_seconds, segment_workers,
+                                                         on_progress=lambda done, total: on_progress(0.1 + 0.7 * done / total, f"🧩 {done} / {total} parts analyzed"))
+        notes.append(f"🧩 ဖိုင်ကို အပိုင်း ({n_parts}) ပိုင်း ခွဲ၍ လေ့လာပြီးပါပြီ။")
+        if is_transcript: text = stitched
+        else:
+            on_progress(0.85, "✍️ မှတ်စုများမှ Script ရေးနေပါသည်")
+            text = generate_content_safe(master_prompt + f"""
+                    NOTE: The media was analyzed in {n_parts} parts. The chronological notes below are your ONLY source; treat them as what was seen and heard.
+
+                    --- CHRONOLOGICAL NOTES ---
+                    {stitched}
+                    ---------------------------
+                    """)
+    else:
+        myfile = upload_media_file(upload_target, on_status=lambda msg: on_progress(0.2, msg), content_id=upload_id)
+        on_progress(0.5, "✍️ AI မှ Script ရေးနေပါသည်")
+        text = generate_content_safe(master_prompt, myfile)
+    if media_tmap and media_tmap != [[0.0, 0.0]] and not text.startswith("⚠️ Error"):
+        # 💡 တိတ်ဆိတ်ချိန် ဖြတ်ထားသဖြင့် Timestamp များကို မူရင်း Timeline သို့ ပြန်ပြောင်းသည်
+        text = remap_timestamps(text, media_tmap)
+        notes.append("🕒 Timestamps များကို မူရင်းဖိုင်၏ Timeline သို့ ပြန်ညှိပြီးပါပြီ။")
+    return {"text": text, "notes": notes, "state": {"current_media_name": media_name}}
+
+def run_youtube_script_job(url, ranges, style, custom_instructions, on_progress):
+    on_progress(0.05, "⚡ YouTube မှ အချက်အလက်များကို ဆွဲယူနေပါသည်")
+    source = get_youtube_source(url)
+    notes = format_fetch_status(source["status"])
+    source = clip_youtube_source(source, ranges)
+    clip = source.get("clip")
+    if clip and clip.get("total_segments"):
+        notes.append(f"✂️ {clip['label']} • Transcript {clip['segments']} / {clip['total_segments']} segments သာ အသုံးပြုခဲ့သည်")
+    if is_srt_style(style):
+        # 💡 Original SRT ကို Local Subtitle Engine ဖြင့် ချက်ချင်း ထုတ်သည် (API ခေါ်ရန် မလို)
+        srt, vtt = build_local_subtitles(source)
+        return {"text": srt, "notes": notes, "state": {"yt_final_vtt": vtt}}
+    smart_data, map_parts = prepare_youtube_data(source, style, on_progress=lambda done, total: on_progress(0.1 + 0.5 * done / total, f"📚 {done} / {total} parts summarized"))
+    if map_parts: notes.append(f"📚 Long transcript ကို အပိုင်း ({map_parts}) ပိုင်းခွဲ၍ အပြိုင် လုပ်ဆောင်ပြီးပါပြီ။")
+    on_progress(0.7, "✍️ AI မှ Script ရေးနေပါသည်")
+    text = generate_content_safe(build_youtube_prompt(style, custom_instructions, smart_data))
+    return {"text": text, "notes": notes, "state": {"yt_final_vtt": ""}}
+
+# ==========================================
+# 📚 Series Outline → Parallel Episodes
+# ==========================================
+SERIES_SOURCE_CHARS = 40000
+_MY_DIGITS = str.maketrans("0123456789", "၀၁၂၃၄၅၆၇၈၉")
+
+SERIES_VOICE_RULES = """
+            1. Start with an Epic HOOK.
+            2. Write strictly for the EAR (Conversational Burmese: တယ်, မယ်, တဲ့). AVOID formal book language (သည်, ၏).
+            3. Do NOT output a wall of text. Use spacing and ellipses (...) for pacing.
+            4. DO NOT use Markdown tables or excessive hyphens (---).
+"""
+
+def split_source_slices(text, parts):
+    # 💡 Source ကို စာပိုဒ် (မရှိလျှင် ဝါကျ) နယ်နိမိတ်အတိုင်း အရှည် ညီတူနီးပါး အပိုင်းများ ခွဲပြီး Episode တစ်ခုစီကို ကိုယ်ပိုင်အပိုင်းသာ ပေးသည်
+    pieces = [p for p in re.split(r"\n\s*\n", text) if p.strip()]
+    if len(pieces) < parts * 2: pieces = [p for p in re.split(r"(?<=[.!?။])\s+", text) if p.strip()]
+    target = sum(len(p) for p in pieces) / parts
+    slices, current, size = [], [], 0
+    for piece in pieces:
+        current.append(piece)
+        size += len(piece)
+        if len(slices) < parts - 1 and size >= target * (len(slices) + 1):
+            slices.append("\n\n".join(current))
+            current = []
+    slices.append("\n\n".join(current))
+    # စာနည်းလွန်း၍ အပိုင်းမပြည့်ပါက Source တစ်ခုလုံးကို ပေးမည်
+    return [piece or text for piece in slices + [""] * (parts - len(slices))]
+
+def build_series_plan_prompt(source, parts, tone):
+    return f"""
+            Act as a Master Series Showrunner. Read the source text and plan a BURMESE voiceover script series of EXACTLY {parts} episodes.
+            TONE: {tone}
+            The episodes follow the source in order: episode k adapts roughly part k of {parts} of the source.
+
+            Return ONLY valid JSON (no Markdown, no code fences) in exactly this shape:
+            {{"bible": "compact series bible: main characters, setting, key facts, narrator voice (max 150 words)",
+              "episodes": [{{"title": "short Burmese episode title", "beats": ["3-5 short story beats"], "cliffhanger": "how this episode ends"}}]}}
+
+            SOURCE TEXT:
+            {source}
+            """
+
+def parse_series_plan(text, parts):
+    if text.startswith("⚠️ Error"): raise RuntimeError(text.splitlines()[0])
+    match = re.search(r"\{.*\}", text, re.S)
+    if not match: raise ValueError("Series Plan (JSON) ကို ဖတ်၍ မရပါ။")
+    plan = json.loads(match.group(0))
+    episodes = [e for e in plan.get("episodes") or [] if isinstance(e, dict)][:parts]
+    episodes += [{} for _ in range(parts - len(episodes))]
+    return {"bible": str(plan.get("bible") or "").strip(),
+            "episodes": [{"title": str(e.get("title") or f"Episode {i + 1}"), "beats": [str(b) for b in e.get("beats") or []],
+                          "cliffhanger": str(e.get("cliffhanger") or "")} for i, e in enumerate(episodes)]}
+
+def build_episode_prompt(plan, index):
+    episodes, episode = plan["episodes"], plan["episodes"][index]
+    outline = "\n".join(f"{i + 1}. {e['title']}: {'; '.join(e['beats'])}" for i, e in enumerate(episodes))
+    is_last = index == len(episodes) - 1
+    ending = "Give the whole series a powerful, satisfying ending." if is_last else \
+        f"End with a MASSIVE CLIFFHANGER ({episode['cliffhanger'] or 'leading into the next episode'}), e.g. \"အပိုင်း {str(index + 2).translate(_MY_DIGITS)} မှာ ဆက်ကြည့်ကြရအောင်...\""
+    return f"""
+            Act as a Master Visual Storyteller and Series Writer.
+            You are writing EPISODE {index + 1} of {len(episodes)} of a BURMESE voiceover script series.
+            TONE: {plan['tone']}
+
+            SERIES BIBLE (keep names, facts and narrator voice consistent):
+            {plan['bible']}
+
+            FULL EPISODE PLAN (for continuity only - write ONLY your episode):
+            {outline}
+
+            YOUR EPISODE: {episode['title']}
+            BEATS TO COVER: {'; '.join(episode['beats'])}
+
+            RULES:
+            {SERIES_VOICE_RULES}
+            5. {ending}
+            Output ONLY the script body of this episode. Do NOT write the episode heading.
+
+            SOURCE MATERIAL FOR THIS EPISODE:
+            {plan['sources'][index]}
+            """
+
+def format_series_episode(index, title, body):
+    return f"🎬 အပိုင်း ({str(index + 1).translate(_MY_DIGITS)}) - {title}\n\n{body.strip()}"
+
+def assemble_series(plan, episodes, failed=()):
+    return "\n\n".join(format_series_episode(i, e["title"], episodes[i] if episodes[i] is not None else "⚠️ ရေး၍ မရပါ" if i in failed else "⏳ ...")
+                         for i, e in enumerate(plan["episodes"]))
+
+def run_series_job(source, parts, tone, on_progress):
+    # 💡 ပထမ Call တစ်ခုဖြင့် Series Bible + Beat Sheet ကိုသာ ရေးပြီး Episode များကို Async Runtime ပေါ်တွင် အပြိုင် ရေးသည်
+    # (Episode တစ်ခုချင်း Output Token ကန့်သတ်ချက်အတွင်း ရှိသဖြင့် အပိုင်း ၁၅ ထိ မပြတ်တော့ပါ)
+    on_progress(0.05, "🧭 Series Bible နှင့် Episode Plan ရေးနေပါသည်")
+    plan = parse_series_plan(generate_content_safe(build_series_plan_prompt(source, parts, tone)), parts)
+    plan.update({"tone": tone, "sources": split_source_slices(source, parts)})
+    episodes, failed = [None] * parts, []
+    runtime = get_async_runtime()
+    futures = {runtime.submit(generate_content_async(build_episode_prompt(plan, i))): i for i in range(parts)}
+    for done_count, future in enumerate(as_completed(futures), 1):
+        # 💡 မအောင်မြင်သော Episode ၏ Error စာသားကို Episode အဖြစ် မသိမ်းဘဲ None ထားပြီး (🔁 ဖြင့် ပြန်ရေးနိုင်ရန်) စာရင်းမှတ်သည်
+        i = futures[future]
+        text = future.result() if not future.exception() else f"⚠️ Error: {future.exception()}"
+        if text.startswith("⚠️ Error"): failed.append(i)
+        else: episodes[i] = text
+        on_progress(0.15 + 0.85 * done_count / parts, f"🎬 {done_count} / {parts} episodes", partial=assemble_series(plan, episodes, failed))
+    if len(failed) == parts: raise RuntimeError("Episode တစ်ခုမှ ရေး၍ မရပါ။")
+    error = f"Episode {', '.join(str(i + 1) for i in sorted(failed))} ရေး၍ မရပါ။ (🔁 ဖြင့် ပြန်ရေးနိုင်သည်)" if failed else None
+    return {"text": assemble_series(plan, episodes, failed), "error": error, "state": {"series_plan": plan, "series_episodes": episodes}}
+
+def render_series_progress(job_id):
+    job = get_job_queue().get(job_id)
+    if not job or job["status"] not in ("queued", "running"):
+        collect_finished_jobs()
+        st.rerun()
+    st.progress(job["progress"], text=job["message"] or "🕒 Queue ထဲတွင် စောင့်နေပါသည်")
+    # ပြီးသမျှ Episode များကို စာမျက်နှာတွင် ချက်ချင်း ပြသည်
+    if job["result"]: st.markdown(job["result"])
+
+# ==========================================
+# 🧭 3. SIDEBAR & MENU
+# ==========================================
+with st.sidebar:
+    st.header("🔑 Master Key")
+    api_key = st.text_input("Gemini API Key", type="password")
+    if api_key:
+        genai.configure(api_key=api_key)
+        GENAI_KEY_FP = get_genai_keyring().remember(api_key)
+        # 💡 list_models() ကို ၁၀ မိနစ်တစ်ကြိမ်သာ ခေါ်ပြီး ရလဒ်ကို Model ရွေးချယ်ရာတွင် သုံးသည်
+        if st.button("📡 Check System"): list_available_models.clear()
+        try:
+            AVAILABLE_MODELS = list_available_models(GENAI_KEY_FP)
+            st.success(f"✅ Gemini Online! ({len(AVAILABLE_MODELS)} models)")
+        except Exception as e:
+            st.error(f"❌ Invalid Key ({classify_model_error(e)})")
+
+    # 💡 မှတ်ဉာဏ်တိုက်ကို အသုံးပြုသူ တစ်ဦးချင်းစီအတွက် ခွဲခြားထားရန်
+    VAULT_USER = st.text_input("👤 Vault Workspace", value="default", key="vault_user").strip() or "default"
+
+    with st.expander("🩺 Model Health"):
+        health_rows = get_model_health().snapshot()
+        if not health_rows: st.caption("Model ခေါ်ဆိုမှု မရှိသေးပါ။")
+        for row in health_rows:
+            p50 = f"{row['p50']:.1f}s" if row['p50'] is not None else "-"
+            p95 = f"{row['p95']:.1f}s" if row['p95'] is not None else "-"
+            status = "🔴 Cooling down" if row['open'] else "🟢 Healthy"
+            st.caption(f"{status} • {row['model'].replace('models/', '')} • p50 {p50} / p95 {p95}")
+            if row['last_kind']: st.caption(f"↳ Last error: {row['last_kind']}")
+
+    # 💡 တူညီသော Prompt များကို Gemini ထံ ထပ်မပို့ဘဲ Cache မှ ပြန်ပေးရန်
+    with st.expander("♻️ Response Cache"):
+        USE_RESPONSE_CACHE = st.toggle("Cache ကို အသုံးပြုမည်", value=True, key="use_response_cache", help="ပိတ်ထားပါက အမြဲ အသစ် Generate လုပ်ပါမည်။")
+        cache_stats = get_response_cache().stats()
+        st.caption(f"Hits: {cache_stats['hits']} (Disk: {cache_stats['disk_hits']}) • Misses: {cache_stats['misses']} • Hit Rate: {cache_stats['hit_rate']:.0%}")
+        if st.button("🧹 Cache ရှင်းမည်", key="clear_response_cache"):
+            get_response_cache().clear()
+            st.success("✅ Cache ရှင်းလင်းပြီးပါပြီ!")
+
+    # 💡 Background Runtime ပေါ်တွင် Run နေသော ဤ Session ၏ Async Job များ
+    with st.expander("⚙️ Background Tasks"):
+        async_jobs = st.session_state.get("async_jobs", {})
+        if not async_jobs: st.caption("Background Task မရှိသေးပါ။")
+        for job in reversed(list(async_jobs.values())[-5:]):
+            status = async_job_status(job)
+            icon = {"running": "⏳", "done": "✅", "failed": "❌"}[status]
+            elapsed = job.get("finished", time.time()) - job["started"]
+            st.caption(f"{icon} {job['label']} • {elapsed:.1f}s")
+        if any(async_job_status(j) != "running" for j in async_jobs.values()) and st.button("🧹 ပြီးဆုံးသော Task များ ရှင်းမည်", key="clear_async_jobs"):
+            st.session_state.async_jobs = {k: j for k, j in async_jobs.items() if async_job_status(j) == "running"}
+            st.rerun()
+
+    # 💡 ဤ Workspace ၏ Background Job များ (Job Run နေစဉ်သာ အလိုအလျောက် Refresh လုပ်သည်)
+    if st.session_state.get("job_flash"): st.toast(st.session_state.pop("job_flash"))
+    collect_finished_jobs()
+    active_jobs = sum(job["status"] in ("queued", "running") for job in get_job_queue().list(user_ns=VAULT_USER))
+    with st.expander(f"🗂️ My Jobs ({active_jobs} active)" if active_jobs else "🗂️ My Jobs", expanded=bool(active_jobs)):
+        st.fragment(render_my_jobs, run_every=JOB_POLL_SECONDS if active_jobs else None)(active_jobs)
+
+    with st.expander("⏱️ Time to First Token"):
+        recent_calls = list(get_generation_metrics()["calls"])[-5:]
+        if not recent_calls: st.caption("Generate လုပ်ထားခြင်း မရှိသေးပါ။")
+        for call in reversed(recent_calls):
+            ttft_txt = f"{call['ttft']:.1f}s" if call['ttft'] is not None else "-"
+            st.caption(f"{call['model'].replace('models/', '')} • TTFT {ttft_txt} • Total {call['total']:.1f}s")
+            
+    st.write("---")
+    st.header("🧭 Menu")
+    selected_menu = st.radio("သွားလိုသော နေရာကို ရွေးပါ:", [
+        "💡 Idea to Script", 
+        "📂 Video to Script", 
+        "🎵 Audio to Script", 
+        "🔴 YouTube Master", 
+        "🦁 Smart Translator", 
+        "🎙️ Audio Studio",
+        "👁️ Vision Studio",  
+        "🎬 Director's Desk", 
+        "📚 Epic Series Maker", 
+        "📖 Magazine Studio",  # 👈 ဒီနေရာလေးမှာ အသစ်ဝင်လာပါပြီ
+        "📚 မှတ်ဉာဏ်တိုက်", 
+        "🕵️‍♂️ Lore Hunter", 
+        "🎨 Visual Director"
+    ])
+
+# ==========================================
+# 🎬 4. MAIN INTERFACES
+# ==========================================
+st.title("🎬 Universal Studio AI")
+st.caption("Scripting • Research • Translation • Audio • Vision • Series Making")
+
+# --- TAB 1: IDEA TO SCRIPT HUB ---
+if selected_menu == "💡 Idea to Script":
+    st.header("💡 Idea to Script Hub")
+    mm_tab, eng_tab = st.tabs(["🇲🇲 MM Social Media", "🇺🇸 English Creative Studio"])
+
+    # ==========================================
+    # 🇲🇲 MYANMAR TAB (Social Media Scriptwriter)
+    # ==========================================
+    with mm_tab:
+        st.subheader("📱 MM Social Media")
+        
+        if 'mm_outline_text' not in st.session_state: st.session_state.mm_outline_text = ""
+        if 'mm_final_script' not in st.session_state: st.session_state.mm_final_script = ""
+
+        # 💡 "Surprise Me" အတွက် Session State မှတ်ဉာဏ်
+        if "current_mm_topic" not in st.session_state:
+            st.session_state.current_mm_topic = ""
+
+        st.subheader("📝 Topic")
+        col_topic, col_dice = st.columns([4, 1])
+
+        with col_topic:
+            # 💡 အသစ်ထပ်တိုး - ဇာတ်လမ်းအရှည်ကြီးတွေပါ ထည့်လို့ရအောင် text_area သို့ ပြောင်းထားသည်
+            mm_topic = st.text_area("Topic Input", value=st.session_state.current_mm_topic, height=100, placeholder="ဥပမာ - အချိန်ခရီးသွားတဲ့ ကော်ဖီဆိုင်လေး (သို့) ဇာတ်လမ်းအကြမ်း အစအဆုံး ကူးထည့်ပါ...", label_visibility="collapsed")
+
+        with col_dice:
+            # 🎲 Surprise Me ခလုတ်
+            if st.button("🎲 Surprise Me!", use_container_width=True):
+                awesome_ideas = [
+                    "လူသားတွေရဲ့ အရိပ်တွေကို ဝယ်ယူတဲ့ လျှို့ဝှက်ဈေးဆိုင်",
+                    "မိုးစက်တွေနဲ့အတူ ပါသွားတဲ့ လွမ်းသူ့စာ",
+                    "၁၀ နှစ်ကျော် ပျောက်ဆုံးနေတဲ့ တောတွင်းက ရွာလေးတစ်ရွာ",
+                    "ကမ္ဘာကြီး ရပ်တန့်သွားတဲ့ ၅ စက္ကန့်အတွင်း ဖြစ်ပျက်ခဲ့တာတွေ",
+                    "ဘဝမှာ အရှုံးပေးချင်စိတ်ပေါက်နေတဲ့သူအတွက် ခွန်အားပေးစာ",
+                    "နဂါးတွေ ရှင်သန်နေဆဲဖြစ်တဲ့ မြေအောက်ကမ္ဘာ",
+                    "ကြောင်လေးတွေ ကမ္ဘာကို အုပ်စိုးသွားတဲ့နေ့",
+                    "မှန်ထဲက ကမ္ဘာနဲ့ အပြင်ကမ္ဘာ လဲလှယ်ခံလိုက်ရတဲ့ ကောင်လေး",
+                    "ညသန်းခေါင် ရေဒီယိုကနေ လာတဲ့ ထူးဆန်းတဲ့ အကူအညီတောင်းသံ",
+                    "လမင်းကို ချစ်မိသွားတဲ့ ပန်းနုရောင် တိမ်တိုက်လေး",
+                    "အချိန်တွေ ရပ်တန့်သွားတဲ့ ဆောင်းရာသီ ညတစ်ည",
+                    "ကိုယ့်ကိုယ်ကိုယ် ပြန်လည်ရှာဖွေတွေ့ရှိခြင်း အကြောင်း",
+                    "လူသားတွေ အကုန်လုံး အိပ်မက်တစ်ခုတည်း မက်တဲ့ ရုပ်ရှင်"
+                ]
+                import random
+                st.session_state.current_mm_topic = random.choice(awesome_ideas)
+                st.rerun() 
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1: 
+            # 💡 Seamless Loop ကို Platform မှာ ထပ်တိုးထားသည်
+            mm_platform = st.selectbox("📱 Platform", ["Facebook Video", "TikTok / Reels", "🔄 Seamless Loop Reel (၃၀ စက္ကန့်)", "YouTube Video", "Voiceover Only"], key="mm_plat")
+        with col2: 
+            mm_tone = st.selectbox("🎭 Tone / အမျိုးအစား", [
+                "💖 Soulful / Inspirational",
+                "🎬 Recap / Summary",
+                "🕵️‍♂️ True Crime / Mystery",
+                "📜 Epic Myth / Lore",
+                "🎧 Late Night ASMR / Calm",
+                "👻 Gothic / Midnight Tale",
+                "🥀 Gothic Poetry",
+                "😏 Sarcastic / Satirical",
+                "😂 Funny / Humorous",
+                "👔 Professional / Educational",
+                "📱 Casual / Vlog"
+            ], key="mm_tone")
+        with col3: 
+            mm_audience = st.selectbox("🎯 Audience", ["General Audience", "Youth / Gen Z", "Middle-aged Adults"], key="mm_aud")
+        with col4: 
+            mm_pov = st.selectbox("🗣️ ရှုထောင့် (POV)", ["Third-Person", "First-Person", "Dialogue"], key="mm_pov")
+
+        st.write("---")
+        
+        # 💡 ခလုတ်နာမည်များနှင့် Keyword များ သတ်မှတ်ခြင်း
+        if "Poetry" in mm_tone:
+            out_btn_text = "✨ ဒီ Outline အတိုင်း ကဗျာပုံစံ ရေးပါ"
+            direct_btn_text = "🚀 ကဗျာ တန်းရေးရန် (Direct Poem)"
+            type_keyword = "GOTHIC POEM (စကားပြေကဗျာ)"
+            success_msg = "✅ ကဗျာ ရေးသားပြီးပါပြီ!"
+        elif "Soulful" in mm_tone:
+            out_btn_text = "✨ ဒီ Outline အတိုင်း ရသစာတို ရေးပါ"
+            direct_btn_text = "🚀 ရသစာတို တန်းရေးရန် (Direct Story)"
+            type_keyword = "INSPIRATIONAL SHORT STORY (နှလုံးသားခွန်အားပေး ရသစာတို)"
+            success_msg = "✅ ရသစာတို ရေးသားပြီးပါပြီ!"
+        elif "Recap" in mm_tone:
+            out_btn_text = "✨ ဒီ Outline အတိုင်း အနှစ်ချုပ် ဇာတ်ညွှန်းရေးပါ"
+            direct_btn_text = "🚀 အနှစ်ချုပ် တန်းရေးရန် (Direct Recap)"
+            type_keyword = "MOVIE/BOOK RECAP SCRIPT (ရုပ်ရှင်/စာအုပ် အနှစ်ချုပ် ဇာတ်ညွှန်း)"
+            success_msg = "✅ အနှစ်ချုပ် ဇာတ်ညွှန်း ရေးသားပြီးပါပြီ!"
+        elif "True Crime" in mm_tone:
+            out_btn_text = "✨ ဒီ Outline အတိုင်း မှုခင်းဇာတ်ကြောင်း ရေးပါ"
+            direct_btn_text = "🚀 မှုခင်းဇာတ်ကြောင်း တန်းရေးရန် (Direct True Crime)"
+            type_keyword = "TRUE CRIME / MYSTERY SCRIPT (မှုခင်း/လျှို့ဝှက်ဆန်းကြယ် ဇာတ်ညွှန်း)"
+            success_msg = "✅ မှုခင်း ဇာတ်ညွှန်း ရေးသားပြီးပါပြီ!"
+        elif "Epic Myth" in mm_tone:
+            out_btn_text = "✨ ဒီ Outline အတိုင်း ဒဏ္ဍာရီဇာတ်ကြောင်း ရေးပါ"
+            direct_btn_text = "🚀 ဒဏ္ဍာရီ တန်းရေးရန် (Direct Lore)"
+            type_keyword = "EPIC MYTH / HISTORICAL LORE (သမိုင်း/ဒဏ္ဍာရီ ဇာတ်ကြောင်း)"
+            success_msg = "✅ ဒဏ္ဍာရီ ဇာတ်ညွှန်း ရေးသားပြီးပါပြီ!"
+        elif "ASMR" in mm_tone:
+            out_btn_text = "✨ ဒီ Outline အတိုင်း ASMR စာသား ရေးပါ"
+            direct_btn_text = "🚀 ASMR စာသား တန်းရေးရန် (Direct ASMR)"
+            type_keyword = "LATE NIGHT ASMR NARRATION (ညဘက်နားထောင်ရန် အေးချမ်းသောစာသား)"
+            success_msg = "✅ ASMR စာသား ရေးသားပြီးပါပြီ!"
+        elif "Tale" in mm_tone:
+            out_btn_text = "✨ ဒီ Outline အတိုင်း စကားပြေ/ဇာတ်လမ်းပုံစံ ရေးပါ"
+            direct_btn_text = "🚀 စကားပြေ တန်းရေးရန် (Direct Tale)"
+            type_keyword = "PROSE TALE (စကားပြေ ဇာတ်လမ်း)"
+            success_msg = "✅ ဇာတ်လမ်း ရေးသားပြီးပါပြီ!"
+        elif "Sarcastic" in mm_tone:
+            out_btn_text = "✨ ဒီ Outline အတိုင်း သရော်စာ ရေးပါ"
+            direct_btn_text = "🚀 သရော်စာ တန်းရေးရန် (Direct Satire)"
+            type_keyword = "SARCASTIC / SATIRICAL MONOLOGUE (ခနဲ့တဲ့တဲ့ သရော်စာ)"
+            success_msg = "✅ အမိုက်စား သရော်စာ ရေးသားပြီးပါပြီ!"
+        else:
+            out_btn_text = "✨ ဒီ Outline အတိုင်း စကားပြောဇာတ်ညွှန်း ရေးပါ"
+            direct_btn_text = "🚀 ဇာတ်ညွှန်း တန်းရေးရန် (Direct Script)"
+            type_keyword = "SPOKEN SCRIPT (စကားပြော ဇာတ်ညွှန်း)"
+            success_msg = "✅ ဇာတ်ညွှန်း ရေးသားပြီးပါပြီ!"
+
+        mm_b1, mm_b2 = st.columns(2)
+        with mm_b1: gen_mm_outline = st.button("📑 အဆင့် ၁: Outline အရင်ထုတ်ရန်", use_container_width=True, key="btn_mm_out")
+        with mm_b2: gen_mm_script = st.button(direct_btn_text, type="primary", use_container_width=True, key="btn_mm_script")
+
+        
+        # 💡 အခြေခံ ညွှန်ကြားချက်များ (VOICEOVER PRO EDITION)
+        mm_rules = f"""
+        CRITICAL INSTRUCTION: Your ENTIRE response MUST be in pure Burmese Language. 
+        VERY IMPORTANT: You MUST write the output as a {type_keyword}. 
+        
+        🔴 UNIVERSAL VOICEOVER & PRONOUN RULES:
+        1. NO ARBITRARY NAMES: NEVER use random placeholder names (like မေ, မေသူ, အောင်အောင်, etc.). ALWAYS use pronouns like "သူ" (He), "သူမ" (She), "သူတို့" (They), or descriptive terms like "ဒီကောင်လေး" (This boy), "ဒီအမျိုးသား" (This man).
+        2. VOICEOVER OPTIMIZED: Write strictly for the EAR. It must sound cinematic, rhythmic, and natural when read aloud by a voice actor or TTS.
+        3. SPOKEN BURMESE: Use natural spoken endings (တယ်, မယ်, တဲ့, တာ). STRICTLY AVOID formal/robotic book language (သည်, ၏, ၍) unless explicitly requested.
+        4. DRAMATIC PAUSES: Use ellipses (...) frequently to guide the voice actor's breathing and build suspense.
+        
+        Topic: {mm_topic}. Tone: {mm_tone}. Audience: {mm_audience}. 
+        """
+        
+        # 💡 နောက်ကွယ်မှ အတိအကျ ပုံသွင်းမည့် လျှို့ဝှက် Prompts များ
+        if "Soulful" in mm_tone:
+            mm_rules += "1. Write like 'Chicken Soup for the Soul'. Focus on deep human emotions.\n2. Use beautiful, poetic Burmese words.\n3. End with a profound life lesson.\n"
+        elif "Recap" in mm_tone:
+            mm_rules += "1. Fast-paced, engaging movie/book summary.\n2. Massive HOOK at the start.\n3. Highlight suspenseful parts like a campfire story.\n"
+        elif "True Crime" in mm_tone:
+            mm_rules += "1. Suspenseful, dark, analytical tone.\n2. Build tension, end with cliffhangers.\n3. Respectful but chilling voice.\n"
+        elif "Epic Myth" in mm_tone:
+            mm_rules += "1. Grand, cinematic, majestic tone.\n2. Characters sound like legends.\n3. Elegant/classic Burmese vocabulary.\n"
+        elif "ASMR" in mm_tone:
+            mm_rules += "1. Calm, soothing, intimate.\n2. Gentle pacing, frequent ellipses (...).\n3. Focus on relaxation/mindfulness.\n"
+        elif "Tale" in mm_tone:
+            mm_rules += "1. ANTI-CLICHÉ GOTHIC. Surreal, psychological.\n2. Deep aesthetic melancholy, plot twists.\n"
+        elif "Poetry" in mm_tone:
+            mm_rules += "1. Prose-poem/Voiceover format.\n2. NO traditional stanzas.\n3. Use dramatic pauses (...).\n4. Length: 4-7 sentences.\n"
+        elif "Sarcastic" in mm_tone:
+            mm_rules += "1. Highly sarcastic, dry, slightly mocking tone.\n2. Pretend to praise while criticizing.\n3. Sharp wit, irony. End with witty punchline.\n"
+
+        if "Third-Person" in mm_pov: mm_rules += "NARRATIVE STYLE: THIRD-PERSON.\n"
+        elif "First-Person" in mm_pov: mm_rules += "NARRATIVE STYLE: FIRST-PERSON.\n"
+        elif "Dialogue" in mm_pov: mm_rules += "NARRATIVE STYLE: DIALOGUE. Write every spoken line on its own line as [Speaker]: text (e.g. [Narrator]: ..., [သူမ]: ...) so each character can be voiced separately.\n"
+
+        # 💡 Seamless Loop အတွက် သီးသန့် Prompt Injection (The Magic Sauce)
+        if "Seamless Loop" in mm_platform:
+            mm_rules += """
+            🔴 CRITICAL FORMAT RULE: SEAMLESS LOOP REEL (STRICTLY 30 SECONDS MAX)
+            1. LENGTH LIMIT: The entire script must be VERY SHORT (around 60 to 80 words max). It must take exactly 20-30 seconds to speak out loud. Do not write long paragraphs!
+            2. The Body section must be ONLY 2 or 3 short, punchy sentences.
+            3. The script MUST end with an incomplete sentence or a cliffhanger phrase (The Outro).
+            4. That exact incomplete sentence MUST flow flawlessly into the very FIRST sentence of the script (The Hook).
+            
+            EXAMPLE OF A PERFECT LOOP:
+            [Outro]: "...အဲ့ဒီတော့ သင်က တကယ်လို့ သိချင်တယ်ဆိုရင်..."
+            [Hook]: "...ဒီအချက် (၃) ချက်က သင့်ဘဝကို ပြောင်းလဲပေးပါလိမ့်မယ်။"
+            (When played together: "...အဲ့ဒီတော့ သင်က တကယ်လို့ သိချင်တယ်ဆိုရင်... ဒီအချက် (၃) ချက်က သင့်ဘဝကို ပြောင်းလဲပေးပါလိမ့်မယ်။")
+            
+            FORMAT TO OUTPUT:
+            🎬 **[ခေါင်းစဉ်]**
+            
+            🔄 **[Loop ချိတ်ဆက်ပုံ ရှင်းလင်းချက်]**
+            (Explain briefly in Burmese how the Outro connects to the Hook).
+            
+            📝 **[ဇာတ်ညွှန်း]**
+            [Hook / ဗီဒီယို အစ] - ... (1 short sentence)
+            [Body / အကြောင်းအရာ] - ... (Max 2-3 short sentences. Extremely concise and engaging).
+            [Outro / ဗီဒီယို အဆုံး] - ... (Must be an incomplete thought that connects back to the hook).
+            """
+
+
+        if gen_mm_outline and api_key and mm_topic:
+            prompt = f"Create a 5-point OUTLINE for a {type_keyword} about '{mm_topic}'. MUST be 100% in Burmese. {mm_rules}"
+            stream_to_state("mm_outline_text", prompt)
+            st.session_state.mm_final_script = "" 
+
+        if st.session_state.mm_outline_text:
+            with st.expander("📑 Your Script Outline", expanded=True):
+                st.write(st.session_state.mm_outline_text)
+                if st.button(out_btn_text, use_container_width=True, key="btn_mm_full"):
+                    prompt = mm_rules + f"\nBased on this OUTLINE, write the full {type_keyword}:\n{st.session_state.mm_outline_text}"
+                    stream_to_state("mm_final_script", prompt)
+                    st.session_state.mm_outline_text = "" 
+                    st.rerun() 
+
+        if gen_mm_script and api_key and mm_topic:
+            prompt = f"Write a FULL, highly engaging {type_keyword}. {mm_rules}"
+            stream_to_state("mm_final_script", prompt)
+
+        if st.session_state.mm_final_script:
+            st.success(success_msg)
+            st.code(st.session_state.mm_final_script, language="markdown")
+            
+            c1, c2 = st.columns(2)
+            with c1:
+                if st.button("📲 AI TTS သို့ ပို့ရန်", key="send_mm_tts", use_container_width=True):
+                    st.session_state.tts_text_area = st.session_state.mm_final_script
+                    st.success("✅ Tab 6 သို့ ရောက်သွားပါပြီ!")
+            with c2:
+                if st.button("💾 မှတ်ဉာဏ်တိုက်သို့ သိမ်းမည်", key="save_to_vault_btn", use_container_width=True):
+                    save_to_vault(mm_topic, st.session_state.mm_final_script, type_keyword, source=selected_menu)
+                    st.success("✅ မှတ်ဉာဏ်တိုက် (Tab 7) တွင် သိမ်းဆည်းပြီးပါပြီ!")
+
+    # ==========================================
+    # 🇺🇸 ENGLISH TAB (Creative Literature Studio)
+    # ==========================================
+    with eng_tab:
+        st.subheader("✍️ English Creative Studio")
+        st.caption("Perfect for Teenagers, Children, and Heartwarming Adult Stories")
+        
+        if 'eng_final_text' not in st.session_state: st.session_state.eng_final_text = ""
+        if 'eng_target_audience' not in st.session_state: st.session_state.eng_target_audience = "Teenagers / Gen Z"
+
+        eng_topic = st.text_input("📝 What is the story about? (Topic)", placeholder="e.g., A magical forest, A lost letter...", key="eng_topic")
+        
+        col_e1, col_e2, col_e3 = st.columns(3)
+        with col_e1:
+            eng_format = st.selectbox("📜 Format", [
+                "Short Story", 
+                "Flash Fiction", 
+                "Poem", 
+                "Blog Article", 
+                "Children's Story", 
+                "Children's Song",
+                "Chicken Soup for the Soul (Inspirational)",
+                "Short Joke / Anecdote"
+            ], key="eng_format")
+            
+        with col_e2:
+            eng_genre = st.selectbox("🎭 Genre", [
+                "Coming-of-age", 
+                "Comedy / Humor", 
+                "Fantasy / Magic", 
+                "Sci-Fi", 
+                "Mystery / Thriller", 
+                "Horror", 
+                "Romance"
+            ], key="eng_genre")
+        with col_e3:
+            eng_length = st.radio("📏 Length", [
+                "Short (~150 words)", 
+                "Medium (~300 words)", 
+                "Long (~500 words)"
+            ], key="eng_length")
+
+        st.write("---")
+        if st.button("✨ Generate English Content", type="primary", use_container_width=True, key="btn_eng_gen"):
+            if api_key and eng_topic:
+                with st.spinner("Crafting your creative piece..."):
+                    current_audience = "Teenagers / Gen Z" 
+                    if eng_genre == "Romance" or eng_format == "Chicken Soup for the Soul (Inspirational)":
+                        current_audience = "Adults / Middle-aged"
+                    elif "Children" in eng_format:
+                        current_audience = "Children / Kids"
+                        
+                    st.session_state.eng_target_audience = current_audience
+
+                    eng_prompt = f"""
+                    CRITICAL INSTRUCTION: Write entirely in English. Do NOT output any conversational text, ONLY the final creative piece.
+                    Topic: {eng_topic}
+                    Format: {eng_format}
+                    Genre: {eng_genre}
+                    Target Audience: {current_audience}
+                    Length Requirement: {eng_length}. Strictly adhere to this word count limit.
+
+                    STYLE & TONE RULES:
+                    - 'Show, Don't Tell': Use vivid imagery, emotions, and sensory details.
+                    - AVOID overused AI clichés (DO NOT use words like: delve, tapestry, unveil, testament, symphony, dance of).
+                    - Ensure the tone perfectly matches the Target Audience ({current_audience}).
+                    """
+                    
+                    if "Chicken Soup" in eng_format:
+                        eng_prompt += "- TONE: Highly emotional, heartwarming, and relatable. Must conclude with a profound but gentle life lesson or realization.\n"
+                    elif "Song" in eng_format:
+                        eng_prompt += "- STRUCTURE: Write as a song with clear Verses and a catchy Chorus. Must have a rhythmic flow.\n"
+                    elif "Poem" in eng_format:
+                        eng_prompt += "- STRUCTURE: Use powerful poetic devices, rhythm, and metaphors.\n"
+
+                stream_to_state("eng_final_text", eng_prompt)
+
+        if st.session_state.eng_final_text:
+            st.success(f"✅ Created perfectly for: **{st.session_state.eng_target_audience}**")
+            st.code(st.session_state.eng_final_text, language="markdown")
+            
+            if st.button("📲 Send to AI TTS (Tab 6)", key="send_eng_tts"):
+                st.session_state.tts_text_area = st.session_state.eng_final_text 
+                st.success("✅ Text sent to Tab 6 Audio Studio!")
+
+# --- MENU 2 & 3: LOCAL VIDEO / AUDIO ---
+elif selected_menu in ["📂 Video to Script", "🎵 Audio to Script"]:
+    st.header(f"{selected_menu} Hub")
+    st.caption("Local ဖိုင်များ တင်၍ ဇာတ်ညွှန်း၊ ဆောင်းပါး နှင့် အိုင်ဒီယာများ ပြောင်းလဲပါ")
+    
+    # Video လား Audio လား ခွဲခြားခြင်း
+    is_video = "Video" in selected_menu
+    file_type = ['mp4', 'mov', 'avi'] if is_video else ['mp3', 'wav', 'm4a']
+    
+    media_file = st.file_uploader(f"Upload File", type=file_type)
+    
+    # 💡 ပြီးပြည့်စုံသော All-in-One အမျိုးအစား (၁၂) မျိုး
+    style_options = [
+        "🎬 ရုပ်ရှင်အနှစ်ချုပ် စတိုင် (Cinematic Recap)", 
+        "💖 နှလုံးသားခွန်အားပေး ရသစာတို (Soulful Story)", 
+        "🕵️‍♂️ မှုခင်း/လျှို့ဝှက်ဆန်းကြယ် (Mystery/True Crime)", 
+        "👻 အမှောင်ရသ (Gothic/Midnight Tale)", 
+        "😂 ခနဲ့တဲ့တဲ့ သရော်စာ (Sarcastic Roast)", 
+        "🎓 ပညာရေး / ဗဟုသုတ ရှင်းလင်းချက် (Educational Explainer)", 
+        "🎙️ ဇာတ်ကြောင်းပြော (Professional Narration)", 
+        "🗣️ ပေါ့တ်ကတ်စ် အမေးအဖြေ (Podcast Q&A)", 
+        "📱 Viral Shorts Script (စက္ကန့် ၆၀ စာ)", 
+        "📝 အဓိကအချက်များ ကောက်နုတ်ချက် (Key Takeaways)", 
+        "🧠 အိုင်ဒီယာ တိုးချဲ့ခြင်း (Idea Brainstorm & Outline)", 
+        "📄 စာသားအပြည့်အစုံ (Transcript / SRT)"
+    ]
+    
+    script_style = st.selectbox("ဖန်တီးလိုသော အမျိုးအစားကို ရွေးပါ:", style_options)
+    
+    # 💡 အထူးတောင်းဆိုချက် (Custom Instructions) ထည့်ရန်နေရာ
+    custom_instructions = st.text_input("💡 အထူးတောင်းဆိုချက် (Optional):", placeholder="ဥပမာ - ဟာသလေးတွေ ပိုထည့်ပေး၊ အဓိက ဇာတ်ကောင်အကြောင်း ပိုဖိရေးပေး...")
+    
+    # 💡 Generate လုပ်ပြီးပါက ရလဒ်များကို မှတ်ထားရန်
+    if 'media_final_script' not in st.session_state: st.session_state.media_final_script = ""
+    if 'current_media_name' not in st.session_state: st.session_state.current_media_name = ""
+
+    # 💡 မူရင်း ဖိုင်ကြီးအစား ffmpeg ဖြင့် ချုံ့ထားသော Analysis Proxy ကိုသာ Upload တင်ရန်
+    proxy_preset, use_audio_proxy, trim_silence = None, False, False
+    ffmpeg_help = None if FFMPEG_BIN else "ffmpeg ကို ဤစက်တွင် ရှာမတွေ့ပါ။"
+    if is_video:
+        use_proxy = st.toggle("🗜️ Upload a low-bitrate analysis proxy (ffmpeg)", value=bool(FFMPEG_BIN), disabled=not FFMPEG_BIN, help=ffmpeg_help)
+        if use_proxy: proxy_preset = VIDEO_PROXY_PRESETS[st.selectbox("Proxy Quality", list(VIDEO_PROXY_PRESETS), index=1)]
+    else:
+        use_audio_proxy = st.toggle("🎚️ Normalize to 16 kHz mono Opus before upload (ffmpeg)", value=bool(FFMPEG_BIN), disabled=not FFMPEG_BIN, help=ffmpeg_help)
+        trim_silence = use_audio_proxy and st.checkbox("✂️ Trim long silences (timestamps are mapped back to the original)", value=True)
+
+    # 💡 ဖိုင်ရှည်များကို အပိုင်းလိုက် ဖြတ်ပြီး အပြိုင် လေ့လာကာ ပြန်ဆက်ရန် (Timeout / Output Token ကန့်သတ်ချက် ရှောင်ရန်)
+    segment_mode = st.toggle("🧩 Segmented mode for long files (ffmpeg)", value=False, disabled=not FFMPEG_BIN, help=ffmpeg_help)
+    if segment_mode:
+        sc1, sc2 = st.columns(2)
+        segment_minutes = sc1.slider("Minutes per part", 5, 20, 10)
+        segment_workers = sc2.slider("Parallel parts", 1, 4, 3)
+    
+    media_auto_vault = st.checkbox("💾 ပြီးလျှင် မှတ်ဉာဏ်တိုက်ထဲ အလိုအလျောက် သိမ်းမည်", value=False, key="media_auto_vault")
+    if media_file and st.button("🚀 Start Professional AI Analysis", type="primary", use_container_width=True):
+        if api_key:
+            # 💡 Background Job အဖြစ် တင်လိုက်ပြီး ချက်ချင်း ပြန်လာသဖြင့် Menu ပြောင်း/Reload လုပ်လည်း အလုပ် မပျောက်ပါ (Sidebar ➜ My Jobs)
+            media_path = spool_upload(media_file, f".{media_file.name.rsplit('.', 1)[-1].lower()}", JOB_SPOOL_DIR)
+            job_args = (media_path, media_file.name, script_style, custom_instructions, is_video, proxy_preset, use_audio_proxy, trim_silence,
+                        segment_minutes * 60 if segment_mode else 0, segment_workers if segment_mode else 1)
+            vault = {"title": f"Media ({media_file.name})", "type": script_style, "source": selected_menu} if media_auto_vault else None
+            enqueue_job(selected_menu, f"{media_file.name} • {script_style}", lambda on_progress: run_media_script_job(*job_args, on_progress),
+                        "media_final_script", vault=vault)
+                    
+    # 💡 ရလဒ်ပြသခြင်းနှင့် Action ခလုတ်များ (State မှတ်ထားသဖြင့် ပျောက်မသွားပါ)
+    if st.session_state.media_final_script:
+        st.success(f"✅ {script_style} ဖန်တီးပြီးပါပြီ!")
+        st.code(st.session_state.media_final_script, language="markdown")
+        
+        c1, c2 = st.columns(2)
+        with c1:
+            if st.button("📲 AI TTS သို့ ပို့ရန် (Tab 6)", key="send_media_tts", use_container_width=True):
+                st.session_state.tts_text_area = st.session_state.media_final_script
+                st.success("✅ Tab 6 သို့ ရောက်သွားပါပြီ! အသံထွက်ဖတ်ကြည့်နိုင်ပါပြီ။")
+        with c2:
+            if st.button("💾 မှတ်ဉာဏ်တိုက်သို့ သိမ်းမည်", key="save_media_vault", use_container_width=True):
+                save_to_vault(f"Media ({st.session_state.current_media_name})", st.session_state.media_final_script, script_style, source=selected_menu)
+                st.success("✅ မှတ်ဉာဏ်တိုက် (Tab 7) တွင် အောင်မြင်စွာ သိမ်းဆည်းပြီးပါပြီ!")
+
+    # 💡 Style အများအပြားကို Gemini Context Cache တစ်ခုတည်းပေါ်တွင် အပြိုင် Run ရန် (Media Token ကို တစ်ကြိမ်သာ ပို့မည်)
+    if 'media_multi_results' not in st.session_state: st.session_state.media_multi_results = {}
+    with st.expander("🎛️ Generate Multiple Styles (Shared Context Cache)"):
+        if segment_mode: st.caption("ℹ️ Segmented mode တွင် Multi-Style ကို မသုံးနိုင်ပါ။")
+        multi_styles = st.multiselect("Styles", style_options, max_selections=6, key="media_multi_styles")
+        if st.button("🚀 Generate Selected Styles", key="media_multi_run", use_container_width=True, disabled=segment_mode or not multi_styles) and media_file and api_key:
+            with st.spinner("Context Cache တစ်ခုတည်းဖြင့် Style များကို အပြိုင် ဖန်တီးနေပါသည်... ⏳"):
+                try:
+                    upload_status = st.empty()
+                    upload_target, upload_id, media_tmap = prepare_media_upload(media_file, proxy_preset, use_audio_proxy, trim_silence, upload_status.caption)
+                    myfile = upload_media_file(upload_target, on_status=upload_status.caption, content_id=upload_id)
+                    upload_status.empty()
+                    used_proxy = proxy_preset if upload_target is not media_file else None
+                    prompts = {style: build_media_prompt(style, custom_instructions, is_video, used_proxy) for style in multi_styles}
+                    multi_progress = st.progress(0.0, text="🎛️ Context Cache ဖန်တီးနေပါသည်...")
+                    results, used_context, cache_note = run_multi_style(upload_id, [myfile], prompts, lambda prompt: generate_content_safe(prompt, myfile),
+                                                                        on_progress=lambda done, total: multi_progress.progress(done / total, text=f"🎛️ {done} / {total} styles"))
+                    if media_tmap and media_tmap != [[0.0, 0.0]]:
+                        results = {style: remap_timestamps(text, media_tmap) for style, text in results.items()}
+                    st.session_state.media_multi_results = results
+                    st.session_state.current_media_name = media_file.name
+                    st.caption("🧠 Shared context cache ဖြင့် ဖန်တီးခဲ့သည်" if used_context else f"ℹ️ Context Cache မရပါ၍ ပုံမှန်နည်းဖြင့် ဖန်တီးခဲ့သည် ({cache_note})")
+                except Exception as e:
+                    st.error(f"⚠️ Error: ဖိုင်ကို ဖတ်၍ မရပါ။ ({e})")
+        if st.session_state.media_multi_results:
+            render_multi_results(st.session_state.media_multi_results, "media_multi", f"Media ({st.session_state.current_media_name})", selected_menu)
+
+# --- MENU 4: YOUTUBE MASTER (THE SUPER FAST BYPASS VERSION) ---
+elif selected_menu == "🔴 YouTube Master":
+    st.header("🔴 YouTube Master (Super Fast Engine ⚡)")
+    st.caption("YouTube မှ အချက်အလက်များကို စက္ကန့်ပိုင်းအတွင်း ဆွဲယူ၍ အမိုက်စား Content များ ဖန်တီးမည် (No Download Required)")
+    
+    style_options = [
+        "🎬 ရုပ်ရှင်အနှစ်ချုပ် စတိုင် (Cinematic Recap)", 
+        "💖 နှလုံးသားခွန်အားပေး ရသစာတို (Soulful Story)", 
+        "🕵️‍♂️ မှုခင်း/လျှို့ဝှက်ဆန်းကြယ် (Mystery/True Crime)", 
+        "👻 အမှောင်ရသ (Gothic/Midnight Tale)", 
+        "😂 ခနဲ့တဲ့တဲ့ သရော်စာ (Sarcastic Roast)", 
+        "🎓 ပညာရေး / ဗဟုသုတ ရှင်းလင်းချက် (Educational Explainer)", 
+        "🎙️ ဇာတ်ကြောင်းပြော (Professional Narration)", 
+        "🗣️ ပေါ့တ်ကတ်စ် အမေးအဖြေ (Podcast Q&A)", 
+        "📱 Viral Shorts Script (စက္ကန့် ၆၀ စာ)", 
+        "📝 အဓိကအချက်များ ကောက်နုတ်ချက် (Key Takeaways)", 
+        "🧠 အိုင်ဒီယာ တိုးချဲ့ခြင်း (Idea Brainstorm & Outline)", 
+        "📄 မူရင်း စာသားအပြည့်အစုံ (Original English SRT)" # 💡 ဒီနေရာလေး နာမည်ပြောင်းထားသည်
+    ]
+    
+    yt_mode = st.radio("Mode", ["🎯 Single Video", "📦 Batch (Playlist / Channel / URL List)"], horizontal=True, label_visibility="collapsed")
+    
+    if "Single" in yt_mode:
+        yt_url = st.text_input("🔗 YouTube URL ကို ဤနေရာတွင် ထည့်ပါ:")
+    
+        if yt_url:
+            st.write("---")
+        
+            yt_script_style = st.selectbox("ဖန်တီးလိုသော အမျိုးအစားကို ရွေးချယ်ပါ:", style_options)
+            yt_custom_instructions = st.text_input("💡 အထူးတောင်းဆိုချက် (Optional):", placeholder="ဥပမာ - ဟာသလေးတွေ ပိုထည့်ပေး...")
+
+            # 💡 ဗီဒီယို တစ်ခုလုံး မဟုတ်ဘဲ လိုသည့် အပိုင်းကိုသာ ရွေးနိုင်သည် (Token နှင့် အချိန် သက်သာစေရန်)
+            yt_range_mode = st.radio("⏱️ Analyze:", ["🎞️ Full Video", "✂️ Time Range", "📑 Chapters"], horizontal=True)
+            yt_range_error, yt_ranges = None, []
+            if "Time Range" in yt_range_mode:
+                r1, r2 = st.columns(2)
+                range_start = r1.text_input("Start (mm:ss / h:mm:ss)", placeholder="12:00")
+                range_end = r2.text_input("End (mm:ss / h:mm:ss)", placeholder="20:00")
+                try:
+                    start_sec, end_sec = parse_timecode(range_start) or 0.0, parse_timecode(range_end)
+                    if end_sec is None: end_sec = float("inf")
+                    if end_sec <= start_sec: raise ValueError("End သည် Start ထက် နောက်ကျရပါမည်။")
+                    yt_ranges = [(start_sec, end_sec)]
+                except ValueError as e:
+                    yt_range_error = str(e)
+                    st.warning(f"⚠️ {e}")
+            elif "Chapters" in yt_range_mode:
+                try:
+                    yt_chapters = chapter_ranges(fetch_youtube_metadata(parse_youtube_id(yt_url)))
+                except Exception as e:
+                    yt_chapters = []
+                    st.caption(f"↳ Chapter စာရင်း ဆွဲမရပါ: {str(e)[:150]}")
+                if yt_chapters:
+                    chapter_labels = [f"{format_mmss(c['start'])} • {c['title']}" for c in yt_chapters]
+                    picked = st.multiselect("📑 Chapters ရွေးပါ:", chapter_labels)
+                    yt_ranges = [(c["start"], c["end"]) for c, label in zip(yt_chapters, chapter_labels) if label in picked]
+                    if not picked: st.caption("ℹ️ Chapter မရွေးပါက ဗီဒီယို တစ်ခုလုံးကို သုံးမည်။")
+                else:
+                    st.info("ℹ️ ဤဗီဒီယိုတွင် Chapters မပါဝင်ပါ။ Time Range ကို အသုံးပြုပါ။")
+
+            if 'yt_final_script' not in st.session_state: st.session_state.yt_final_script = ""
+            if 'yt_final_vtt' not in st.session_state: st.session_state.yt_final_vtt = ""
+        
+            yt_auto_vault = st.checkbox("💾 ပြီးလျှင် မှတ်ဉာဏ်တိုက်ထဲ အလိုအလျောက် သိမ်းမည်", value=False, key="yt_auto_vault")
+            if st.button("🚀 Start Fast AI Analysis", use_container_width=True, type="primary"):
+                if yt_range_error: st.error(f"⚠️ {yt_range_error}")
+                elif api_key:
+                    # 💡 Background Job အဖြစ် တင်ပြီး ချက်ချင်း ပြန်လာမည် (Sidebar ➜ My Jobs)
+                    job_args = (yt_url, list(yt_ranges), yt_script_style, yt_custom_instructions)
+                    vault = {"title": "YouTube Extract", "type": "YouTube Master", "source": selected_menu} if yt_auto_vault else None
+                    enqueue_job(selected_menu, f"YouTube • {yt_script_style}", lambda on_progress: run_youtube_script_job(*job_args, on_progress),
+                                "yt_final_script", vault=vault)
+
+            # 💡 ရလဒ်ပြသခြင်းနှင့် ခလုတ် (၃) မျိုး (TTS, Vault, Download)
+            if st.session_state.yt_final_script:
+                st.success(f"✅ {yt_script_style} အောင်မြင်စွာ ဖန်တီးပြီးပါပြီ!")
+                if st.session_state.yt_final_vtt: st.code(st.session_state.yt_final_script, language="text")
+                else: st.markdown(st.session_state.yt_final_script)
+            
+                # ခလုတ် ၃ ခု ခွဲရန်
+                c1, c2, c3 = st.columns(3)
+                with c1:
+                    if st.button("📲 AI TTS သို့ ပို့ရန် (Tab 6)", key="send_yt_tts", use_container_width=True):
+                        st.session_state.tts_text_area = st.session_state.yt_final_script
+                        st.success("✅ Tab 6 သို့ ရောက်သွားပါပြီ!")
+                with c2:
+                    if st.button("💾 မှတ်ဉာဏ်တိုက် သိမ်းမည်", key="save_yt_vault", use_container_width=True):
+                        save_to_vault(f"YouTube Extract", st.session_state.yt_final_script, "YouTube Master", source=selected_menu)
+                        st.success("✅ Tab 7 တွင် သိမ်းဆည်းပြီးပါပြီ!")
+                with c3:
+                    # 💡 ဒေါင်းလုဒ် ခလုတ် (.srt လား .txt လား ခွဲပေးထားသည်)
+                    file_ext = "srt" if is_srt_style(yt_script_style) else "txt"
+                    st.download_button(
+                        label=f"📥 ဖိုင် ဒေါင်းလုဒ်ဆွဲရန် (.{file_ext})", 
+                        data=st.session_state.yt_final_script, 
+                        file_name=f"universal_studio_{int(time.time())}.{file_ext}", 
+                        use_container_width=True
+                    )
+                    if st.session_state.yt_final_vtt:
+                        st.download_button(
+                            label="📥 WebVTT ဒေါင်းလုဒ်ဆွဲရန် (.vtt)", 
+                            data=st.session_state.yt_final_vtt, 
+                            file_name=f"universal_studio_{int(time.time())}.vtt", 
+                            mime="text/vtt",
+                            use_container_width=True
+                        )
+
+            # 💡 ဆွဲယူထားသော YouTube Data ကို Context Cache တစ်ခုတည်းတွင် ထားပြီး Style အများအပြားကို အပြိုင် ဖန်တီးရန်
+            if 'yt_multi_results' not in st.session_state: st.session_state.yt_multi_results = {}
+            with st.expander("🎛️ Generate Multiple Styles (Shared Context Cache)"):
+                yt_multi_styles = st.multiselect("Styles", style_options, max_selections=6, key="yt_multi_styles")
+                if st.button("🚀 Generate Selected Styles", key="yt_multi_run", use_container_width=True, disabled=not yt_multi_styles or bool(yt_range_error)) and api_key:
+                    with st.spinner("Context Cache တစ်ခုတည်းဖြင့် Style များကို အပြိုင် ဖန်တီးနေပါသည်... ⏳"):
+                        try:
+                            yt_source = get_youtube_source(yt_url)
+                            render_fetch_status(yt_source["status"])
+                            yt_source = clip_youtube_source(yt_source, yt_ranges)
+                            results = {style: build_local_subtitles(yt_source)[0] for style in yt_multi_styles if is_srt_style(style)}
+                            llm_styles = [style for style in yt_multi_styles if not is_srt_style(style)]
+                            if llm_styles:
+                                smart_data, _ = prepare_youtube_data(yt_source, llm_styles[0])
+                                data_ref = "(The full EXTRACTED YOUTUBE DATA is provided in the cached context above.)"
+                                prompts = {style: build_youtube_prompt(style, yt_custom_instructions, data_ref) for style in llm_styles}
+                                content_id = make_cache_key("yt-context", yt_source["video_id"], (yt_source.get("clip") or {}).get("label", "full"), smart_data)
+                                contents = [smart_data] if estimate_tokens(smart_data) >= CONTEXT_CACHE_MIN_TOKENS else None
+                                multi_progress = st.progress(0.0, text="🎛️ Context Cache ဖန်တီးနေပါသည်...")
+                                llm_results, used_context, cache_note = run_multi_style(
+                                    content_id, contents, prompts,
+                                    lambda prompt: generate_content_safe(prompt.replace(data_ref, smart_data)),
+                                    on_progress=lambda done, total: multi_progress.progress(done / total, text=f"🎛️ {done} / {total} styles"))
+                                results.update(llm_results)
+                                st.caption("🧠 Shared context cache ဖြင့် ဖန်တီးခဲ့သည်" if used_context else f"ℹ️ ပုံမှန်နည်းဖြင့် ဖန်တီးခဲ့သည် ({cache_note})")
+                            st.session_state.yt_multi_results = {style: results[style] for style in yt_multi_styles}
+                            st.session_state.yt_multi_title = (yt_source.get("meta") or {}).get("title") or yt_url
+                        except Exception as e:
+                            st.error(f"⚠️ Error: {e}")
+                if st.session_state.yt_multi_results:
+                    render_multi_results(st.session_state.yt_multi_results, "yt_multi", f"YT: {st.session_state.get('yt_multi_title', '')}", selected_menu)
+    else:
+        st.info("Playlist / Channel လင့်ခ် (သို့) Video URL များကို တစ်ကြောင်းလျှင် တစ်ခုစီ ထည့်ပါ။ ပြီးသမျှကို မှတ်ဉာဏ်တိုက်ထဲ ချက်ချင်း သိမ်းပြီး ZIP ဖြင့် ဒေါင်းလုဒ်ဆွဲနိုင်ပါမည်။")
+        batch_input = st.text_area("🔗 Playlist / Channel / URL List:", height=150, key="yt_batch_input")
+        batch_style = st.selectbox("ဖန်တီးလိုသော အမျိုးအစားကို ရွေးချယ်ပါ:", style_options, key="yt_batch_style")
+        batch_custom = st.text_input("💡 အထူးတောင်းဆိုချက် (Optional):", key="yt_batch_custom")
+
+        b1, b2, b3, b4 = st.columns(4)
+        with b1: batch_limit = st.number_input("📦 Max Videos", 1, 200, 20)
+        with b2: batch_workers = st.slider("🧵 Workers", 1, 6, 3)
+        with b3: batch_rate = st.slider("⏱️ Requests / min", 1, 60, 10)
+        with b4: batch_retries = st.slider("🔁 Retries", 0, 3, 1)
+        batch_save = st.checkbox("💾 ပြီးသမျှကို မှတ်ဉာဏ်တိုက်ထဲ ချက်ချင်း သိမ်းမည်", value=True)
+
+        if 'yt_batch_results' not in st.session_state: st.session_state.yt_batch_results = []
+
+        if st.button("🚀 Start Batch Analysis", use_container_width=True, type="primary") and api_key and batch_input.strip():
+            try:
+                with st.spinner("Playlist / Channel ကို ဖတ်နေပါသည်... ⏳"):
+                    batch_items = expand_youtube_urls(batch_input, batch_limit)
+            except Exception as e:
+                batch_items = []
+                st.error(f"⚠️ Error: {e}")
+            if batch_items:
+                batch_progress = st.progress(0.0, text=f"0 / {len(batch_items)}")
+                batch_table = st.empty()
+                batch_rows = [{"#": i + 1, "Title": item["title"] or item["video_id"], "Status": "⏳ queued", "Time": ""} for i, item in enumerate(batch_items)]
+                batch_table.dataframe(batch_rows, hide_index=True, use_container_width=True)
+                batch_results = [None] * len(batch_items)
+                limiter = RateLimiter(batch_rate)
+                # 💡 Worker အရေအတွက် ကန့်သတ်ထားပြီး ပြီးသမျှကို ချက်ချင်း ပြသ/သိမ်းဆည်းသည်
+                with ThreadPoolExecutor(max_workers=batch_workers, thread_name_prefix="yt-batch") as batch_pool:
+                    futures = {ctx_submit(batch_pool, run_youtube_batch_item, item, batch_style, batch_custom, limiter, batch_retries): i
+                               for i, item in enumerate(batch_items)}
+                    for done_count, future in enumerate(as_completed(futures), 1):
+                        i = futures[future]
+                        result = batch_results[i] = future.result()
+                        ok = result["status"] == "done"
+                        batch_rows[i].update({"Title": result["title"], "Time": f"{result['elapsed']:.1f}s",
+                                              "Status": f"✅ done ({result['attempts']}x)" if ok else f"❌ {result['error'][:80]}"})
+                        if ok and batch_save:
+                            save_to_vault(f"YouTube Batch: {result['title']}", result["text"], batch_style, source=selected_menu)
+                        batch_progress.progress(done_count / len(batch_items), text=f"{done_count} / {len(batch_items)}")
+                        batch_table.dataframe(batch_rows, hide_index=True, use_container_width=True)
+                st.session_state.yt_batch_results = batch_results
+                st.session_state.yt_batch_ext = "srt" if is_srt_style(batch_style) else "txt"
+
+        if st.session_state.yt_batch_results:
+            batch_done = [r for r in st.session_state.yt_batch_results if r["status"] == "done"]
+            st.success(f"✅ {len(batch_done)} / {len(st.session_state.yt_batch_results)} ဗီဒီယို ပြီးဆုံးပါပြီ!")
+            st.download_button(
+                label="📥 ရလဒ်အားလုံးကို ZIP ဖြင့် ဒေါင်းလုဒ်ဆွဲရန်",
+                data=build_batch_zip(st.session_state.yt_batch_results, st.session_state.yt_batch_ext),
+                file_name=f"youtube_batch_{int(time.time())}.zip",
+                mime="application/zip",
+                use_container_width=True
+            )
+            for result in batch_done:
+                with st.expander(f"📖 {result['title']}"): st.markdown(result["text"])
+
+# --- MENU 5: SMART TRANSLATOR (PRO EDITION) ---
+elif selected_menu == "🦁 Smart Translator":
+    st.header("🦁 Smart Translator (Pro Edition) 🌐")
+    st.caption("စာသားများ သို့မဟုတ် SRT ဖိုင်များကို အသက်ဝင်သော ဘာသာစကားသို့ အမိုက်စား ပြောင်းလဲမည် (အမှိုက်စာ/တိုက်ရိုက်ဘာသာပြန်များ လုံးဝမပါဝင်စေရ)")
+    
+    source_text = st.text_area("📝 မူရင်း စာသား သို့မဟုတ် SRT ကို ဤနေရာတွင် ကူးထည့်ပါ:", height=250)
+    
+    st.write("---")
+    
+    col_lang, col_mode = st.columns(2)
+    
+    with col_lang:
+        # 💡 ဘာသာစကား ရွေးချယ်ရန် ထပ်တိုးထားသော အပိုင်း
+        target_language = st.radio("🔄 ဘာသာပြန်လိုသော ပစ်မှတ်ဘာသာစကား:", [
+            "🇲🇲 မြန်မာဘာသာသို့ (To Burmese)", 
+            "🇬🇧 အင်္ဂလိပ်ဘာသာသို့ (To English)"
+        ])
+        
+    with col_mode:
+        # 💡 ရွေးချယ်စရာ ပုံစံများ
+        trans_mode = st.selectbox("ဘာသာပြန်လိုသော ပုံစံကို ရွေးပါ:", [
+            "💬 SRT စာတန်းထိုး အတိအကျ (Timestamps မပျက်စေရ)",
+            "🎬 ရုပ်ရှင်အနှစ်ချုပ် စတိုင် Voiceover (Cinematic Recap)",
+            "💖 နှလုံးသားခွန်အားပေး ရသစာတို (Soulful Story)",
+            "🕵️‍♂️ မှုခင်း/လျှို့ဝှက်ဆန်းကြယ် Voiceover (Mystery/True Crime)",
+            "👻 အမှောင်ရသ ဇာတ်လမ်း (Gothic/Midnight Tale)",
+            "😂 ခနဲ့တဲ့တဲ့ သရော်စာ (Sarcastic Roast)",
+            "🎓 ပညာရေး / ဗဟုသုတ ရှင်းလင်းချက် (Educational Explainer)",
+            "🎙️ ပရော်ဖက်ရှင်နယ် ဇာတ်ကြောင်းပြော (Pro Narration)",
+            "📱 Viral Social Media Post / Shorts (စက္ကန့် ၆၀ စာ)",
+            "📝 အဓိကအချက်များ ကောက်နုတ်ချက် (Key Takeaways)"
+        ])
+    
+    trans_custom_instructions = st.text_input("💡 အထူးတောင်းဆိုချက် (Optional):", placeholder="ဥပမာ - ပိုပြီး ရယ်စရာကောင်းအောင် ပြင်ရေးပေး...")
+
+    if 'trans_final_script' not in st.session_state: st.session_state.trans_final_script = ""
+
+    if st.button("✨ အသက်ဝင်အောင် ဘာသာပြန်မည်", type="primary", use_container_width=True):
+        if api_key and source_text:
+            with st.spinner(f"{target_language.split(' ')[1]} ပြောင်းလဲနေပါသည်... ⏳"):
+                
+                # 💡 Language Dynamics
+                if "Burmese" in target_language:
+                    lang_prompt = "natural, highly engaging BURMESE language."
+                    spoken_rule = "SPOKEN BURMESE: Use conversational endings (တယ်, မယ်, တဲ့)."
+                else:
+                    lang_prompt = "fluent, native-sounding, and engaging ENGLISH language."
+                    spoken_rule = "NATURAL ENGLISH: Use engaging vocabulary and proper pacing for a native speaker."
+
+                # 💡 Base Translation Prompt
+                base_prompt = f"""
+                CRITICAL INSTRUCTION: You are a Master Translator and Copywriter. 
+                Translate and transform the following text into {lang_prompt}
+                STRICT RULE: DO NOT use literal or direct word-for-word translations (Google Translate style). Ensure the essence and tone are perfectly adapted.
+                
+                🔴 UNIVERSAL VOICEOVER & PRONOUN RULES (Apply unless formatting as strict SRT):
+                1. NO ARBITRARY NAMES: NEVER insert random names unless translating actual names from the source. Use appropriate pronouns (He, She, They / သူ, သူမ, သူတို့).
+                2. VOICEOVER OPTIMIZED: Write for the EAR. The translation must flow naturally when spoken aloud. 
+                3. {spoken_rule}
+                4. DRAMATIC PAUSES: Use ellipses (...) frequently to guide the voice actor's pacing.
+                """
+                
+                # 💡 Format Specific Rules
+                if "SRT" in trans_mode:
+                    base_prompt += """
+                    🔴 SRT SUBTITLE PROTOCOL:
+                    1. The user has provided an SRT file format. You MUST strictly preserve the SRT structure (Sequence numbers, Timestamps `00:00:00,000 --> 00:00:05,000`, and blank lines).
+                    2. ONLY translate the dialogue text. DO NOT alter the timestamps or sequence numbers.
+                    3. Make the subtitles easy to read, concise, and cinematic. Avoid awkward direct translations.
+                    """
+                elif "Sarcastic" in trans_mode:
+                    base_prompt += f"\n🔴 TONE: Highly sarcastic, witty, and slightly mocking."
+                elif "Soulful" in trans_mode:
+                    base_prompt += "\n🔴 TONE: Deeply emotional, heartwarming, and poetic. Focus on human feelings."
+                elif "Mystery" in trans_mode:
+                    base_prompt += "\n🔴 TONE: Suspenseful, dark, and thrilling true-crime narrator style."
+                elif "Recap" in trans_mode:
+                    base_prompt += "\n🔴 TONE: Fast-paced, high-energy YouTube movie recap style."
+                elif "Social Media" in trans_mode:
+                    base_prompt += "\n🔴 TONE: Catchy, engaging, and viral. Include emojis and spacing. End with a strong Call-to-Action and 3 hashtags."
+                elif "Key Takeaways" in trans_mode:
+                    base_prompt += "\n🔴 TONE: Professional and clear. Summarize the translated text into well-organized bullet points."
+                else:
+                    base_prompt += f"\n🔴 TARGET STYLE: {trans_mode}. Adjust your tone perfectly to match this style."
+
+                # 💡 Finalizing the Prompt
+                prompt = f"""
+                {base_prompt}
+                
+                USER SPECIAL REQUEST: {trans_custom_instructions if trans_custom_instructions else 'None'}
+                
+                --- ORIGINAL TEXT / SRT ---
+                {source_text}
+                ---------------------------
+                
+                OUTPUT REQUIREMENT: Return ONLY the final transformed text. No introductory or concluding remarks.
+                """
+                
+                try:
+                    import time # Added in case it's missing
+                    stream_to_state("trans_final_script", prompt)
+                except Exception as e:
+                    st.error(f"⚠️ Error: {e}")
+
+    # 💡 ရလဒ်ပြသခြင်းနှင့် Action ခလုတ်များ
+    if st.session_state.trans_final_script:
+        st.success(f"✅ {target_language.split(' ')[1]} အောင်မြင်စွာ ပြောင်းလဲပြီးပါပြီ!")
+        st.markdown(st.session_state.trans_final_script)
+        
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            if st.button("📲 AI TTS သို့ ပို့ရန် (Tab 6)", key="send_trans_tts", use_container_width=True):
+                st.session_state.tts_text_area = st.session_state.trans_final_script
+                st.success("✅ Tab 6 သို့ ရောက်သွားပါပြီ!")
+        with c2:
+            if st.button("💾 မှတ်ဉာဏ်တိုက် သိမ်းမည်", key="save_trans_vault", use_container_width=True):
+                save_to_vault(f"Translated: {trans_mode} ({target_language.split(' ')[1]})", st.session_state.trans_final_script, "Smart Translator", source=selected_menu)
+                st.success("✅ Tab 7 တွင် သိမ်းဆည်းပြီးပါပြီ!")
+        with c3:
+            file_ext = "srt" if "SRT" in trans_mode else "txt"
+            st.download_button(
+                label=f"📥 ဖိုင် ဒေါင်းလုဒ်ဆွဲရန် (.{file_ext})", 
+                data=st.session_state.trans_final_script, 
+                file_name=f"translated_studio_{int(time.time())}.{file_ext}", 
+                use_container_width=True
+            )
+# --- TAB 6: AUDIO STUDIO ---
+elif selected_menu == "🎙️ Audio Studio":
+    st.header("🎧 Audio Studio Hub")
+    tts_tab, tele_tab = st.tabs(["🗣️ AI TTS Generator", "🎤 Teleprompter Recorder"])
+
+    with tts_tab:
+        st.subheader("AI Voice Generation (Multi-Character)")
+        
+        # 💡 Script Tab မှ ပို့လိုက်သော စာများကို လက်ခံရန်
+        text_input = st.text_area("Text to read:", height=150, key="tts_text_area", value=st.session_state.get("tts_text_area", "")) 
+        
+        voice_options = {
+            "🇲🇲 မြန်မာ (အမျိုးသမီး - Nilar)": "my-MM-NilarNeural",
+            "🇲🇲 မြန်မာ (အမျိုးသား - Thiha)": "my-MM-ThihaNeural",
+            "🇺🇸 English (Narrator Female - Jenny)": "en-US-JennyNeural",
+            "🇺🇸 English (Narrator Male - Guy)": "en-US-GuyNeural",
+            "👧 English (Little Girl - Ana)": "en-US-AnaNeural",
+            "👦 English (Young Boy - Roger)": "en-US-RogerNeural",
+            "👵 English (Elegant / Witchy - Sonia)": "en-GB-SoniaNeural",
+            "👴 English (Old Man / Wise - Thomas)": "en-GB-ThomasNeural",
+            "🦹‍♂️ English (Deep / Villain - Christopher)": "en-US-ChristopherNeural"
+        }
+        
+        c1, c2, c3 = st.columns(3)
+        with c1: 
+            selected_voice_label = st.selectbox("🎭 Character Voice", list(voice_options.keys()))
+            voice = voice_options[selected_voice_label]
+        with c2: 
+            rate = st.slider("🏃 Speed (အမြန်နှုန်း)", -50, 50, 0, format="%d%%", key="tts_rate")
+        with c3: 
+            pitch = st.slider("🎵 Pitch (အတက်အကျ)", -50, 50, 0, format="%dHz", key="tts_pitch")
+            
+        with st.expander("🪄 Pro Tips: ဘီလူးသံ၊ စုန်းမသံ ဖန်တီးနည်းများ"):
+            st.markdown("""
+            * **🧙‍♀️ စုန်းမသံ (Witch):** Voice `Sonia` ကို ရွေးပါ။ Pitch ကို **+15Hz** (အသံစူးစူး) ထားပြီး Speed ကို **-10%** (ဖြည်းဖြည်း) ထားပါ။
+            * **👹 ဘီလူး/လူဆိုးသံ (Villain):** Voice `Christopher` ကို ရွေးပါ။ Pitch ကို **-20Hz** (အသံသြသြ) ထားပြီး Speed ကို **-15%** (လေးလေးပင်ပင်) ထားပါ။
+            * **🧚‍♀️ နတ်သမီးသံ (Fairy):** Voice `Ana` ကို ရွေးပါ။ Pitch ကို **+20Hz** ထားပြီး Speed ကို **+10%** ထားပါ။
+            """)
+
+        with st.expander("🗄️ Voice Cache"):
+            audio_stats = get_audio_cache().stats()
+            st.caption(f"{audio_stats['files']} clips • {format_size(audio_stats['bytes'])} / {TTS_CACHE_MAX_MB} MB • Hits: {audio_stats['hits']} • Misses: {audio_stats['misses']}")
+            if st.button("🧹 Voice Cache ရှင်းမည်", key="clear_audio_cache"):
+                get_audio_cache().clear()
+                st.success("✅ Voice Cache ရှင်းလင်းပြီးပါပြီ!")
+
+        # 💡 [Narrator] / [Witch] စသည့် Speaker Tag များ ပါဝင်ပါက ဇာတ်ကောင်တစ်ဦးချင်းစီကို အသံသီးသန့်ဖြင့် ဖတ်ရန်
+        script_lines = parse_speaker_script(text_input)
+        speakers = list(dict.fromkeys(line["speaker"] for line in script_lines))
+        multi_voice = len(speakers) > 1 and st.toggle(f"🎭 Multi-Character Mode ({len(speakers)} speakers detected)", value=True)
+        if multi_voice:
+            main_voice_label = "🎛️ Main voice & sliders (above)"
+            speaker_voices = {}
+            speaker_cols = st.columns(min(len(speakers), 3))
+            for i, speaker in enumerate(speakers):
+                preset_names = [main_voice_label] + list(VOICE_PRESETS)
+                default_preset = (guess_voice_preset(speaker) if i else None) or main_voice_label
+                choice = speaker_cols[i % len(speaker_cols)].selectbox(f"[{speaker}]", preset_names, index=preset_names.index(default_preset), key=f"tts_speaker_{speaker}")
+                speaker_voices[speaker] = {"voice": voice, "rate": rate, "pitch": pitch} if choice == main_voice_label else VOICE_PRESETS[choice]
+            line_gap_ms = st.slider("⏸️ Gap between lines (ms)", 0, 2000, 350, step=50, key="tts_line_gap")
+
+        tts_busy = bool(st.session_state.get("tts_job"))
+        if st.button("🔊 Generate AI Voice", type="primary", disabled=tts_busy):
+            if text_input.strip():
+                # 💡 စာသားကို ဝါကျအလိုက် အပိုင်းခွဲ၍ Background Runtime ပေါ်တွင် အပြိုင် ဖန်တီးပြီး ပထမအပိုင်းကို ချက်ချင်း နားထောင်နိုင်သည်
+                if multi_voice: tts_job = start_tts_job(build_multi_voice_items(script_lines, speaker_voices), TTS_MAX_INFLIGHT_MULTI)
+                else: tts_job = start_tts_job(build_tts_items(text_input, voice, rate, pitch))
+                tts_job["gap_ms"] = line_gap_ms if multi_voice else 0
+                track_async_job(f"🔊 AI Voice ({len(tts_job['chunks'])} parts)", tts_job["future"])
+                st.session_state.tts_job = tts_job
+                st.session_state.tts_status = None
+            else:
+                st.warning("⚠️ ကျေးဇူးပြု၍ အသံထွက်ဖတ်ရမည့် စာသား (Text) ထည့်ပါ။")
+        if st.session_state.get("tts_job"): st.fragment(render_tts_job_progress, run_every=TTS_POLL_SECONDS)()
+        tts_status = st.session_state.get("tts_status")
+        if tts_status:
+            if tts_status[0] == "error": st.error(tts_status[1])
+            else: st.success(tts_status[1])
+
+        # 💡 MP3 နှင့်အတူ Word-Timed စာတန်းထိုး (SRT / VTT) ကိုပါ ဒေါင်းလုဒ်ဆွဲနိုင်သည်
+        if st.session_state.get("tts_audio"):
+            st.audio(st.session_state.tts_audio, format="audio/mp3")
+            d1, d2, d3 = st.columns(3)
+            with d1: st.download_button("💾 Download MP3", st.session_state.tts_audio, "ai_voice.mp3", mime="audio/mpeg", use_container_width=True)
+            with d2: st.download_button("📝 Captions (.srt)", st.session_state.tts_srt, "ai_voice.srt", use_container_width=True)
+            with d3: st.download_button("📝 Captions (.vtt)", st.session_state.tts_vtt, "ai_voice.vtt", mime="text/vtt", use_container_width=True)
+
+    with tele_tab:
+        st.subheader("Teleprompter & Voice Recorder")
+        # 💡 Script Tab ကပို့လိုက်တဲ့စာကို Teleprompter မှာ အလိုအလျောက် ပေါ်နေစေရန်
+        tele_text = st.text_area("Script for Teleprompter:", height=250, key="tele_text_input", value=st.session_state.get("tts_text_area", ""))
+        
+        col_t1, col_t2 = st.columns(2)
+        with col_t1: scroll_duration = st.slider("Duration (Slower)", 20, 500, 150) 
+        with col_t2: font_size = st.slider("Font Size", 20, 80, 40)
+
+        if tele_text:
+            html_code = f"""<div style="height: 300px; overflow: hidden; background: #000; color: #FFF; font-size: {font_size}px; text-align: center; padding: 20px; border-radius: 10px; line-height: 1.6;">
+                <div class="scroll" style="display: inline-block; animation: mUp {scroll_duration}s linear infinite;">{tele_text.replace(chr(10), "<br><br>")}</div></div>
+            <style>@keyframes mUp {{ 0% {{ transform: translateY(100%); }} 100% {{ transform: translateY(-100%); }} }} .scroll:hover {{ animation-play-state: paused; color: #FFD700; cursor: pointer; }}</style>"""
+            st.markdown(html_code, unsafe_allow_html=True)
+
+        st.write("---")
+        wav_audio_data = st_audiorec() 
+        if wav_audio_data is not None:
+            st.audio(wav_audio_data, format='audio/wav')
+            st.download_button("💾 Download WAV", wav_audio_data, "teleprompter_rec.wav", "audio/wav")
+            
+# --- MENU 7: VISION STUDIO ---
+elif selected_menu == "👁️ Vision Studio":
+    st.header("👁️ Vision Studio (Image to Script)")
+    st.caption("ပုံတင်ပါ၊ AI မှ ပုံထဲကစာများကို ဖတ်ပေးခြင်း၊ ပုံကိုကြည့်၍ Tone မျိုးစုံဖြင့် ဇာတ်လမ်းဖန်တီးပေးခြင်းများ လုပ်ဆောင်ပေးပါမည်။")
+    image_file = st.file_uploader("📸 ဓာတ်ပုံ သို့မဟုတ် Screenshot တင်ရန် (JPG, PNG)", type=["jpg", "png", "jpeg"])
+
+    if image_file:
+        img = Image.open(image_file)
+        st.image(img, caption="Uploaded Image", use_container_width=True)
+        st.write("---")
+        vision_task = st.selectbox("ဘာလုပ်ချင်ပါသလဲ?", [
+            "📝 ပုံထဲက စာသားများကို အတိအကျ ကူးယူရန် (OCR Engine)",
+            "🎬 ပုံကိုကြည့်ပြီး ရုပ်ရှင်အနှစ်ချုပ် စတိုင်ရေးရန် (Cinematic Recap)",
+            "💖 ပုံကိုကြည့်ပြီး ရသစာတို ရေးရန် (Soulful Story)",
+            "😂 ပုံကိုကြည့်ပြီး ခနဲ့တဲ့တဲ့ သရော်စာ ရေးရန် (Sarcastic Roast)",
+            "🕵️‍♂️ ပုံကိုကြည့်ပြီး လျှို့ဝှက်ဆန်းကြယ် ဇာတ်လမ်းရေးရန် (Mystery/Horror)",
+            "🎙️ ပုံကိုကြည့်ပြီး ပရော်ဖက်ရှင်နယ် ဇာတ်ကြောင်းပြောရေးရန် (Narration)",
+            "📱 ပုံကိုကြည့်ပြီး Social Media Caption & SEO ရေးရန်"
+        ])
+
+        vision_custom = st.text_input("💡 အထူးတောင်းဆိုချက် (Optional):", placeholder="ဥပမာ - စာပိုဒ်တိုတိုပဲ ရေးပေးပါ၊ မြန်မာလိုချည်းပဲ ရေးပေးပါ...")
+        if 'vision_final_script' not in st.session_state: st.session_state.vision_final_script = ""
+        if st.button("🚀 Start Vision AI Analysis", type="primary", use_container_width=True):
+            if api_key:
+                with st.spinner("AI မှ ပုံကို မျက်စိဖြင့် သေချာစစ်ဆေးနေပါသည်... ⏳"):
+                    # 💡 OCR လား၊ ဇာတ်လမ်းရေးတာလား ခွဲခြားခြင်း
+                    if "OCR Engine" in vision_task:
+                        vision_prompt = f"""
+                        CRITICAL INSTRUCTION: Act as an expert OCR Engine. 
+                        TASK: Extract ALL text exactly as it appears in this image. 
+                        Maintain the original formatting and language (If Burmese, output perfectly spelled Burmese text). 
+                        DO NOT explain the image, JUST extract the text.
+                        USER REQUEST: {vision_custom}
+                        """
+                    else:
+                        vision_prompt = f"""
+                        CRITICAL INSTRUCTION: You are a Master Visual Storyteller. 
+                        Look at the provided image meticulously (facial expressions, environment, mood, lighting, objects).
+                        TASK: {vision_task}. Write entirely in engaging, natural BURMESE language.
+                        SPOKEN BURMESE: Use conversational endings (တယ်, မယ်, တဲ့).
+                        USER REQUEST: {vision_custom}
+                        """
+                    try:
+                        # 💡 Image ကို media_file အဖြစ် AI ဆီ လှမ်းပို့ခြင်း
+                        stream_to_state("vision_final_script", vision_prompt, media_file=img)
+                    except Exception as e:
+                        st.error(f"⚠️ Error: ပုံကို ဖတ်၍ မရပါ။ ({e})")
+
+        # 💡 ရလဒ်ပြသခြင်း နှင့် Action ခလုတ်များ
+        if st.session_state.vision_final_script:
+            st.success(f"✅ အောင်မြင်စွာ ဖန်တီးပြီးပါပြီ!")
+            st.markdown(st.session_state.vision_final_script)
+
+            c1, c2, c3 = st.columns(3)
+            with c1:
+                if st.button("📲 AI TTS သို့ ပို့ရန် (Tab 6)", key="send_vision_tts", use_container_width=True):
+                    st.session_state.tts_text_area = st.session_state.vision_final_script
+                    st.success("✅ Tab 6 သို့ ရောက်သွားပါပြီ!")
+            with c2:
+                if st.button("💾 မှတ်ဉာဏ်တိုက် သိမ်းမည်", key="save_vision_vault", use_container_width=True):
+                    save_to_vault("Vision Analysis Output", st.session_state.vision_final_script, "Vision Studio", source=selected_menu)
+                    st.success("✅ Tab 7 တွင် သိမ်းဆည်းပြီးပါပြီ!")
+            with c3:
+                st.download_button("📥 ဖိုင် ဒေါင်းလုဒ်ဆွဲရန်", st.session_state.vision_final_script, file_name="vision_output.txt", use_container_width=True)
+
+# --- NEW MENU 8: DIRECTOR'S DESK (FIXED CSV DOWNLOAD) ---
+elif selected_menu == "🎬 Director's Desk":
+    st.header("🎬 Director's Desk (Storyboard Generator)")
+    st.caption("ဇာတ်ညွှန်းကိုထည့်ပါ။ ဗီဒီယိုရိုက်ကူးတည်းဖြတ်ရန် လွယ်ကူစေမည့် ဇယားကွက် (Storyboard) အဖြစ် အလိုအလျောက် ခွဲထုတ်ပေးပါမည်။")
+    
+    dir_script = st.text_area("📝 မြန်မာ ဇာတ်ညွှန်းကို ဤနေရာတွင် Paste ချပါ:", height=200)
+    
+    if 'dir_board_res' not in st.session_state: 
+        st.session_state.dir_board_res = ""
+
+    if st.button("🎞️ ဇယားကွက်အဖြစ် ပြောင်းလဲရန်", type="primary") and api_key and dir_script:
+        with st.spinner("Director's Storyboard အဖြစ် ခွဲထုတ်နေပါသည်... ⏳"):
+            dir_prompt = f"""
+            Act as a Professional Film Director. Convert the following script into a highly detailed Storyboard Table for a video editor.
+            The response MUST be a STRICT Markdown Table with exactly 4 columns.
+            Do NOT use excessive hyphens (---). Keep the markdown clean and simple. Use exactly this table structure format:
+            
+            | Scene | မျက်နှာပြင် မြင်ကွင်း (Visual) | ပြောမည့်အသံ (Voiceover) | နောက်ခံအသံ (BGM / SFX) |
+            |---|---|---|---|
+            | 1 | [Describe visuals here] | [Voiceover text here] | [Music/SFX here] |
+            
+            CRITICAL RULES:
+            1. Write entirely in engaging BURMESE.
+            2. DO NOT generate lines longer than 200 characters.
+            
+            SCRIPT TO CONVERT:
+            {dir_script}
+            """
+        stream_to_state("dir_board_res", dir_prompt)
+            
+    if st.session_state.dir_board_res:
+        st.success("✅ Storyboard ဇယားကွက် အသင့်ဖြစ်ပါပြီ!")
+        
+        # ဖန်သားပြင်ပေါ်တွင် အလှပြရန်
+        st.markdown(st.session_state.dir_board_res)
+        
+        st.write("---")
+        st.write("📋 **Copy ကူးရန် (အောက်ပါ Code Box ညာဘက်အပေါ်ထောင့်မှ Copy Icon ကို နှိပ်ပါ)**")
+        st.code(st.session_state.dir_board_res, language="markdown")
+        
+        # 💡 CSV Format သို့ ပြောင်းလဲခြင်း (Excel တွင် ဖွင့်၍ရရန်)
+        import csv
+        
+        def get_csv_bytes(md_text):
+            lines = md_text.strip().split('\n')
+            csv_io = io.StringIO()
+            writer = csv.writer(csv_io)
+            
+            for line in lines:
+                line = line.strip()
+                # ဇယားကွက် ဖြစ်ကြောင်း စစ်ဆေးရန် ( | ဖြင့်စပြီး | ဖြင့်ဆုံးရမည်)
+                if line.startswith('|') and line.endswith('|'):
+                    if '---' in line: continue # ဇယားကွက် မျဉ်းကြောင်းများကို ချန်လှပ်မည်
+                    # | များကိုဖယ်ရှားပြီး Column များကို ခွဲထုတ်မည်
+                    row = [col.strip() for col in line.split('|')[1:-1]]
+                    writer.writerow(row)
+            
+            # Excel တွင် မြန်မာစာ မှန်ကန်စွာပေါ်ရန် UTF-8 BOM ထည့်ပေးရမည်
+            return '\ufeff'.encode('utf-8') + csv_io.getvalue().encode('utf-8')
+
+        csv_bytes = get_csv_bytes(st.session_state.dir_board_res)
+        
+        # CSV အဖြစ် Download ဆွဲရန် ခလုတ်
+        st.download_button(
+            label="📥 ဇယားကွက်ကို Excel တွင်ဖွင့်ရန် ဒေါင်းလုဒ်ဆွဲပါ (.csv)",
+            data=csv_bytes,
+            file_name=f"storyboard_{int(time.time())}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+
+# --- NEW MENU 9: EPIC SERIES MAKER & WEB HUNTER (WIKI + PDF/TEXT ONLY) ---
+elif selected_menu == "📚 Epic Series Maker":
+    st.header("📚 Epic Series Maker & Web Hunter")
+    st.caption("Wikipedia မှ အချက်အလက်များ သို့မဟုတ် သင်၏ စာသား/ဖိုင်များကို အမိုက်စား မြန်မာ ဇာတ်လမ်းတွဲများအဖြစ် အလိုအလျောက် ပြောင်းလဲပေးမည်။")
+
+    # 💡 Reddit ကိုဖြုတ်ပြီး Wiki နှင့် PDF/Text နှစိခုသာ ချန်ထားပါသည်
+    source_type = st.radio("🔍 ဇာတ်လမ်း အရင်းအမြစ်ကို ရွေးပါ:", [
+        "🔍 Wikipedia Auto-Hunter (သမိုင်း/သိပ္ပံ အကြောင်းအရာများရှာရန်)",
+        "📄 PDF, TXT ဖိုင် (သို့မဟုတ်) စာသား ကိုယ်တိုင်ထည့်မည်"
+    ])
+
+    raw_text = ""
+
+    if "Wikipedia" in source_type:
+        st.info("ရှာဖွေလိုသော အကြောင်းအရာကို ရိုက်ထည့်ပါ။ အင်္ဂလိပ် Wikipedia မှ အချက်အလက်များကို Auto ဆွဲယူပါမည်။")
+        wiki_query = st.text_input("ရှာဖွေလိုသော ခေါင်းစဉ် (English လို ရိုက်ပါ - ဥပမာ: Bermuda Triangle, Albert Einstein):")
+        
+        if st.button("🔍 Wikipedia မှ အချက်အလက် ဆွဲယူရန်") and wiki_query:
+            with st.spinner(f"Wikipedia တွင် '{wiki_query}' ကို ရှာဖွေနေပါသည်... ⏳"):
+                raw_text = fetch_wikipedia_summary(wiki_query)
+                if "Error" not in raw_text:
+                    st.success("✅ Wikipedia မှ အချက်အလက် ဆွဲယူရရှိပါပြီ! အောက်တွင် ဇာတ်လမ်းတွဲ ခွဲထုတ်နိုင်ပါပြီ။")
+                    st.session_state.temp_raw_text = raw_text
+                else: 
+                    st.error(raw_text)
+
+    elif "PDF" in source_type:
+        st.info("စာအုပ်၊ ဆောင်းပါး သို့မဟုတ် ဇာတ်လမ်းရှည်များကို တင်ပါ။ (PDF သို့မဟုတ် TXT ဖိုင်) သို့မဟုတ် အောက်တွင် စာသားကို တိုက်ရိုက် Paste ချပါ။")
+        
+        # 1. ဖိုင်တင်မည့်နေရာ (PDF နှင့် TXT ရသည်)
+        uploaded_file = st.file_uploader("📄 PDF သို့မဟုတ် TXT ဖိုင် တင်ရန်:", type=["pdf", "txt"])
+        # 💡 စာအုပ်ကြီးများအတွက် လိုသည့် စာမျက်နှာ အပိုင်းကိုသာ ရွေးဖတ်နိုင်သည်
+        pdf_range = None
+        if uploaded_file and uploaded_file.name.endswith(".pdf"):
+            try:
+                pdf_pages = pdf_page_count(uploaded_file)
+                if pdf_pages > 1: pdf_range = st.slider("📑 Pages", 1, pdf_pages, (1, pdf_pages), key="pdf_page_range")
+                st.caption(f"📄 {pdf_pages} pages • ပထမ {PDF_CHAR_BUDGET:,} စာလုံးရောက်သည်နှင့် ဆက်မဖတ်တော့ပါ")
+            except Exception as e:
+                st.caption(f"↳ PDF စာမျက်နှာ အရေအတွက် ဖတ်မရပါ: {e}")
+        
+        st.write("**— (သို့မဟုတ်) —**")
+        
+        # 2. စာသားကိုယ်တိုင် ထည့်မည့်နေရာ
+        manual_text = st.text_area("📝 စာသားများကို ဤနေရာတွင် တိုက်ရိုက် Paste ချပါ:", height=200, placeholder="အင်္ဂလိပ် သို့မဟုတ် မြန်မာ စာပိုဒ် အရှည်ကြီးများကို ဤနေရာတွင် ကူးထည့်ပါ...")
+        
+        if st.button("📂 ဇာတ်လမ်းတွဲ ဖန်တီးရန် အချက်အလက်ယူမည်", type="primary"):
+            with st.spinner("အချက်အလက်များကို ဖတ်ရှုနေပါသည်... ⏳"):
+                if uploaded_file:
+                    if uploaded_file.name.endswith(".pdf"):
+                        raw_text = extract_text_from_pdf(uploaded_file, pdf_range)
+                    elif uploaded_file.name.endswith(".txt"):
+                        raw_text = uploaded_file.getvalue().decode("utf-8")
+                elif manual_text.strip():
+                    raw_text = manual_text
+                
+                if raw_text and "Error" not in raw_text:
+                    st.success("✅ အချက်အလက် ဖတ်ရှုခြင်း အောင်မြင်ပါသည်! အောက်တွင် ဇာတ်လမ်းတွဲ ခွဲထုတ်နိုင်ပါပြီ။")
+                    st.session_state.temp_raw_text = raw_text
+                else: 
+                    st.error(raw_text if raw_text else "⚠️ ကျေးဇူးပြု၍ ဖိုင်တစ်ခုခု တင်ပါ၊ သို့မဟုတ် စာသားထည့်ပါ။")
+
+    # 💡 ဇာတ်လမ်းတွဲ ခွဲထုတ်မည့် အပိုင်း
+    if st.session_state.get("temp_raw_text"):
+        st.write("---")
+        st.subheader("🎬 ဇာတ်လမ်းတွဲ (Series) ဖန်တီးရန်")
+        parts = st.slider("အပိုင်း (Episodes) ဘယ်နှစ်ပိုင်း ခွဲထုတ်ချင်ပါသလဲ?", 2, 15, 3)
+        
+        # 💡 ရွေးချယ်စရာ Tone (၁၁) မျိုး အပြည့်အစုံ
+        series_tone = st.selectbox("🎭 ဇာတ်လမ်းတွဲ အမျိုးအစား (Tone) ကို ရွေးပါ:", [
+            "👻 သဲထိတ်ရင်ဖို နှင့် လျှို့ဝှက်ဆန်းကြယ် (Mystery / Horror)",
+            "🔪 မှုခင်း နှင့် စုံထောက် (True Crime / Detective)",
+            "👽 သိပ္ပံလွန် နှင့် အာကာသ (Sci-Fi / Space)",
+            "💖 နှလုံးသားခွန်အားပေး ရသ (Soulful / Inspirational)",
+            "⚔️ သမိုင်းဝင် ဒဏ္ဍာရီ (Epic Historical / Myth)",
+            "🎬 ရုပ်ရှင်အနှစ်ချုပ် စတိုင် (Cinematic Recap)",
+            "🎓 ဗဟုသုတ နှင့် မှတ်တမ်းတင်ပုံစံ (Educational / Documentary)",
+            "😂 ဟာသ နှင့် သရော်စာ (Comedy / Satire)",
+            "🥀 အမှောင်ရသ နှင့် စိတ်ပညာ (Dark Fantasy / Psychological Thriller)",
+            "🧚 ဖန်တီးယဉ်ကျေးမှု နတ်သမီးပုံပြင် (Fantasy / Fairy Tale)",
+            "💔 အချစ် နှင့် ရိုမန်တစ် (Romance / Melodrama)"
+        ])
+        
+        if 'series_final_script' not in st.session_state: st.session_state.series_final_script = ""
+
+        # 💡 Outline Mode: Series Bible + Beat Sheet ကို အရင်ရေးပြီး Episode များကို အပြိုင် ရေးသည် (Output Token ကန့်သတ်ချက်ကြောင့် မပြတ်တော့ပါ)
+        series_outline_mode = st.toggle("🧭 Outline first, then write episodes in parallel", value=True, key="series_outline_mode",
+                                        help="ပိတ်ထားပါက Episode အားလုံးကို Call တစ်ခုတည်းဖြင့် ရေးပါမည်။")
+        series_auto_vault = st.checkbox("💾 ပြီးလျှင် မှတ်ဉာဏ်တိုက်ထဲ အလိုအလျောက် သိမ်းမည်", value=False, key="series_auto_vault")
+        series_job = pending_job_for("series_final_script")
+        if st.button("🚀 အမိုက်စား မြန်မာဇာတ်လမ်းတွဲ ခွဲထုတ်ရန်", type="primary", disabled=bool(series_job)) and api_key:
+            vault = {"title": "Epic Series Output", "type": "Series Maker", "source": selected_menu} if series_auto_vault else None
+            if series_outline_mode:
+                series_source = st.session_state.temp_raw_text[:SERIES_SOURCE_CHARS]
+                series_fn = lambda on_progress: run_series_job(series_source, parts, series_tone, on_progress)
+            else:
+                series_prompt = f"""
+                Act as a Master Visual Storyteller and Series Writer.
+                I will provide you with a long source text. 
+                TASK: Adapt this story/information into an engaging BURMESE voiceover script series, strictly divided into EXACTLY {parts} Episodes (အပိုင်း {parts} ပိုင်း).
+            
+                TONE: {series_tone}
+            
+                RULES FOR EACH EPISODE:
+                1. Start with an Epic HOOK.
+                2. Write strictly for the EAR (Conversational Burmese: တယ်, မယ်, တဲ့). AVOID formal book language (သည်, ၏).
+                3. End EVERY episode (except the final one) with a MASSIVE CLIFFHANGER (e.g., "အပိုင်း ၂ မှာ ဆက်ကြည့်ကြရအောင်...").
+                4. Do NOT output a wall of text. Use spacing and ellipses (...) for pacing.
+                5. DO NOT use Markdown tables or excessive hyphens (---).
+            
+                FORMAT EXPECTED:
+                🎬 အပိုင်း (၁) 
+                [Script Body]
+                ...
+                🎬 အပိုင်း (၂)
+                [Script Body]
+                ...
+            
+                SOURCE TEXT TO ADAPT:
+                {st.session_state.temp_raw_text[:SERIES_SOURCE_CHARS]}
+                """
+                series_fn = lambda on_progress: {"text": generate_content_safe(series_prompt), "state": {"series_plan": None, "series_episodes": []}}
+            # 💡 Background Job အဖြစ် တင်ပြီး ချက်ချင်း ပြန်လာမည် (Sidebar ➜ My Jobs)
+            enqueue_job(selected_menu, f"Series • {parts} episodes • {series_tone}", series_fn, "series_final_script", vault=vault)
+
+        # 💡 ရေးနေစဉ် ပြီးသမျှ Episode များကို ဤနေရာတွင် တိုက်ရိုက် ပြမည်
+        if series_job: st.fragment(render_series_progress, run_every=JOB_POLL_SECONDS)(series_job["id"])
+
+        # 💡 Session State ထဲ သိမ်းထားသဖြင့် ခလုတ်နှိပ်လည်း ရလဒ် ပျောက်မသွားပါ
+        if st.session_state.series_final_script and not series_job:
+            series_plan, series_episodes = st.session_state.get("series_plan"), st.session_state.get("series_episodes")
+            series_status = st.empty()  # Episode ပြန်ရေးပြီးမှ ဖြည့်မည်
+            if series_plan and series_episodes:
+                with st.expander("🧭 Series Bible & Episode Plan"):
+                    st.markdown(series_plan["bible"])
+                    for i, ep in enumerate(series_plan["episodes"]): st.caption(f"{i + 1}. **{ep['title']}** — {'; '.join(ep['beats'])}")
+                # 💡 Episode တစ်ခုချင်းကို Plan အတိုင်း သီးခြား ပြန်ရေးနိုင်သည် (Cache မသုံးဘဲ အသစ်ရေးမည်)
+                for i, ep in enumerate(series_plan["episodes"]):
+                    episode_box = st.container(border=True)
+                    regen = episode_box.button("🔁 ဤအပိုင်းကို ပြန်ရေးမည်", key=f"series_regen_{i}", disabled=not api_key)
+                    episode_view = episode_box.empty()
+                    if regen:
+                        new_text = episode_view.write_stream(generate_content_stream(build_episode_prompt(series_plan, i), use_cache=False))
+                        if not isinstance(new_text, str): new_text = "".join(str(t) for t in new_text)
+                        if not new_text.startswith("⚠️ Error"):
+                            series_episodes[i] = new_text
+                            st.session_state.series_final_script = assemble_series(series_plan, series_episodes, [j for j, text in enumerate(series_episodes) if text is None])
+                    episode_view.markdown(format_series_episode(i, ep["title"], series_episodes[i] or ""))
+            else:
+                st.markdown(st.session_state.series_final_script)
+            missing = [str(i + 1) for i, text in enumerate(series_episodes or []) if text is None]
+            if missing: series_status.warning(f"⚠️ Episode {', '.join(missing)} ရေး၍ မရပါ။ 🔁 ခလုတ်ဖြင့် ပြန်ရေးပါ။")
+            else: series_status.success("✅ ဇာတ်လမ်းတွဲ အောင်မြင်စွာ ခွဲထုတ်ပြီးပါပြီ!")
+            
+            c1, c2 = st.columns(2)
+            with c1:
+                if st.button("📲 AI TTS သို့ ပို့ရန် (Tab 6)", key="send_series_tts", use_container_width=True):
+                    st.session_state.tts_text_area = st.session_state.series_final_script
+                    st.success("✅ Tab 6 သို့ ရောက်သွားပါပြီ!")
+            with c2:
+                if st.button("💾 မှတ်ဉာဏ်တိုက် သိမ်းမည်", key="save_series_vault", use_container_width=True):
+                    save_to_vault("Epic Series Output", st.session_state.series_final_script, "Series Maker", source=selected_menu)
+                    st.success("✅ Tab 7 တွင် သိမ်းဆည်းပြီးပါပြီ!")
+# --- NEW MENU 10: GLOBAL MAGAZINE STUDIO ---
+elif selected_menu == "📖 Magazine Studio":
+    st.header("📖 Global Magazine Studio")
+    st.caption("ကမ္ဘာကျော် မဂ္ဂဇင်းကြီးများနှင့် ဟောပြောပွဲများ၏ ဟန်အတိုင်း ဆွဲဆောင်မှုရှိသော မြန်မာ Content များ အလိုအလျောက် ဖန်တီးပေးမည်။")
+
+    col_m1, col_m2 = st.columns([1, 1])
+    
+    with col_m1:
+        magazine_style = st.selectbox("📚 ဖန်တီးလိုသော စတိုင် (Style) ကို ရွေးပါ:", [
+            "📖 Reader's Digest (မိသားစု၊ ဘဝခွန်အား နှင့် ဗဟုသုတ)",
+            "🌍 National Geographic (သမိုင်း၊ သဘာဝတရား နှင့် စူးစမ်းလေ့လာမှု)",
+            "💡 TED Talks (အတွေးအခေါ်သစ်၊ စိတ်ပညာ နှင့် ဟောပြောပွဲ)",
+            "🍲 Chicken Soup for the Soul (နှလုံးသားကို ထိရှစေသော ရသများ)"
+        ])
+    
+    with col_m2:
+        if "Reader's Digest" in magazine_style:
+            content_type = st.radio("📑 ကဏ္ဍ ရွေးပါ:", [
+                "💖 Inspiring True Stories (ဘဝခွန်အားပေး တကယ့်ဖြစ်ရပ်မှန်များ)",
+                "🎓 Articles (အသုံးဝင် ဗဟုသုတ ဆောင်းပါးများ)",
+                "📖 Condensed Books (ဝတ္ထုရှည် အနှစ်ချုပ်များ)",
+                "😂 Humor & Jokes (ဟာသ နှင့် ရယ်စရာများ)"
+            ])
+        elif "National Geographic" in magazine_style:
+            content_type = st.radio("📑 ကဏ္ဍ ရွေးပါ:", [
+                "🏛️ Unsolved Ancient Mysteries (ဖြေရှင်းမရသေးသော ရှေးဟောင်းလျှို့ဝှက်ချက်များ)",
+                "🦁 Extreme Wildlife Survival (တိရစ္ဆာန်တို့၏ ကြမ်းတမ်းသော ရှင်သန်မှု)",
+                "🌊 Deep Ocean / Space (နက်ရှိုင်းသော သမုဒ္ဒရာ သို့မဟုတ် အာကာသ အကြောင်း)"
+            ])
+        elif "TED Talks" in magazine_style:
+            content_type = st.radio("📑 ကဏ္ဍ ရွေးပါ:", [
+                "🧠 Psychological Deep Dive (စိတ်ပညာ ခွဲခြမ်းစိတ်ဖြာချက်)",
+                "🚀 Future & Humanity (အနာဂတ်နည်းပညာ နှင့် လူသားမျိုးနွယ်)",
+                "🎤 Motivational Speech (စိတ်ခွန်အားပေး ဟောပြောချက် ဇာတ်ညွှန်း)"
+            ])
+        elif "Chicken Soup" in magazine_style:
+            content_type = st.radio("📑 ကဏ္ဍ ရွေးပါ:", [
+                "👨‍👩‍👧 Tear-jerking Family Stories (မျက်ရည်ကျစေမည့် မိသားစု မေတ္တာဖွဲ့)",
+                "🤝 Kindness of Strangers (သူစိမ်းများထံမှ ရရှိသော ကြင်နာမှုများ)",
+                "💪 Overcoming Grief (အဆိုးဝါးဆုံး အခြေအနေမှ ပြန်လည်ထူမတ်လာခြင်း)"
+            ])
+
+    st.write("---")
+    mag_topic = st.text_area("📝 အကြောင်းအရာ (Topic) ရိုက်ထည့်ပါ:", placeholder="ဥပမာ - မုန်တိုင်းထဲ ပိတ်မိသွားတဲ့ သင်္ဘောသားအကြောင်း၊ စိတ်ကျရောဂါကို ကျော်လွှားခဲ့သူအကြောင်း (သို့မဟုတ် အလွတ်ထားလျှင် AI မှ Auto စဉ်းစားပေးပါမည်)...")
+
+    if 'mag_final_script' not in st.session_state: st.session_state.mag_final_script = ""
+
+    if st.button("✨ အမိုက်စား Content ဖန်တီးရန်", type="primary", use_container_width=True) and api_key:
+        topic_instruction = f"about '{mag_topic}'" if mag_topic.strip() else "by coming up with a brilliant, highly engaging original topic on your own"
+        
+        mag_prompt = f"""
+        Act as an elite Master Copywriter and Editor for a globally renowned publication.
+        Your task is to write a highly captivating piece {topic_instruction}.
+        
+        PUBLICATION STYLE: {magazine_style}
+        SPECIFIC CATEGORY: {content_type}
+        
+        CRITICAL RULES:
+        1. Write the ENTIRE output in natural, highly engaging BURMESE language.
+        2. Match the exact emotional tone of the chosen publication (e.g., Reader's Digest = warm and concise; NatGeo = epic and descriptive; TED = thought-provoking and conversational; Chicken Soup = deeply emotional and touching).
+        3. Write for the EAR if it is a story or speech (use conversational Burmese: တယ်, မယ်, တဲ့).
+        4. Start with a massive, attention-grabbing HOOK.
+        5. Structure with clear paragraphs and use dramatic ellipses (...) where necessary.
+        """
+        
+        stream_to_state("mag_final_script", mag_prompt)
+
+    if st.session_state.mag_final_script:
+        st.success("✅ အောင်မြင်စွာ ဖန်တီးပြီးပါပြီ!")
+        st.markdown(st.session_state.mag_final_script)
+        
+        c1, c2 = st.columns(2)
+        with c1:
+            if st.button("📲 AI TTS သို့ ပို့ရန် (Tab 6)", key="send_mag_tts", use_container_width=True):
+                st.session_state.tts_text_area = st.session_state.mag_final_script
+                st.success("✅ Tab 6 သို့ ရောက်သွားပါပြီ!")
+        with c2:
+            if st.button("💾 မှတ်ဉာဏ်တိုက် သိမ်းမည်", key="save_mag_vault", use_container_width=True):
+                save_to_vault(f"Magazine: {content_type}", st.session_state.mag_final_script, "Magazine Studio", source=selected_menu)
+                st.success("✅ Tab 7 တွင် သိမ်းဆည်းပြီးပါပြီ!")
+                    
+# --- MENU 10, 11, 12 ---
+elif selected_menu == "📚 မှတ်ဉာဏ်တိုက်":
+    st.header("📚 Memory Vault")
+    if not count_vault(): st.info("မှတ်ဉာဏ်တိုက်ထဲတွင် ဘာမှ မရှိသေးပါ။")
+    else:
+        col_q, col_types = st.columns([2, 1])
+        # 💡 ရှာဖွေမှု ပြောင်းလဲပါက စာမျက်နှာ ၁ သို့ ပြန်သွားမည်
+        if 'vault_page' not in st.session_state: st.session_state.vault_page = 1
+        reset_vault_page = lambda: st.session_state.update(vault_page=1)
+        with col_q: vault_query = st.text_input("🔎 ရှာဖွေရန် (ခေါင်းစဉ် / အကြောင်းအရာ / အမျိုးအစား):", placeholder="ဥပမာ - ဒဏ္ဍာရီ, recap...", on_change=reset_vault_page)
+        with col_types: vault_type_filter = st.multiselect("🏷️ အမျိုးအစား", vault_types(), on_change=reset_vault_page)
+
+        # 💡 တစ်မျက်နှာစာသာ Database မှ ဖတ်ယူသည်
+        if vault_query.strip():
+            page_items, total_items = search_vault(vault_query, vault_type_filter, page=st.session_state.vault_page - 1)
+        else:
+            total_items = count_vault(vault_type_filter)
+            page_items = load_vault(page=st.session_state.vault_page - 1, type_tag=vault_type_filter)
+        total_pages = max(1, (total_items + VAULT_PAGE_SIZE - 1) // VAULT_PAGE_SIZE)
+        if st.session_state.vault_page > total_pages:
+            st.session_state.vault_page = 1
+            st.rerun()
+
+        if vault_query.strip() and not page_items: st.info("ရှာဖွေမှုနှင့် ကိုက်ညီသော ရလဒ် မတွေ့ပါ။")
+        for item in page_items:
+            with st.expander(f"📖 {item['title']} ({item['type']})"): st.write(item['content'])
+
+        nav_prev, nav_info, nav_next = st.columns([1, 2, 1])
+        with nav_info: st.caption(f"တွေ့ရှိမှု: {total_items} ခု • စာမျက်နှာ {st.session_state.vault_page} / {total_pages}")
+        with nav_prev:
+            if st.button("⬅️ ရှေ့သို့", disabled=st.session_state.vault_page <= 1, use_container_width=True):
+                st.session_state.vault_page -= 1
+                st.rerun()
+        with nav_next:
+            if st.button("နောက်သို့ ➡️", disabled=st.session_state.vault_page >= total_pages, use_container_width=True):
+                st.session_state.vault_page += 1
+                st.rerun()
+
+    with st.expander("🗜️ Vault Compaction"):
+        st.caption("တူညီသော အကြောင်းအရာများကို တစ်ခုတည်းအဖြစ် ပေါင်း၍ ချုံ့သိမ်းပြီး ဖိုင်အရွယ်အစားကို လျှော့ချမည်။")
+        if st.button("🗜️ Vault ကို Compact လုပ်မည်", use_container_width=True):
+            with st.spinner("Compact လုပ်နေပါသည်... ⏳"):
+                report = compact_vault()
+            mb = lambda n: f"{n / (1024 * 1024):.2f} MB"
+            st.success(f"✅ {mb(report['before'])} → {mb(report['after'])} (သက်သာမှု {mb(report['saved'])})")
+            st.caption(f"Entries: {report['entries']} • Unique blobs: {report['unique_blobs']} • "
+                       f"Content: {mb(report['raw_bytes'])} → {mb(report['stored_bytes'])} • Orphans removed: {report['orphans_removed']}")
+
+elif selected_menu == "🕵️‍♂️ Lore Hunter":
+    st.header("🕵️‍♂️ Lore Hunter")
+    st.write("ကမ္ဘာတစ်ဝှမ်းမှ ထူးဆန်းသော အကြောင်းအရာများကို AI ထံမှ တောင်းယူပါ။")
+    if st.button("🔍 ရှားပါး အိုင်ဒီယာ ၃ ခု ရှာဖွေရန်", type="primary") and api_key:
+        st.write_stream(generate_content_stream("Find 3 highly obscure, creepy historical facts. Output in engaging BURMESE language."))
+
+elif selected_menu == "🎨 Visual Director":
+    st.header("🚀 Social Media SEO & Captions Studio")
+    seo_text = st.text_area("ဗီဒီယို အကြောင်းအရာကို ထည့်ပါ:")
+    if st.button("🔥 Generate SEO Pack", type="primary") and api_key and seo_text:
+        st.write_stream(generate_content_stream(f"Create a highly engaging Burmese Caption, Title, and 5 hashtags for TikTok/FB based on: {seo_text}"))
+
+
+
+
+